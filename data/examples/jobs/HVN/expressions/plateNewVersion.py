@@ -1,6 +1,5 @@
-import os
-import re
 from centipede.TemplateProcedure import TemplateProcedure
+from centipede.VersionIndex import VersionIndex
 
 def plateNewVersionTemplateProcedure(prefix, job, seq, shot, plateName):
     """
@@ -14,16 +13,7 @@ def plateNewVersionTemplateProcedure(prefix, job, seq, shot, plateName):
         plateName=plateName
     )
 
-    version = 0
-    versionRegEx = "^v[0-9]{3}$"
-
-    # finding the latest version
-    if os.path.exists(plateLocation):
-        for directory in os.listdir(plateLocation):
-            if re.match(versionRegEx, directory):
-                version = max(int(directory[1:]), version)
-
-    return 'v' + str(version + 1).zfill(3)
+    return VersionIndex.versionName(VersionIndex.get().new(plateLocation))
 
 
 # registering procedure
@@ -187,11 +187,12 @@ class CentipedeApp(QtWidgets.QApplication):
         crawlerList = []
         for pathItem in path.split(';'):
             crawler = centipede.Crawler.Fs.FsPath.createFromPath(pathItem)
-            crawlerList += crawler.glob(filterTypes)
 
-        # in centipede interface we don't care about directory crawlers
-        # TODO: we need to have a better way to get rid of directory crawlers
-        crawlerList = list(filter(lambda x: not isinstance(x, centipede.Crawler.Fs.Directory), crawlerList))
+            # in centipede interface we don't care about directory crawlers
+            # TODO: we need to have a better way to get rid of directory crawlers
+            for childCrawler in crawler.iterGlob(filterTypes):
+                if not isinstance(childCrawler, centipede.Crawler.Fs.Directory):
+                    crawlerList.append(childCrawler)
 
         # sorting result by name
         crawlerList.sort(key=lambda x: x.var('name').lower())
@@ -204,7 +205,7 @@ class CentipedeApp(QtWidgets.QApplication):
             groupedCrawlers = OrderedDict()
             groupedCrawlers[None] = []
             for crawler in crawlerList:
-                if 'group' in crawler.tagNames():
+                if crawler.hasTag('group'):
                     groupName = crawler.tag('group')
                     if groupName not in groupedCrawlers:
                         groupedCrawlers[groupName] = []
@@ -313,10 +314,12 @@ class CentipedeApp(QtWidgets.QApplication):
 
         self.__targetTree.clear()
 
+        # the crawlers are indexed once for all task holders
+        crawlerIndex = centipede.CrawlerIndex(visibleCrawlers)
         for taskHolder in self.__taskHolders:
 
             try:
-                matchedCrawlers = taskHolder.query(visibleCrawlers)
+                matchedCrawlers = taskHolder.query(crawlerIndex)
             except Exception as error:
                 QtWidgets.QMessageBox.critical(
                     self.__main,
@@ -331,7 +334,7 @@ class CentipedeApp(QtWidgets.QApplication):
             for matchedCrawler in matchedCrawlers.keys():
 
                 # group
-                if self.__checkedViewMode == "Group" and 'group' in matchedCrawler.tagNames():
+                if self.__checkedViewMode == "Group" and matchedCrawler.hasTag('group'):
                     groupName = matchedCrawler.tag('group')
                     if groupName not in groupedCrawlers:
                         groupedCrawlers[groupName] = []
@@ -648,7 +651,7 @@ class CentipedeApp(QtWidgets.QApplication):
                 value = self.__sourceOverrides[crawler.var('filePath')][column]
                 hasOverride = True
 
-            if column in crawler.varNames():
+            if crawler.hasVar(column):
                 if not hasOverride:
                     value = crawler.var(column)
 
@@ -770,6 +773,7 @@ class CentipedeApp(QtWidgets.QApplication):
 
         try:
             for crawlersGroup in Crawler.group(visibleCrawlers):
+                crawlerIndex = centipede.CrawlerIndex(crawlersGroup)
                 for taskHolder in self.__taskHolders:
 
                     # run on the farm
@@ -781,14 +785,14 @@ class CentipedeApp(QtWidgets.QApplication):
                         label += os.path.splitext(taskHolder.var('configName'))[0]
                         label += date
                         label += ": "
-                        label += crawlersGroup[0].tag('group') if 'group' in crawlersGroup[0].tagNames() else crawlersGroup[0].var('baseName')
+                        label += crawlersGroup[0].tag('group') if crawlersGroup[0].hasTag('group') else crawlersGroup[0].varOr('baseName', '')
                         renderFarmDispatcher.setOption('label', label)
-                        renderFarmDispatcher.dispatch(taskHolder, crawlersGroup)
+                        renderFarmDispatcher.dispatch(taskHolder, crawlerIndex)
 
                     # run locally
                     else:
                         localDispatcher = Dispatcher.create('local')
-                        localDispatcher.dispatch(taskHolder, crawlersGroup)
+                        localDispatcher.dispatch(taskHolder, crawlerIndex)
 
         except Exception as err:
             QtWidgets.QMessageBox.critical(
@@ -860,7 +864,7 @@ class CentipedeApp(QtWidgets.QApplication):
                 crawler = [crawler]
 
             hintValue = ""
-            if columnName in crawler[0].varNames():
+            if crawler[0].hasVar(columnName):
                 hintValue = crawler[0].var(columnName)
 
             if value is None:
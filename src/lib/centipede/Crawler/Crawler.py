@@ -1,6 +1,10 @@
 import os
+import copy
 import json
 from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+from ..PathHolder import PathHolder
+from ..Tracer import Tracer
 
 # compatibility with python 2/3
 try:
@@ -8,6 +12,16 @@ try:
 except NameError:
     basestring = str
 
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+try:
+    from sys import intern
+except ImportError:
+    pass
+
 class InvalidVarError(Exception):
     """Invalid Var Error."""
 
@@ -20,30 +34,193 @@ class TestCrawlerError(Exception):
 class CreateCrawlerError(Exception):
     """Create crawler error."""
 
+class _VarSchema(object):
+    """
+    Layout describing the variable names held by var scopes.
+
+    The schemas are shared between all the scopes that receive the same variable
+    names in the same order (for instance: filePath, ext, baseName, frame, padding...).
+    Therefore, a scope only needs to store the values, the names and their
+    indexes are stored once by the schema.
+    """
+
+    __slots__ = ('__names', '__indexes', '__transitions')
+
+    def __init__(self, names=(), indexes=None):
+        """
+        Create a var schema.
+        """
+        self.__names = names
+        self.__indexes = indexes if indexes is not None else {}
+        self.__transitions = {}
+
+    def names(self):
+        """
+        Return a tuple containing the variable names in the order they have been added.
+        """
+        return self.__names
+
+    def index(self, name):
+        """
+        Return the index for the variable name (or None when not found).
+        """
+        return self.__indexes.get(name)
+
+    def extend(self, name):
+        """
+        Return the schema that contains the current variable names plus the input name.
+        """
+        schema = self.__transitions.get(name)
+        if schema is None:
+            name = intern(name)
+            indexes = dict(self.__indexes)
+            indexes[name] = len(self.__names)
+            schema = self.__transitions.setdefault(
+                name,
+                _VarSchema(self.__names + (name,), indexes)
+            )
+
+        return schema
+
+class _VarScope(object):
+    """
+    Chained scope used to hold the variables of a crawler.
+
+    A scope reads through to its parent scope for the variables that are not
+    defined by itself. Scopes shared with child crawlers are frozen, a crawler
+    that needs to modify a frozen scope creates a new scope on top of it
+    (copy-on-write) so the children are never affected.
+    """
+
+    __slots__ = (
+        '__parentScope',
+        '__schema',
+        '__values',
+        '__contextVarNames',
+        '__frozen'
+    )
+
+    __emptySchema = _VarSchema()
+
+    def __init__(self, parentScope=None):
+        """
+        Create a var scope.
+        """
+        self.__parentScope = parentScope
+        self.__schema = self.__emptySchema
+        self.__values = []
+        self.__contextVarNames = None
+        self.__frozen = False
+
+    def parentScope(self):
+        """
+        Return the parent scope (or None).
+        """
+        return self.__parentScope
+
+    def isFrozen(self):
+        """
+        Return a boolean telling if the scope has been shared (read-only).
+        """
+        return self.__frozen
+
+    def freeze(self):
+        """
+        Mark the scope as read-only.
+        """
+        self.__frozen = True
+
+    def find(self, name):
+        """
+        Return the scope (itself or one of the parent scopes) that defines the variable or None when not found.
+        """
+        scope = self
+        while scope is not None:
+            if scope.__schema.index(name) is not None:
+                return scope
+            scope = scope.__parentScope
+
+        return None
+
+    def value(self, name):
+        """
+        Return the value of a variable defined by the scope itself.
+        """
+        return self.__values[self.__schema.index(name)]
+
+    def isContextVar(self, name):
+        """
+        Return a boolean telling if a variable defined by the scope itself is a context variable.
+        """
+        return self.__contextVarNames is not None and name in self.__contextVarNames
+
+    def set(self, name, value, isContextVar):
+        """
+        Set a variable in the scope.
+        """
+        assert not self.__frozen, "Can't modify a frozen scope!"
+
+        index = self.__schema.index(name)
+        if index is None:
+            self.__schema = self.__schema.extend(name)
+            self.__values.append(value)
+        else:
+            self.__values[index] = value
+
+        if isContextVar:
+            if self.__contextVarNames is None:
+                self.__contextVarNames = set()
+            self.__contextVarNames.add(name)
+        elif self.__contextVarNames is not None:
+            self.__contextVarNames.discard(name)
+
+    def flatten(self):
+        """
+        Return an ordered dict containing (value, isContextVar) for all variables visible in the scope.
+        """
+        scopes = []
+        scope = self
+        while scope is not None:
+            scopes.append(scope)
+            scope = scope.__parentScope
+
+        result = OrderedDict()
+        for scope in reversed(scopes):
+            for name, value in zip(scope.__schema.names(), scope.__values):
+                result[name] = (value, scope.isContextVar(name))
+
+        return result
 
 class Crawler(object):
     """
     Abstracted Crawler.
     """
 
+    __slots__ = (
+        '__varScope',
+        '__tags',
+        '__globCache'
+    )
+
     __registeredTypes = OrderedDict()
+    __dispatchIndex = {}
+    __subTypesIndex = {}
+    __registrationVersion = 0
 
     def __init__(self, name, parentCrawler=None):
         """
         Create a crawler.
         """
-        self.__vars = {}
-        self.__tags = {}
-        self.__contextVarNames = set()
+        # the tags are created on demand
+        self.__tags = None
 
-        # passing variables
+        # passing variables, the parent scope is shared with the child
+        # crawler rather than copying the variables
         if parentCrawler:
             assert isinstance(parentCrawler, Crawler), \
                 "Invalid crawler type!"
 
-            for varName in parentCrawler.varNames():
-                isContextVar = (varName in parentCrawler.contextVarNames())
-                self.setVar(varName, parentCrawler.var(varName), isContextVar)
+            self.__varScope = _VarScope(parentCrawler.__sharedVarScope())
 
             self.setVar(
                 'fullPath',
@@ -53,6 +230,7 @@ class Crawler(object):
                 )
             )
         else:
+            self.__varScope = _VarScope()
             self.setVar('fullPath', '/')
 
         self.setVar('name', name)
@@ -77,57 +255,104 @@ class Crawler(object):
 
         return result
 
+    def _restoreData(self):
+        """
+        For re-implementation: Initialize the data of a crawler restored through createFromCacheData or clone.
+
+        The constructor is not called for restored (or cloned) crawlers, therefore
+        any data that is not stored as variable or tag needs to be initialized here
+        (otherwise a clone would share it with the original crawler).
+        """
+        pass
+
     def varNames(self):
         """
         Return a list of variable names assigned to the crawler.
         """
-        return list(self.__vars.keys())
+        return list(self.__varScope.flatten().keys())
 
     def contextVarNames(self):
         """
         Return a list of variable names that are defined as context variables.
         """
-        return list(self.__contextVarNames)
+        return [name for name, data in self.__varScope.flatten().items() if data[1]]
+
+    def hasVar(self, name):
+        """
+        Return a boolean telling if the variable is assigned to the crawler.
+        """
+        return self.__varScope.find(name) is not None
+
+    def varOr(self, name, default=None):
+        """
+        Return the value for a variable or the default value when the variable is not assigned to the crawler.
+        """
+        scope = self.__varScope.find(name)
+        if scope is None:
+            return default
+
+        return scope.value(name)
 
     def setVar(self, name, value, isContextVar=False):
         """
         Set a value for a variable.
         """
-        if isContextVar:
-            self.__contextVarNames.add(name)
-        elif name in self.__contextVarNames:
-            self.__contextVarNames.remove(name)
+        # copy-on-write: the current scope is shared with child crawlers
+        if self.__varScope.isFrozen():
+            self.__varScope = _VarScope(self.__varScope)
 
-        self.__vars[name] = value
+        self.__varScope.set(name, value, isContextVar)
 
     def var(self, name):
         """
         Return the value for a variable.
         """
-        if name not in self.__vars:
+        scope = self.__varScope.find(name)
+        if scope is None:
             raise InvalidVarError(
                 'Variable not found "{0}"'.format(name)
             )
 
-        return self.__vars[name]
+        return scope.value(name)
 
     def tagNames(self):
         """
         Return a list of tag names assigned to the crawler.
         """
+        if self.__tags is None:
+            return []
+
         return self.__tags.keys()
 
+    def hasTag(self, name):
+        """
+        Return a boolean telling if the tag is assigned to the crawler.
+        """
+        return self.__tags is not None and name in self.__tags
+
+    def tagOr(self, name, default=None):
+        """
+        Return the value for a tag or the default value when the tag is not assigned to the crawler.
+        """
+        if self.__tags is None:
+            return default
+
+        return self.__tags.get(name, default)
+
     def setTag(self, name, value):
         """
         Set a value for a tag.
         """
+        if self.__tags is None:
+            self.__tags = {}
+
         self.__tags[name] = value
 
     def tag(self, name):
         """
         Return the value for a tagiable.
         """
-        if name not in self.__tags:
+        if self.__tags is None or name not in self.__tags:
             raise InvalidTagError(
                 'Tag not found "{0}"'.format(name)
             )
@@ -137,8 +362,28 @@ class Crawler(object):
     def clone(self):
         """
         Return a cloned instance about the current crawler.
+
+        The clone is done in memory: the variables are shared through the var
+        scope of the current crawler (copy-on-write), except for the mutable
+        values (lists and dicts) that are copied so the clone can be modified
+        safely without affecting the current crawler (and vice-versa). The data
+        held by the crawler types (for instance caches) is initialized again
+        for the clone (@see _restoreData).
         """
-        return Crawler.createFromJson(self.toJson())
+        result = copy.copy(self)
+        result.__varScope = _VarScope(self.__sharedVarScope())
+        result.__globCache = None
+
+        for varName, (varValue, isContextVar) in result.__varScope.flatten().items():
+            if isinstance(varValue, (list, dict)):
+                result.__varScope.set(varName, copy.deepcopy(varValue), isContextVar)
+
+        if self.__tags is not None:
+            result.__tags = copy.deepcopy(self.__tags)
+
+        result._restoreData()
+
+        return result
 
     def toJson(self):
         """
@@ -165,26 +410,75 @@ class Crawler(object):
             separators=(',', ': ')
         )
 
-    def glob(self, filterTypes=[], useCache=True):
+    def toCacheData(self, parentCrawler=None):
+        """
+        Return a json compatible dict used to cache the crawler (it can be restored later using createFromCacheData).
+
+        Only the variables that are not inherited from the parent crawler are included.
+        """
+        parentVars = {}
+        if parentCrawler is not None:
+            parentVars = parentCrawler.__varScope.flatten()
+
+        result = {
+            'type': self.var('type'),
+            'vars': [],
+            'contextVarNames': [],
+            'tags': dict(self.__tags or {})
+        }
+
+        for varName, varData in self.__varScope.flatten().items():
+            if parentVars.get(varName) == varData:
+                continue
+
+            result['vars'].append([varName, varData[0]])
+            if varData[1]:
+                result['contextVarNames'].append(varName)
+
+        return result
+
+    def glob(self, filterTypes=[], useCache=True, workers=0):
         """
         Return a list of all crawlers found recursively under this path.
 
         Filter result list by crawler type (str) or class type (both include derived classes).
+
+        When workers is greater than 0 the children of the crawlers are computed
+        in parallel through a thread pool with the given number of workers. This is
+        useful to hide the latency about listing directories on network
+        storages. The result order is the same as the one returned
+        by the serial glob.
         """
         if self.__globCache is None or not useCache:
-            # Recursively collect all crawlers for this path
-            self.__globCache = Crawler.__collectCrawlers(self)
+            with Tracer.get().scope('crawl', self.var('fullPath'), workers=workers) as traceScope:
+                # Recursively collect all crawlers for this path
+                if workers > 0:
+                    self.__globCache = Crawler.__collectCrawlersParallel(self, workers)
+                else:
+                    self.__globCache = Crawler.__collectCrawlers(self)
+                traceScope.setArg('crawlers', len(self.__globCache))
 
         if not filterTypes:
             return self.__globCache
 
-        filteredCrawlers = set()
-        for filterType in filterTypes:
-            subClasses = tuple(Crawler.registeredSubclasses(filterType))
-            filteredCrawlers.update(
-                filter(lambda x: isinstance(x, subClasses), self.__globCache)
-            )
-        return list(filteredCrawlers)
+        # keeping the same order of the glob result
+        subClasses = Crawler.__filterSubclasses(filterTypes)
+        return list(filter(lambda x: isinstance(x, subClasses), self.__globCache))
+
+    def iterGlob(self, filterTypes=[]):
+        """
+        Return a generator that yields the crawlers found recursively under this path.
+
+        Filter result by crawler type (str) or class type (both include derived classes).
+
+        Differently from glob, the crawlers are yielded (depth-first) as soon as they
+        are found and the result is not cached. Use it when the caller can consume
+        the crawlers incrementally.
+        """
+        subClasses = Crawler.__filterSubclasses(filterTypes) if filterTypes else None
+        for crawler in Crawler.__iterCrawlers(self):
+            if subClasses is None or isinstance(crawler, subClasses):
+                yield crawler
 
     @classmethod
     def test(cls, data, parentCrawler=None):
@@ -196,14 +490,32 @@ class Crawler(object):
         """
         raise NotImplementedError
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        For re-implementation: Return a dict describing the data that can pass the test.
+
+        The hints are used by Crawler.create to narrow down the crawler types that
+        are tested for the input data (the test is still performed for the crawler
+        types that match the hints). Supported hints:
+            - dataType: class (or tuple of classes) of the data accepted by the test
+            - kind: 'file' or 'directory' (only used when the data is a path holder)
+            - extensions: list of lower case extensions (only used when the data is a path holder)
+
+        The hints are inherited along with the test, therefore a derived class that
+        re-implements the test to accept data outside of the inherited hints needs
+        to re-implement the hints as well (merging them with the hints from the
+        base class).
+        """
+        return {}
+
     @staticmethod
     def create(data, parentCrawler=None):
         """
         Create a crawler for the input data.
         """
         result = None
-        for registeredName in reversed(Crawler.__registeredTypes.keys()):
-            crawlerTypeClass = Crawler.__registeredTypes[registeredName]
+        for registeredName, crawlerTypeClass in Crawler.__dispatchCandidates(data):
             passedTest = False
 
             # testing crawler
@@ -254,6 +566,35 @@ class Crawler(object):
 
         Crawler.__registeredTypes[name] = crawlerClass
 
+        # the dispatch and sub types indexes need to be computed again
+        Crawler.__dispatchIndex = {}
+        Crawler.__subTypesIndex = {}
+        Crawler.__registrationVersion += 1
+
+    @staticmethod
+    def unregister(name):
+        """
+        Remove the registration of a crawler type.
+        """
+        assert name in Crawler.__registeredTypes, \
+            "No registered crawler type for \"{0}\"".format(name)
+
+        del Crawler.__registeredTypes[name]
+
+        # the dispatch and sub types indexes need to be computed again
+        Crawler.__dispatchIndex = {}
+        Crawler.__subTypesIndex = {}
+        Crawler.__registrationVersion += 1
+
+    @staticmethod
+    def registrationVersion():
+        """
+        Return a number that changes every time a crawler type is registered (or unregistered).
+
+        It can be used to invalidate information computed from the registered types.
+        """
+        return Crawler.__registrationVersion
+
     @staticmethod
     def registeredType(name):
         """
@@ -286,12 +627,25 @@ class Crawler(object):
         """
         Return a list of registered names of all derived classes for the given class or class type name.
         """
-        baseClass = Crawler.__baseClass(baseClassOrTypeName)
-        result = set()
-        for name, registeredType in Crawler.__registeredTypes.items():
-            if issubclass(registeredType, baseClass):
-                result.add(name)
-        return list(result)
+        return list(Crawler.registeredSubTypeSet(baseClassOrTypeName))
+
+    @staticmethod
+    def registeredSubTypeSet(baseClassOrTypeName):
+        """
+        Return a frozenset of registered names of all derived classes for the given class or class type name.
+
+        The result is cached until a crawler type is registered (or unregistered).
+        """
+        result = Crawler.__subTypesIndex.get(baseClassOrTypeName)
+        if result is None:
+            baseClass = Crawler.__baseClass(baseClassOrTypeName)
+            result = frozenset(
+                name for name, registeredType in Crawler.__registeredTypes.items()
+                if issubclass(registeredType, baseClass)
+            )
+            Crawler.__subTypesIndex[baseClassOrTypeName] = result
+
+        return result
 
     @staticmethod
     def createFromJson(jsonContents):
@@ -299,23 +653,147 @@ class Crawler(object):
         Create a crawler based on the jsonContents (serialized via toJson).
         """
         contents = json.loads(jsonContents)
-        crawlerType = contents["vars"]["type"]
-        fullPath = contents["vars"]["fullPath"]
 
-        # creating crawler
-        crawler = Crawler.__registeredTypes[crawlerType](fullPath)
+        return Crawler.__createFromContents(
+            contents["vars"].items(),
+            contents["contextVarNames"],
+            contents["tags"].items()
+        )
 
-        # setting vars
-        for varName, varValue in contents["vars"].items():
-            isContextVar = (varName in contents["contextVarNames"])
-            crawler.setVar(varName, varValue, isContextVar)
+    @staticmethod
+    def createFromCacheData(cacheData, parentCrawler=None):
+        """
+        Restore a crawler based on the cacheData (created via toCacheData).
 
-        # setting tags
-        for tagName, tagValue in contents["tags"].items():
+        The crawler is restored without calling its constructor, the variables
+        computed by the constructor come from the cache data (@see _restoreData).
+        """
+        crawlerClass = Crawler.__registeredTypes[cacheData['type']]
+
+        crawler = crawlerClass.__new__(crawlerClass)
+        crawler.__tags = None
+        crawler.__globCache = None
+        if parentCrawler is not None:
+            crawler.__varScope = _VarScope(parentCrawler.__sharedVarScope())
+        else:
+            crawler.__varScope = _VarScope()
+
+        contextVarNames = set(cacheData['contextVarNames'])
+        for varName, varValue in cacheData['vars']:
+            crawler.setVar(varName, varValue, varName in contextVarNames)
+
+        for tagName, tagValue in cacheData['tags'].items():
             crawler.setTag(tagName, tagValue)
 
+        crawler._restoreData()
+
         return crawler
 
+    @staticmethod
+    def serializeMany(crawlers):
+        """
+        Serialize a list of crawlers to a single compact json document (it can be recovered later using deserializeMany).
+
+        Differently from toJson, the crawlers are stored in a columnar layout
+        (@see Crawler.bakeMany) which is considerably smaller and faster
+        to load for large lists of crawlers (for instance image sequences).
+        """
+        return json.dumps(
+            Crawler.bakeMany(crawlers),
+            separators=(',', ':')
+        )
+
+    @staticmethod
+    def deserializeMany(contents):
+        """
+        Return a list of crawlers based on the contents (serialized via serializeMany).
+
+        The contents can be either the json string or the data returned by bakeMany. For
+        backwards compatibility the contents can also be a json list of crawlers serialized
+        individually through toJson.
+        """
+        if isinstance(contents, basestring):
+            contents = json.loads(contents)
+
+        # list of crawlers serialized through toJson
+        if isinstance(contents, list):
+            return list(map(Crawler.createFromJson, contents))
+
+        result = [None] * contents['total']
+        for group in contents['groups']:
+            contextVarNames = set(group['contextVarNames'])
+            varColumns = group['vars']['columns']
+            tagColumns = group['tags']['columns']
+
+            for position, index in enumerate(group['indexes']):
+                varItems = []
+                for varName in group['varNames']:
+                    if varName in varColumns:
+                        varItems.append((varName, varColumns[varName][position]))
+                    else:
+                        varItems.append((varName, Crawler.__sharedValue(group['vars']['shared'][varName])))
+
+                tagItems = []
+                for tagName in group['tagNames']:
+                    if tagName in tagColumns:
+                        tagItems.append((tagName, tagColumns[tagName][position]))
+                    else:
+                        tagItems.append((tagName, Crawler.__sharedValue(group['tags']['shared'][tagName])))
+
+                result[index] = Crawler.__createFromContents(
+                    varItems,
+                    contextVarNames,
+                    tagItems
+                )
+
+        return result
+
+    @staticmethod
+    def bakeMany(crawlers):
+        """
+        Return a json compatible dict describing the crawlers (used by serializeMany).
+
+        The crawlers are grouped by type and names (vars, context vars and tags). Each
+        group stores the names only once, the values that are the same for all
+        crawlers in the group are stored once under "shared" and the remaining
+        values are stored per crawler under "columns".
+        """
+        groups = OrderedDict()
+        total = 0
+        for index, crawler in enumerate(crawlers):
+            total += 1
+            varNames = tuple(crawler.varNames())
+            contextVarNames = tuple(sorted(crawler.contextVarNames()))
+            tagNames = tuple(crawler.tagNames())
+            groupKey = (varNames, contextVarNames, tagNames)
+
+            if groupKey not in groups:
+                groups[groupKey] = {
+                    'varNames': list(varNames),
+                    'contextVarNames': list(contextVarNames),
+                    'tagNames': list(tagNames),
+                    'indexes': [],
+                    'vars': OrderedDict((x, []) for x in varNames),
+                    'tags': OrderedDict((x, []) for x in tagNames)
+                }
+
+            group = groups[groupKey]
+            group['indexes'].append(index)
+            for varName in varNames:
+                group['vars'][varName].append(crawler.var(varName))
+            for tagName in tagNames:
+                group['tags'][tagName].append(crawler.tag(tagName))
+
+        # factoring out the values shared by all crawlers in the group
+        for group in groups.values():
+            group['vars'] = Crawler.__bakeColumns(group['vars'])
+            group['tags'] = Crawler.__bakeColumns(group['tags'])
+
+        return {
+            'total': total,
+            'groups': list(groups.values())
+        }
+
     @staticmethod
     def group(crawlers, tag='group'):
         """
@@ -329,7 +807,7 @@ class Crawler(object):
         groupedCrawlers = OrderedDict()
         uniqueCrawlers = []
         for crawler in crawlers:
-            if tag in crawler.tagNames():
+            if crawler.hasTag(tag):
                 groupName = crawler.tag(tag)
                 if groupName not in groupedCrawlers:
                     groupedCrawlers[groupName] = []
@@ -355,20 +833,199 @@ class Crawler(object):
             result.append(list(sorted(group, key=key, reverse=reverse)))
         return result
 
+    def __sharedVarScope(self):
+        """
+        Return the current var scope marked as shared (used by child crawlers).
+        """
+        self.__varScope.freeze()
+        return self.__varScope
+
+    @staticmethod
+    def __createFromContents(varItems, contextVarNames, tagItems):
+        """
+        Create a crawler based on the serialized (name, value) items.
+        """
+        varItems = list(varItems)
+        vars = dict(varItems)
+
+        # creating crawler
+        crawler = Crawler.__registeredTypes[vars["type"]](vars["fullPath"])
+
+        # setting vars
+        for varName, varValue in varItems:
+            isContextVar = (varName in contextVarNames)
+            crawler.setVar(varName, varValue, isContextVar)
+
+        # setting tags
+        for tagName, tagValue in tagItems:
+            crawler.setTag(tagName, tagValue)
+
+        return crawler
+
+    @staticmethod
+    def __sharedValue(value):
+        """
+        Return a value stored under "shared" making sure mutable values are not shared across crawlers.
+        """
+        if isinstance(value, (list, dict)):
+            return copy.deepcopy(value)
+
+        return value
+
+    @staticmethod
+    def __bakeColumns(columns):
+        """
+        Return a dict splitting the columns in "shared" (same value for all items) and "columns".
+        """
+        result = {
+            'shared': {},
+            'columns': {}
+        }
+
+        for name, values in columns.items():
+            firstValue = values[0]
+            firstType = type(firstValue)
+            if all(type(x) is firstType and x == firstValue for x in values):
+                result['shared'][name] = firstValue
+            else:
+                result['columns'][name] = values
+
+        return result
+
     @staticmethod
     def __collectCrawlers(crawler):
         """
         Resursively collect crawlers.
         """
-        result = []
-        result.append(crawler)
+        return list(Crawler.__iterCrawlers(crawler))
 
-        if not crawler.isLeaf():
-            for childCrawler in crawler.children():
-                result += Crawler.__collectCrawlers(childCrawler)
+    @staticmethod
+    def __iterCrawlers(crawler):
+        """
+        Yield the crawler and all the crawlers under it (depth-first).
+        """
+        stack = [crawler]
+        while stack:
+            currentCrawler = stack.pop()
+            yield currentCrawler
+
+            if not currentCrawler.isLeaf():
+                stack.extend(reversed(currentCrawler.children()))
+
+    @staticmethod
+    def __collectCrawlersParallel(crawler, workers):
+        """
+        Collect crawlers by computing the children in parallel.
+
+        Each non-leaf crawler is sent to a thread pool as soon as it is found,
+        so a slow directory does not hold the crawling of its siblings. The
+        result is assembled afterwards using the same depth-first order
+        returned by __collectCrawlers.
+        """
+        if crawler.isLeaf():
+            return [crawler]
+
+        computedChildren = {}
+        resultQueue = queue.Queue()
+        pool = ThreadPool(workers)
+
+        def __computeChildren(parentCrawler):
+            try:
+                resultQueue.put((parentCrawler, parentCrawler.children(), None))
+            except Exception as err:
+                resultQueue.put((parentCrawler, None, err))
+
+        try:
+            pool.apply_async(__computeChildren, (crawler,))
+            pending = 1
+            while pending:
+                parentCrawler, children, error = resultQueue.get()
+                pending -= 1
+
+                if error is not None:
+                    raise error
+
+                computedChildren[parentCrawler] = children
+                for childCrawler in children:
+                    if not childCrawler.isLeaf():
+                        pool.apply_async(__computeChildren, (childCrawler,))
+                        pending += 1
+        finally:
+            pool.terminate()
+
+        # assembling the result in depth-first order
+        result = []
+        stack = [crawler]
+        while stack:
+            currentCrawler = stack.pop()
+            result.append(currentCrawler)
+            if currentCrawler in computedChildren:
+                stack.extend(reversed(computedChildren[currentCrawler]))
 
         return result
 
+    @staticmethod
+    def __dispatchCandidates(data):
+        """
+        Return a list of (registered name, crawler class) that should be tested for the data.
+
+        The list follows the registration priority (from the latest registrations to the
+        first ones) and it only contains the crawler types where the dispatch hints match
+        the data. The result is cached by data type, kind and extension (the cache is
+        reset when a new crawler type is registered).
+        """
+        if isinstance(data, PathHolder):
+            dispatchKey = (
+                type(data),
+                'directory' if data.isDirectory() else 'file',
+                data.ext()
+            )
+        else:
+            dispatchKey = (type(data), None, None)
+
+        dispatchIndex = Crawler.__dispatchIndex
+        if dispatchKey not in dispatchIndex:
+            candidates = []
+            for registeredName in reversed(list(Crawler.__registeredTypes.keys())):
+                crawlerTypeClass = Crawler.__registeredTypes[registeredName]
+                if Crawler.__matchDispatchHints(crawlerTypeClass, dispatchKey):
+                    candidates.append((registeredName, crawlerTypeClass))
+
+            dispatchIndex[dispatchKey] = candidates
+
+        return dispatchIndex[dispatchKey]
+
+    @staticmethod
+    def __matchDispatchHints(crawlerClass, dispatchKey):
+        """
+        Return a boolean telling if the dispatch hints of the crawler class match the dispatch key.
+        """
+        hints = crawlerClass.dispatchHints()
+        dataType, kind, ext = dispatchKey
+
+        if 'dataType' in hints and not issubclass(dataType, hints['dataType']):
+            return False
+
+        # path holder hints
+        if kind is not None:
+            if hints.get('kind', kind) != kind:
+                return False
+
+            if 'extensions' in hints and ext not in hints['extensions']:
+                return False
+
+        return True
+
+    @staticmethod
+    def __filterSubclasses(filterTypes):
+        """
+        Return a tuple containing the registered classes for the filter types (including derived classes).
+        """
+        result = set()
+        for filterType in filterTypes:
+            result.update(Crawler.registeredSubclasses(filterType))
+        return tuple(result)
+
     @staticmethod
     def __baseClass(baseClassOrTypeName):
         """
@@ -6,6 +6,8 @@ class Json(Ascii):
     Json crawler.
     """
 
+    __slots__ = ()
+
     def _runParser(self):
         """
         Parse the json contents.
@@ -23,6 +25,16 @@ class Json(Ascii):
 
         return pathHolder.ext() in ['json']
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the json files accepted by the test.
+        """
+        hints = super(Json, cls).dispatchHints()
+        hints['extensions'] = ['json']
+
+        return hints
+
 
 # registration
 Json.register(
@@ -5,6 +5,8 @@ class Txt(Ascii):
     Txt crawler.
     """
 
+    __slots__ = ()
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -15,6 +17,16 @@ class Txt(Ascii):
 
         return pathHolder.ext() in ['txt']
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the txt files accepted by the test.
+        """
+        hints = super(Txt, cls).dispatchHints()
+        hints['extensions'] = ['txt']
+
+        return hints
+
 
 # registration
 Txt.register(
@@ -10,6 +10,8 @@ class Xml(Ascii):
     Xml crawler.
     """
 
+    __slots__ = ('__cache',)
+
     def __init__(self, *args, **kwargs):
         """
         Constructor.
@@ -18,6 +20,14 @@ class Xml(Ascii):
 
         self.__cache = {}
 
+    def _restoreData(self):
+        """
+        Initialize the query cache of a crawler restored through createFromCacheData or clone.
+        """
+        super(Xml, self)._restoreData()
+
+        self.__cache = {}
+
     def queryTag(self, tag, ignoreNameSpace=True):
         """
         Query the values that are related to the specified tag.
@@ -35,6 +45,16 @@ class Xml(Ascii):
         """
         return pathHolder.ext() == 'xml'
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the xml files accepted by the test.
+        """
+        hints = super(Xml, cls).dispatchHints()
+        hints['extensions'] = ['xml']
+
+        return hints
+
     def __runQueryTag(self, tag, ignoreNameSpace, root=None):
         """
         Run the recursion on the xml tree.
@@ -0,0 +1,228 @@
+import os
+import json
+import time
+import atexit
+import hashlib
+import sqlite3
+import threading
+from ..Crawler import Crawler
+
+class CrawlCache(object):
+    """
+    Persistent cache used to store the children computed by directory crawlers.
+
+    The cache is stored as a sqlite database under the cache directory. Each entry
+    is keyed by the directory path and a digest about the variables of the
+    directory crawler (the children can inherit and be affected by them), and it
+    holds the modification time of the directory together with the data of the
+    children (@see Crawler.toCacheData). An entry is only used while the
+    modification time of the directory remains the same, therefore unchanged
+    directories are restored from the cache and only the modified directories
+    are listed and tested again.
+
+    Since the modification time of a directory only changes when entries are
+    added, removed or renamed, files that are modified in place are not detected.
+    The entries are also keyed by the registered crawler types (names and classes),
+    so registering a different crawler type invalidates them.
+
+    The database uses the default rollback journal (rather than WAL), which
+    relies only on file locking and therefore can be shared by multiple hosts
+    when the cache directory is located on a network file system. Since each
+    transaction under the rollback journal syncs the database, the entries are
+    buffered and written in batches: when the buffer is full, when a glob is
+    done (@see Directory.glob) or when the process exits (@see flush).
+
+    The default cache is enabled by setting the environment variable
+    CENTIPEDE_CRAWL_CACHE_DIR to the directory where the cache should be stored.
+    """
+
+    __fileName = 'crawlCache.sqlite'
+    __cacheDirEnvName = 'CENTIPEDE_CRAWL_CACHE_DIR'
+    __defaultCache = None
+
+    # directories modified in the last seconds are not stored, since further
+    # modifications may happen within the resolution of the modification time
+    __minimumAge = 2.0
+
+    # number of buffered entries that triggers a write to the database
+    __batchSize = 256
+
+    def __init__(self, cacheDirectory):
+        """
+        Create a crawl cache object.
+        """
+        self.__cacheDirectory = cacheDirectory
+        self.__connections = threading.local()
+        self.__pendingLock = threading.Lock()
+        self.__pendingRows = {}
+
+        if not os.path.exists(cacheDirectory):
+            os.makedirs(cacheDirectory)
+
+        # creating the database
+        self.__connection().execute(
+            'CREATE TABLE IF NOT EXISTS children ('
+            'path TEXT, varsDigest TEXT, mtime INTEGER, data TEXT, '
+            'PRIMARY KEY (path, varsDigest))'
+        )
+
+        # making sure the buffered entries are written
+        atexit.register(self.flush)
+
+    def cacheDirectory(self):
+        """
+        Return the directory where the cache is stored.
+        """
+        return self.__cacheDirectory
+
+    def children(self, crawler, varsDigest=None):
+        """
+        Return a list of children restored from the cache or None when the directory is not cached (or outdated).
+
+        The varsDigest can be provided when it has already been computed for the
+        crawler (@see varsDigest).
+        """
+        mtime = self.__mtime(crawler)
+        if mtime is None:
+            return None
+
+        if varsDigest is None:
+            varsDigest = self.varsDigest(crawler)
+
+        key = (crawler.pathHolder().path(), varsDigest)
+        with self.__pendingLock:
+            row = self.__pendingRows.get(key)
+
+        if row is None:
+            row = self.__connection().execute(
+                'SELECT mtime, data FROM children WHERE path=? AND varsDigest=?',
+                key
+            ).fetchone()
+
+        if row is None or row[0] != mtime:
+            return None
+
+        return list(map(
+            lambda x: Crawler.createFromCacheData(x, crawler),
+            json.loads(row[1])
+        ))
+
+    def setChildren(self, crawler, children, varsDigest=None):
+        """
+        Store the children computed for the directory crawler.
+
+        The entry is buffered, it is written to the database in a batch (@see flush).
+        """
+        mtime = self.__mtime(crawler)
+        if mtime is None or time.time() - mtime / 1e9 < self.__minimumAge:
+            return
+
+        if varsDigest is None:
+            varsDigest = self.varsDigest(crawler)
+
+        data = json.dumps(
+            list(map(lambda x: x.toCacheData(crawler), children)),
+            separators=(',', ':')
+        )
+
+        with self.__pendingLock:
+            self.__pendingRows[(crawler.pathHolder().path(), varsDigest)] = (mtime, data)
+            isFull = len(self.__pendingRows) >= self.__batchSize
+
+        if isFull:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the buffered entries to the database (in a single transaction).
+        """
+        with self.__pendingLock:
+            pendingRows = self.__pendingRows
+            self.__pendingRows = {}
+
+        if not pendingRows:
+            return
+
+        connection = self.__connection()
+        with connection:
+            connection.executemany(
+                'INSERT OR REPLACE INTO children (path, varsDigest, mtime, data) VALUES (?, ?, ?, ?)',
+                [key + value for key, value in pendingRows.items()]
+            )
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+        with self.__pendingLock:
+            self.__pendingRows.clear()
+
+        connection = self.__connection()
+        with connection:
+            connection.execute('DELETE FROM children')
+
+    @classmethod
+    def default(cls):
+        """
+        Return the default crawl cache (or None when the cache is disabled).
+        """
+        cacheDirectory = os.environ.get(cls.__cacheDirEnvName, '')
+        if not cacheDirectory:
+            return None
+
+        if cls.__defaultCache is None or cls.__defaultCache.cacheDirectory() != cacheDirectory:
+            cls.__defaultCache = CrawlCache(cacheDirectory)
+
+        return cls.__defaultCache
+
+    def __connection(self):
+        """
+        Return the database connection used by the current thread.
+        """
+        if not hasattr(self.__connections, 'connection'):
+            connection = sqlite3.connect(
+                os.path.join(self.__cacheDirectory, self.__fileName),
+                timeout=30
+            )
+            connection.execute('PRAGMA journal_mode=DELETE')
+            self.__connections.connection = connection
+
+        return self.__connections.connection
+
+    @classmethod
+    def __mtime(cls, crawler):
+        """
+        Return the modification time (in nanoseconds) of the directory or None when it does not exist.
+        """
+        statResult = crawler.pathHolder().stat()
+        if statResult is None:
+            return None
+
+        if hasattr(statResult, 'st_mtime_ns'):
+            return statResult.st_mtime_ns
+
+        return int(statResult.st_mtime * 1e9)
+
+    @classmethod
+    def varsDigest(cls, crawler):
+        """
+        Return a digest about the variables of the crawler and the registered crawler types.
+
+        The digest is part of the key used by the entries of the cache.
+        """
+        registeredTypes = []
+        for crawlerType in Crawler.registeredNames():
+            crawlerClass = Crawler.registeredType(crawlerType)
+            registeredTypes.append([crawlerType, crawlerClass.__module__, crawlerClass.__name__])
+
+        contents = json.dumps(
+            [
+                [[x, crawler.var(x)] for x in crawler.varNames()],
+                sorted(crawler.contextVarNames()),
+                registeredTypes
+            ],
+            sort_keys=True,
+            default=str
+        )
+
+        return hashlib.sha1(contents.encode('utf-8')).hexdigest()
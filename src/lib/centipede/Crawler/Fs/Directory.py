@@ -4,12 +4,22 @@ import sys
 from .FsPath import FsPath
 from ...PathHolder import PathHolder
 from ..Crawler import Crawler
+from .CrawlCache import CrawlCache
+from .Sequence import Sequence
+
+# compatibility with python 2/3
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
 
 class Directory(FsPath):
     """
     Directory crawler.
     """
 
+    __slots__ = ()
+
     # checking for digits as prefix separated by x or X and finishing with digits as suffix
     __resolutionRegex = '^[0-9]+[x|X][0-9]+$'
 
@@ -42,10 +52,30 @@ class Directory(FsPath):
     def _computeChildren(self):
         """
         Return the directory contents.
+
+        The directory is listed through os.scandir (when available), the entries
+        are passed to the path holders so the information about the files
+        (type, size...) can be provided without querying the file system again.
+
+        When the crawl cache is enabled (@see CrawlCache) the children of
+        unchanged directories are restored from the cache instead. The
+        file sequences are collapsed when the variable "collapseSequences"
+        is enabled (@see Sequence): the file names are grouped by the naming
+        of the frames during the listing, so a single crawler is created per
+        sequence.
         """
-        result = []
+        crawlCache = CrawlCache.default()
+        if crawlCache is not None:
+            varsDigest = crawlCache.varsDigest(self)
+            result = crawlCache.children(self, varsDigest)
+            if result is not None:
+                return result
+
+        collapseSequences = self.hasVar('collapseSequences') and self.var('collapseSequences')
         currentPath = self.pathHolder().path()
-        for childFile in os.listdir(currentPath):
+        childFiles = []
+        sequenceFrames = {}
+        for childFile, childEntry in self.__listDirectory(currentPath):
 
             # skipping any file with an illegal name
             if not re.match(self.__invalidFileNameRegex, childFile):
@@ -56,10 +86,60 @@ class Directory(FsPath):
                 )
                 continue
 
-            childPathHolder = PathHolder(os.path.join(currentPath, childFile))
+            sequencePattern = None
+            if collapseSequences:
+                parsedFileName = Sequence.parseFileName(childFile)
+                if parsedFileName is not None:
+                    sequencePattern, frame = parsedFileName
+                    sequenceFrames.setdefault(sequencePattern, []).append(frame)
+
+            childFiles.append((childFile, childEntry, sequencePattern))
+
+        result = []
+        sequences = {}
+        for childFile, childEntry, sequencePattern in childFiles:
+
+            # the sequence has already been created from another frame
+            if sequences.get(sequencePattern) is not None:
+                continue
+
+            childPathHolder = PathHolder(
+                os.path.join(currentPath, childFile),
+                childEntry
+            )
             childCrawler = Crawler.create(childPathHolder, self)
+
+            # file sequences are represented by a single crawler (the files that
+            # are not frames of a sequence are created individually)
+            if sequencePattern is not None and sequencePattern not in sequences:
+                sequences[sequencePattern] = None
+                if childCrawler.hasVar('frame') and childCrawler.hasTag('group'):
+                    childCrawler = Sequence.createFromFrames(
+                        childCrawler,
+                        sequenceFrames[sequencePattern],
+                        self
+                    )
+                    sequences[sequencePattern] = childCrawler
+
             result.append(childCrawler)
 
+        if crawlCache is not None:
+            crawlCache.setChildren(self, result, varsDigest)
+
+        return result
+
+    def glob(self, *args, **kwargs):
+        """
+        Return a list of all crawlers found recursively under this path (@see Crawler.glob).
+
+        The entries buffered by the crawl cache are written once the glob is done.
+        """
+        result = super(Directory, self).glob(*args, **kwargs)
+
+        crawlCache = CrawlCache.default()
+        if crawlCache is not None:
+            crawlCache.flush()
+
         return result
 
     @classmethod
@@ -71,6 +151,28 @@ class Directory(FsPath):
             return False
         return pathHolder.isDirectory()
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the data accepted by the test (directories).
+        """
+        hints = super(Directory, cls).dispatchHints()
+        hints['kind'] = 'directory'
+
+        return hints
+
+    @classmethod
+    def __listDirectory(cls, path):
+        """
+        Return a list of (name, entry) about the contents of the directory.
+
+        The entry is None when os.scandir is not available (python 2).
+        """
+        if scandir is None:
+            return [(name, None) for name in os.listdir(path)]
+
+        return [(entry.name, entry) for entry in scandir(path)]
+
 
 # registration
 Crawler.register(
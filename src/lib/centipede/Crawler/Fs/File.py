@@ -6,6 +6,8 @@ class File(FsPath):
     File crawler.
     """
 
+    __slots__ = ()
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -15,6 +17,16 @@ class File(FsPath):
             return False
         return pathHolder.isFile()
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the data accepted by the test (files).
+        """
+        hints = super(File, cls).dispatchHints()
+        hints['kind'] = 'file'
+
+        return hints
+
 
 # registration (it's registered as generic, rather than 'file' to show
 # that there is no specialized crawler when a file is marked with
@@ -13,6 +13,8 @@ class FsPath(Crawler):
     Abstracted file system Path.
     """
 
+    __slots__ = ('__pathHolder',)
+
     def __init__(self, filePathOrPathHolder, parentCrawler=None):
         """
         Create a crawler (use the factory function Path.create instead).
@@ -30,7 +32,7 @@ class FsPath(Crawler):
         self.setVar('ext', pathHolder.ext())
         self.setVar('baseName', pathHolder.baseName())
         self.setVar('name', os.path.splitext(pathHolder.baseName())[0])
-        if 'sourceDirectory' not in self.varNames():
+        if not self.hasVar('sourceDirectory'):
             path = pathHolder.path()
             if not pathHolder.isDirectory():
                 path = os.path.dirname(path)
@@ -42,14 +44,22 @@ class FsPath(Crawler):
         """
         return self.__pathHolder
 
-    def globFromParent(self, filterTypes=[], useCache=True):
+    def _restoreData(self):
+        """
+        Initialize the path holder of a crawler restored through createFromCacheData or clone.
+        """
+        super(FsPath, self)._restoreData()
+
+        self.__setPathHolder(PathHolder(self.var('filePath')))
+
+    def globFromParent(self, filterTypes=[], useCache=True, workers=0):
         """
         Return a list of all crawlers found recursively under the parent directory of the given path.
 
         Filter result list by exact crawler type (str) or class type (includes derived classes).
         """
         parentPath = os.path.dirname(self.var("filePath"))
-        return FsPath.createFromPath(parentPath).glob(filterTypes, useCache)
+        return FsPath.createFromPath(parentPath).glob(filterTypes, useCache, workers)
 
     @classmethod
     def test(cls, data=None, parentCrawler=None):
@@ -58,6 +68,16 @@ class FsPath(Crawler):
         """
         return isinstance(data, PathHolder)
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the data accepted by the test (path holders).
+        """
+        hints = super(FsPath, cls).dispatchHints()
+        hints['dataType'] = PathHolder
+
+        return hints
+
     @staticmethod
     def createFromPath(fullPath, crawlerType=None, parentCrawler=None):
         """
@@ -5,6 +5,8 @@ class Dpx(Oiio):
     Dpx crawler.
     """
 
+    __slots__ = ()
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -15,6 +17,16 @@ class Dpx(Oiio):
 
         return pathHolder.ext() == 'dpx'
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the dpx files accepted by the test.
+        """
+        hints = super(Dpx, cls).dispatchHints()
+        hints['extensions'] = ['dpx']
+
+        return hints
+
 
 # registration
 Dpx.register(
@@ -5,6 +5,8 @@ class Exr(Oiio):
     Exr crawler.
     """
 
+    __slots__ = ()
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -15,6 +17,16 @@ class Exr(Oiio):
 
         return pathHolder.ext() == 'exr'
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the exr files accepted by the test.
+        """
+        hints = super(Exr, cls).dispatchHints()
+        hints['extensions'] = ['exr']
+
+        return hints
+
 
 # registration
 Exr.register(
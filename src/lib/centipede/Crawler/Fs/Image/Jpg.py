@@ -5,6 +5,8 @@ class Jpg(Oiio):
     Jpg crawler.
     """
 
+    __slots__ = ()
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -15,6 +17,16 @@ class Jpg(Oiio):
 
         return pathHolder.ext() == 'jpg'
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the jpg files accepted by the test.
+        """
+        hints = super(Jpg, cls).dispatchHints()
+        hints['extensions'] = ['jpg']
+
+        return hints
+
 
 # registration
 Jpg.register(
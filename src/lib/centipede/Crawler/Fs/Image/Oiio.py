@@ -18,11 +18,29 @@ class Oiio(Image):
     Open image io crawler.
     """
 
+    __slots__ = ()
+
     def var(self, name):
         """
         Return var value using lazy loading implementation for width and height.
         """
-        if name in ['width', 'height'] and name not in self.varNames():
+        self.__loadLazyVar(name)
+
+        return super(Oiio, self).var(name)
+
+    def varOr(self, name, default=None):
+        """
+        Return var value (or the default value) using lazy loading implementation for width and height.
+        """
+        self.__loadLazyVar(name)
+
+        return super(Oiio, self).varOr(name, default)
+
+    def __loadLazyVar(self, name):
+        """
+        Load the width and height information when they are requested for the first time.
+        """
+        if name in ['width', 'height'] and not self.hasVar(name):
             # alternatively width and height information could come from the
             # parent directory crawler "1920x1080". For more details take a look
             # at "Directory" crawler.
@@ -45,8 +63,6 @@ class Oiio(Image):
             else:
                 self.__getWidthHeight()
 
-        return super(Oiio, self).var(name)
-
     def __getWidthHeight(self):
         """
         Query width and height using ffprobe and set them as crawler variables.
@@ -5,6 +5,8 @@ class Png(Oiio):
     Png crawler.
     """
 
+    __slots__ = ()
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -15,6 +17,16 @@ class Png(Oiio):
 
         return pathHolder.ext() == 'png'
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the png files accepted by the test.
+        """
+        hints = super(Png, cls).dispatchHints()
+        hints['extensions'] = ['png']
+
+        return hints
+
 
 # registration
 Png.register(
@@ -5,6 +5,8 @@ class Ccc(Lut):
     Parses a Ccc or a Cc file.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a Ccc object.
@@ -20,6 +22,16 @@ class Ccc(Lut):
         """
         return pathHolder.ext() in ['ccc', 'cc']
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the lut files accepted by the test.
+        """
+        hints = super(Ccc, cls).dispatchHints()
+        hints['extensions'] = ['ccc', 'cc']
+
+        return hints
+
     def __parseXML(self):
         """
         Parse the ccc file (XML file format) information and assign that to the crawler.
@@ -5,6 +5,8 @@ class Cdl(Lut):
     Parses a cdl file.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a Cdl object.
@@ -20,6 +22,16 @@ class Cdl(Lut):
         """
         return pathHolder.ext() == 'cdl'
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the cdl files accepted by the test.
+        """
+        hints = super(Cdl, cls).dispatchHints()
+        hints['extensions'] = ['cdl']
+
+        return hints
+
     def __parseXML(self):
         """
         Parse the cld file (XML file format) information and assign that to the crawler.
@@ -8,6 +8,8 @@ class Cube(Lut):
     future releases.
     """
 
+    __slots__ = ()
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -18,6 +20,16 @@ class Cube(Lut):
 
         return pathHolder.ext() in ['cube', 'ccc', 'cc', 'cdl']
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the lut files accepted by the test.
+        """
+        hints = super(Cube, cls).dispatchHints()
+        hints['extensions'] = ['cube', 'ccc', 'cc', 'cdl']
+
+        return hints
+
 
 # registration
 Cube.register(
@@ -5,6 +5,8 @@ class Lut(Xml):
     Abstracted lut crawler.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a lut crawler.
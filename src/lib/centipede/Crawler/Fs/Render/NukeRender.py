@@ -5,6 +5,8 @@ class NukeRender(ExrRender):
     Custom crawler to parse information from a Nuke render.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a NukeRender object.
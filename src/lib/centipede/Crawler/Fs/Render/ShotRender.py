@@ -5,6 +5,8 @@ class ShotRender(ExrRender):
     Custom crawler used to detect renders for shots.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a Render object.
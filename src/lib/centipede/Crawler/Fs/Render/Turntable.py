@@ -5,6 +5,8 @@ class Turntable(ExrRender):
     Custom crawler used to detect turntable renders.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a Turntable object.
@@ -5,6 +5,8 @@ class MayaScene(Scene):
     Crawler used to detect maya scenes.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a MayaScene object.
@@ -28,6 +30,16 @@ class MayaScene(Scene):
 
         return pathHolder.ext() in cls.extensions()
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the maya scene files accepted by the test.
+        """
+        hints = super(Scene, cls).dispatchHints()
+        hints['extensions'] = cls.extensions()
+
+        return hints
+
 
 # registering crawler
 MayaScene.register(
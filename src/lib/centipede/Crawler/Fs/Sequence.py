@@ -0,0 +1,249 @@
+import os
+import re
+from ..Crawler import Crawler
+from ...PathHolder import PathHolder
+
+# compatibility with python 2/3
+try:
+    basestring
+except NameError:
+    basestring = str
+
+class Sequence(Crawler):
+    """
+    Sequence crawler that represents the frames of a file sequence as one crawler.
+
+    The sequence is created from the crawlers of the frames (they must contain
+    the "frame" variable and the "group" tag, for instance image sequences). It
+    holds the variables that are shared by all frames and the frame ranges
+    (gaps are supported), the per-frame crawlers can be created on demand
+    through frameCrawlers.
+
+    Directory crawlers produce sequences directly (rather than one crawler per
+    frame) when the variable "collapseSequences" is enabled, for instance:
+    crawler = FsPath.createFromPath('/plates')
+    crawler.setVar('collapseSequences', True)
+    crawler.glob()
+
+    In this case the file names are grouped by the naming of the frames
+    (@see parseFileName) and only one crawler is created per sequence
+    (@see createFromFrames).
+    """
+
+    __slots__ = ()
+
+    # variables computed per frame (they are not shared by the sequence)
+    __frameVarNames = (
+        'frame',
+        'fullPath',
+        'filePath',
+        'baseName',
+        'type'
+    )
+
+    # variables computed by the sequence itself
+    __sequenceVarNames = (
+        'frameRanges',
+        'firstFrame',
+        'lastFrame',
+        'frameType'
+    )
+
+    # naming of the frames (same conventions used by the image crawlers):
+    # standard "abc.0001.ext" and ambiguous "abc_0001.ext"
+    __standardFrameRegex = re.compile(r'^(.*\.)([0-9]+)(\.[^.]*)$')
+    __ambiguousFrameRegex = re.compile(r'^([^.]*_)([0-9]{4,})(\..*)?$')
+
+    def __init__(self, frameCrawlersOrFullPath, parentCrawler=None):
+        """
+        Create a sequence crawler (use Sequence.collapse or Sequence.createFromFrames instead).
+
+        When a full path is provided (used when restoring a serialized crawler) the
+        information about the sequence is expected to be assigned afterwards.
+        """
+        if isinstance(frameCrawlersOrFullPath, basestring):
+            super(Sequence, self).__init__(os.path.basename(frameCrawlersOrFullPath), parentCrawler)
+            self.setVar('fullPath', frameCrawlersOrFullPath)
+            return
+
+        frameCrawlers = sorted(frameCrawlersOrFullPath, key=lambda x: x.var('frame'))
+        firstCrawler = frameCrawlers[0]
+        groupName = firstCrawler.tag('group')
+
+        super(Sequence, self).__init__(groupName, parentCrawler)
+
+        # variables shared by all frames
+        contextVarNames = set(firstCrawler.contextVarNames())
+        for varName in firstCrawler.varNames():
+            if varName in self.__frameVarNames:
+                continue
+
+            varValue = firstCrawler.var(varName)
+            isContextVar = varName in contextVarNames
+            if all(x.hasVar(varName) and x.var(varName) == varValue for x in frameCrawlers[1:]):
+                self.setVar(varName, varValue, isContextVar)
+
+        directory = os.path.dirname(firstCrawler.var('filePath'))
+        self.setVar('fullPath', os.path.join(directory, groupName))
+        self.setVar('filePath', os.path.join(directory, groupName))
+        self.setVar('baseName', groupName)
+        self.setVar('frameType', firstCrawler.var('type'))
+        self.setVar('frameRanges', self.__computeFrameRanges([x.var('frame') for x in frameCrawlers]))
+        self.setVar('firstFrame', firstCrawler.var('frame'))
+        self.setVar('lastFrame', frameCrawlers[-1].var('frame'))
+        self.setTag('group', groupName)
+
+    def frames(self):
+        """
+        Return a list of frames contained by the sequence.
+        """
+        result = []
+        for start, end in self.var('frameRanges'):
+            result += range(start, end + 1)
+
+        return result
+
+    def filePath(self, frame):
+        """
+        Return the file path for the input frame.
+        """
+        padding = self.var('padding')
+        return os.path.join(
+            os.path.dirname(self.var('filePath')),
+            self.var('baseName').replace('#' * padding, str(frame).zfill(padding))
+        )
+
+    def frameCrawlers(self):
+        """
+        Return a list of crawlers for the frames of the sequence (created on demand).
+        """
+        crawlerType = self.var('frameType')
+        crawlerClass = Crawler.registeredType(crawlerType)
+        contextVarNames = set(self.contextVarNames())
+        sharedVarNames = list(filter(
+            lambda x: x not in self.__sequenceVarNames and x not in self.__frameVarNames,
+            self.varNames()
+        ))
+
+        result = []
+        for frame in self.frames():
+            crawler = crawlerClass(PathHolder(self.filePath(frame)))
+            crawler.setVar('type', crawlerType)
+
+            # the variables shared by the frames come from the sequence
+            for varName in sharedVarNames:
+                crawler.setVar(varName, self.var(varName), varName in contextVarNames)
+
+            result.append(crawler)
+
+        return result
+
+    @classmethod
+    def test(cls, data, parentCrawler=None):
+        """
+        Test if the data is a list of crawlers from the same sequence.
+        """
+        if not isinstance(data, (list, tuple)) or not data:
+            return False
+
+        groupName = None
+        for crawler in data:
+            if not isinstance(crawler, Crawler) or not crawler.hasVar('frame') or not crawler.hasTag('group'):
+                return False
+
+            if groupName is None:
+                groupName = crawler.tag('group')
+            elif crawler.tag('group') != groupName:
+                return False
+
+        return True
+
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the data accepted by the test (list or tuple of crawlers).
+        """
+        hints = super(Sequence, cls).dispatchHints()
+        hints['dataType'] = (list, tuple)
+
+        return hints
+
+    @staticmethod
+    def collapse(crawlers, parentCrawler=None):
+        """
+        Return a list where the crawlers of file sequences are replaced by sequence crawlers.
+
+        The sequence is placed at the position of its first crawler in the input list.
+        """
+        groups = {}
+        for crawler in crawlers:
+            if crawler.hasVar('frame') and crawler.hasTag('group'):
+                groups.setdefault(crawler.tag('group'), []).append(crawler)
+
+        result = []
+        for crawler in crawlers:
+            if not crawler.hasVar('frame') or not crawler.hasTag('group'):
+                result.append(crawler)
+                continue
+
+            frameCrawlers = groups.pop(crawler.tag('group'), None)
+            if frameCrawlers is not None:
+                sequence = Sequence(frameCrawlers, parentCrawler)
+                sequence.setVar('type', 'sequence')
+                result.append(sequence)
+
+        return result
+
+    @staticmethod
+    def createFromFrames(frameCrawler, frames, parentCrawler=None):
+        """
+        Return a sequence crawler based on the crawler of one of its frames and the list of frames.
+
+        It avoids creating a crawler per frame, the variables that are not computed
+        per frame are expected to be the same for all frames of the sequence.
+        """
+        frames = sorted(frames)
+
+        sequence = Sequence([frameCrawler], parentCrawler)
+        sequence.setVar('type', 'sequence')
+        sequence.setVar('frameRanges', Sequence.__computeFrameRanges(frames))
+        sequence.setVar('firstFrame', frames[0])
+        sequence.setVar('lastFrame', frames[-1])
+
+        return sequence
+
+    @staticmethod
+    def parseFileName(fileName):
+        """
+        Return a tuple (pattern, frame) when the file name follows the naming of the frames (otherwise None).
+
+        The pattern is the file name where the frame is replaced by "#" (one per
+        digit), it is used to group the file names of the same sequence.
+        """
+        match = Sequence.__standardFrameRegex.match(fileName) or Sequence.__ambiguousFrameRegex.match(fileName)
+        if match is None:
+            return None
+
+        prefix, frame, suffix = match.groups()
+        return (prefix + '#' * len(frame) + (suffix or ''), int(frame))
+
+    @classmethod
+    def __computeFrameRanges(cls, frames):
+        """
+        Return a list of [start, end] ranges based on the (sorted) frames.
+        """
+        result = []
+        for frame in frames:
+            if result and frame <= result[-1][1] + 1:
+                result[-1][1] = max(frame, result[-1][1])
+            else:
+                result.append([frame, frame])
+
+        return result
+
+
+# registration
+Crawler.register(
+    'sequence',
+    Sequence
+)
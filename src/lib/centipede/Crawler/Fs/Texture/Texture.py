@@ -5,6 +5,8 @@ class Texture(Oiio):
     Custom crawler used to detect textures.
     """
 
+    __slots__ = ()
+
     __groupTextures = True
 
     def __init__(self, *args, **kwargs):
@@ -49,6 +51,16 @@ class Texture(Oiio):
 
         return (cls.__parseUDIM(pathHolder) is not None)
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the texture files accepted by the test.
+        """
+        hints = super(Texture, cls).dispatchHints()
+        hints['extensions'] = ['exr', 'tif']
+
+        return hints
+
     @classmethod
     def __parseUDIM(cls, pathHolder):
         """
@@ -77,7 +89,7 @@ class Texture(Oiio):
         """
         Update the group tag.
         """
-        if 'assetName' not in self.varNames() or 'variant' not in self.varNames():
+        if not self.hasVar('assetName') or not self.hasVar('variant'):
             return
 
         self.setTag(
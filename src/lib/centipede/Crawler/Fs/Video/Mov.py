@@ -8,6 +8,8 @@ class Mov(Video):
     Mov crawler.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a Mov crawler.
@@ -64,6 +66,16 @@ class Mov(Video):
 
         return pathHolder.ext() == 'mov'
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the mov files accepted by the test.
+        """
+        hints = super(Mov, cls).dispatchHints()
+        hints['extensions'] = ['mov']
+
+        return hints
+
 
 # registration
 Mov.register(
@@ -8,6 +8,8 @@ class Video(File):
     Abstracted video crawler.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a video crawler.
@@ -1,6 +1,8 @@
 from .FsPath import FsPath
 from .File import File
 from .Directory import Directory
+from .CrawlCache import CrawlCache
+from .Sequence import Sequence
 
 from . import Image
 from . import Lut
@@ -6,6 +6,8 @@ class Hashmap(Crawler):
     Hashmap crawler to store key/value data.
     """
 
+    __slots__ = ()
+
     def __init__(self, data, parentCrawler=None):
         """
         Create a Hashmap crawler.
@@ -88,6 +90,16 @@ class Hashmap(Crawler):
         """
         return isinstance(data, dict)
 
+    @classmethod
+    def dispatchHints(cls):
+        """
+        Return the hints about the data accepted by the test (dictionaries).
+        """
+        hints = super(Hashmap, cls).dispatchHints()
+        hints['dataType'] = dict
+
+        return hints
+
 
 Crawler.register(
     'hashmap',
@@ -0,0 +1,106 @@
+import os
+from .Crawler import Crawler
+from .CrawlerMatcher import CrawlerMatcher
+
+class CrawlerIndex(object):
+    """
+    Inverted index over a list of crawlers used to serve multiple crawler matchers.
+
+    The crawlers are indexed by type once, the variables used by the matchers
+    are indexed by value on demand (only once per variable name). Therefore,
+    the crawlers matched by each matcher are computed from the index (only the
+    candidates are tested by the matcher), rather than testing the whole list
+    of crawlers per matcher. It can be passed in place of a list of crawlers
+    to TaskHolder.query, TaskHolder.addCrawlers and Dispatcher.dispatch:
+        crawlerIndex = CrawlerIndex(crawlers)
+        for taskHolder in taskHolders:
+            taskHolder.query(crawlerIndex)
+    """
+
+    __missingValue = object()
+
+    def __init__(self, crawlers):
+        """
+        Create a crawler index object.
+        """
+        self.__crawlers = list(crawlers)
+        self.__varIndexes = {}
+
+        # indexing the crawlers by type
+        self.__typeIndex = {}
+        for position, crawler in enumerate(self.__crawlers):
+            assert isinstance(crawler, Crawler), \
+                "Invalid crawler type!"
+
+            crawlerType = crawler.varOr('type')
+            self.__typeIndex.setdefault(crawlerType, []).append(position)
+
+    def crawlers(self):
+        """
+        Return a list of the indexed crawlers.
+        """
+        return list(self.__crawlers)
+
+    def match(self, crawlerMatcher):
+        """
+        Return a list of the crawlers matched by the crawler matcher (in the same order they were indexed).
+        """
+        assert isinstance(crawlerMatcher, CrawlerMatcher), \
+            "Invalid CrawlerMatcher type!"
+
+        candidates = None
+
+        # candidates based on the type
+        matchTypeSet = crawlerMatcher.matchTypeSet()
+        if matchTypeSet is not None:
+            candidates = set()
+            for matchType in matchTypeSet:
+                candidates.update(self.__typeIndex.get(matchType, []))
+
+        # narrowing the candidates based on the variables that are matched
+        # by exact values
+        for varName in crawlerMatcher.matchVarNames():
+            if candidates is not None and not candidates:
+                break
+
+            exactValues = crawlerMatcher.matchVarExactValues(varName)
+            if exactValues is None:
+                continue
+
+            varIndex = self.__varIndex(varName)
+            varCandidates = set()
+            for value in exactValues:
+                varCandidates.update(varIndex.get(value, []))
+
+            if candidates is None:
+                candidates = varCandidates
+            else:
+                candidates.intersection_update(varCandidates)
+
+        if candidates is None:
+            candidates = range(len(self.__crawlers))
+        else:
+            candidates = sorted(candidates)
+
+        # the candidates are tested by the matcher (glob patterns)
+        return list(filter(
+            crawlerMatcher.match,
+            map(lambda x: self.__crawlers[x], candidates)
+        ))
+
+    def __varIndex(self, varName):
+        """
+        Return a dict containing the value of the variable as key and the list of crawler positions as value.
+        """
+        if varName not in self.__varIndexes:
+            varIndex = {}
+            for position, crawler in enumerate(self.__crawlers):
+                value = crawler.varOr(varName, self.__missingValue)
+                if value is self.__missingValue:
+                    continue
+
+                varIndex.setdefault(os.path.normcase(str(value)), []).append(position)
+
+            self.__varIndexes[varName] = varIndex
+
+        return self.__varIndexes[varName]
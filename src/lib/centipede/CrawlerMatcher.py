@@ -1,11 +1,21 @@
-from fnmatch import fnmatch
+import os
+import re
+from fnmatch import translate
 from .Crawler import Crawler
 
 class CrawlerMatcher(object):
     """
     Used to check if a crawler meets the specification of the matcher.
+
+    The specification is compiled once: the crawler types are resolved to a
+    set of registered type names (computed again when new crawler types are
+    registered) and the glob patterns of the variables are compiled to regular
+    expressions (values without glob syntax are compared directly).
     """
 
+    __globCharacters = re.compile('[*?[]')
+    __missingValue = object()
+
     def __init__(self, matchTypes=[], matchVars={}):
         """
         Create a crawler matcher object.
@@ -31,6 +41,28 @@ class CrawlerMatcher(object):
         """
         return self.__matchVars[varName]
 
+    def matchTypeSet(self):
+        """
+        Return a frozenset of registered type names matched by the matcher (or None when any type is matched).
+        """
+        if not self.__matchTypes:
+            return None
+
+        if self.__typeSetVersion != Crawler.registrationVersion():
+            self.__compileTypeSet()
+
+        return self.__typeSet
+
+    def matchVarExactValues(self, varName):
+        """
+        Return a frozenset of values (as strings) matched by the variable (or None when it uses glob syntax).
+        """
+        for compiledVarName, exactValues, patterns in self.__compiledVars:
+            if compiledVarName == varName:
+                return None if patterns else exactValues
+
+        return None
+
     def match(self, crawler):
         """
         Return a boolean telling if the crawler matches.
@@ -42,39 +74,63 @@ class CrawlerMatcher(object):
         assert isinstance(crawler, Crawler), \
             "Invalid crawler type!"
 
-        crawlerType = crawler.var('type')
-        foundType = not self.matchTypes()
-        for matchType in self.matchTypes():
-            registeredTypes = Crawler.registeredSubTypes(matchType)
-            if crawlerType in registeredTypes:
-                foundType = True
-                break
+        if self.__matchTypes:
+            if self.__typeSetVersion != Crawler.registrationVersion():
+                self.__compileTypeSet()
 
-        if not foundType:
-            return False
+            if crawler.var('type') not in self.__typeSet:
+                return False
 
-        for varName in self.matchVarNames():
+        for varName, exactValues, patterns in self.__compiledVars:
 
             # checking if variable is part of the crawler
-            if varName not in crawler.varNames():
+            crawlerVarValue = crawler.varOr(varName, self.__missingValue)
+            if crawlerVarValue is self.__missingValue:
+                return False
+
+            crawlerVarValue = os.path.normcase(str(crawlerVarValue))
+            if crawlerVarValue in exactValues:
+                continue
+
+            for pattern in patterns:
+                if pattern.match(crawlerVarValue):
+                    break
+            else:
                 return False
 
-            matchVarValue = self.matchVar(varName)
+        return True
+
+    def __compileTypeSet(self):
+        """
+        Compute the set of registered type names matched by the crawler types.
+        """
+        typeSet = set()
+        for matchType in self.__matchTypes:
+            typeSet.update(Crawler.registeredSubTypeSet(matchType))
+
+        self.__typeSet = frozenset(typeSet)
+        self.__typeSetVersion = Crawler.registrationVersion()
+
+    def __compileVars(self):
+        """
+        Compile the variables used to match the crawler.
+        """
+        self.__compiledVars = []
+        for varName, matchVarValue in self.__matchVars.items():
 
             # the value can be a list of possibiblities
             if not isinstance(matchVarValue, list):
                 matchVarValue = [matchVarValue]
 
-            foundValueValue = False
-            for value in matchVarValue:
-                if fnmatch(str(crawler.var(varName)), str(value)):
-                    foundValueValue = True
-                    break
+            exactValues = set()
+            patterns = []
+            for value in map(lambda x: os.path.normcase(str(x)), matchVarValue):
+                if self.__globCharacters.search(value):
+                    patterns.append(re.compile(translate(value)))
+                else:
+                    exactValues.add(value)
 
-            if not foundValueValue:
-                return False
-
-        return True
+            self.__compiledVars.append((varName, frozenset(exactValues), patterns))
 
     def __setMatchTypes(self, matchTypes):
         """
@@ -86,6 +142,8 @@ class CrawlerMatcher(object):
             "Invalid list!"
 
         self.__matchTypes = list(matchTypes)
+        self.__typeSet = frozenset()
+        self.__typeSetVersion = None
 
     def __setMatchVars(self, matchVars):
         """
@@ -97,3 +155,4 @@ class CrawlerMatcher(object):
             "Invalid dict!"
 
         self.__matchVars = dict(matchVars)
+        self.__compileVars()
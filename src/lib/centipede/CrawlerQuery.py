@@ -1,5 +1,6 @@
 from .Template import Template
 from .CrawlerMatcher import CrawlerMatcher
+from .CrawlerIndex import CrawlerIndex
 from collections import OrderedDict
 
 class CrawlerQuery(object):
@@ -36,17 +37,34 @@ class CrawlerQuery(object):
     def query(self, crawlers, vars={}):
         """
         Return a dict containg the matched crawler as key and resolved template as value.
-        """
-        validCrawlers = {}
-        for crawler in crawlers:
-            if self.crawlerMatcher().match(crawler):
-                filterTemplateValue = self.filterTemplate().valueFromCrawler(crawler, vars)
-
-                # if the value of the filter is 0 or false the crawler is ignored
-                if str(filterTemplateValue).lower() in ['false', '0']:
-                    continue
 
-                validCrawlers[crawler] = self.targetTemplate().valueFromCrawler(crawler, vars)
+        The crawlers can be any iterable (for instance the generator returned
+        by Crawler.iterGlob), they are consumed in a single pass. When querying
+        the same crawlers through multiple queries a crawler index can be used
+        instead (@see CrawlerIndex).
+        """
+        if isinstance(crawlers, CrawlerIndex):
+            matchedCrawlers = crawlers.match(self.crawlerMatcher())
+        else:
+            matchedCrawlers = list(filter(self.crawlerMatcher().match, crawlers))
+
+        # the existence of the required paths is checked once per path
+        # during the query
+        Template.beginExistenceCache()
+        try:
+            # if the value of the filter is 0 or false the crawler is ignored
+            filterTemplateValues = self.filterTemplate().valuesFromCrawlers(matchedCrawlers, vars)
+            matchedCrawlers = [
+                crawler for crawler, filterTemplateValue in zip(matchedCrawlers, filterTemplateValues)
+                if str(filterTemplateValue).lower() not in ['false', '0']
+            ]
+
+            validCrawlers = dict(zip(
+                matchedCrawlers,
+                self.targetTemplate().valuesFromCrawlers(matchedCrawlers, vars)
+            ))
+        finally:
+            Template.endExistenceCache()
 
         # sorting result
         result = OrderedDict()
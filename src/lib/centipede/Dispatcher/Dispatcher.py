@@ -1,6 +1,8 @@
 import os
 import json
 from ..TaskHolder import TaskHolder
+from ..Template import Template
+from ..Tracer import Tracer
 
 class DispatcherTypeNotFoundError(Exception):
     """Dispatcher type not found error."""
@@ -100,14 +102,21 @@ class Dispatcher(object):
         # setting the verbose ouput to the tasks in place
         self.__setVerboseOutput(clonedTaskHolder)
 
-        clonedTaskHolder.addCrawlers(crawlers)
+        # the existence of the required paths is checked once per path
+        # while querying the crawlers
+        Template.beginExistenceCache()
+        try:
+            clonedTaskHolder.addCrawlers(crawlers)
+        finally:
+            Template.endExistenceCache()
 
         # in case the task does not have any crawlers means there is nothing
         # to be executed, returning right away.
         if len(clonedTaskHolder.task().crawlers()) == 0:
             return []
 
-        return self._perform(clonedTaskHolder)
+        with Tracer.get().scope('dispatch', self.type(), task=clonedTaskHolder.task().type()):
+            return self._perform(clonedTaskHolder)
 
     def toJson(self):
         """
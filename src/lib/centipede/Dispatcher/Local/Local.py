@@ -32,10 +32,34 @@ class Local(Dispatcher):
     Dispatches the task holder as sub-process and returns
     the proccess id. The sub-process is executed in a separated
     thread by default.
+
+    The option "runWorkers" tells the number of tasks that can be executed at
+    the same time by the sub-process, where sibling sub task holders are executed
+    concurrently (@see TaskHolder.run). By default it is driven by the environment
+    variable CENTIPEDE_LOCAL_RUN_WORKERS (0 executes them one after another).
+
+    The option "runChunkSize" tells the number of crawlers per chunk used to
+    stream the output of the tasks to the sub task holders (@see TaskHolder.run).
+    By default it is driven by the environment variable CENTIPEDE_LOCAL_RUN_CHUNK_SIZE
+    (0 disables the streaming).
+
+    The option "runProcesses" tells the number of processes used to perform the
+    chunks of the tasks that can be split (dispatch.split), the same way they are
+    split by the renderfarm dispatcher (@see TaskHolder.run). By default it is driven
+    by the environment variable CENTIPEDE_LOCAL_RUN_PROCESSES (0 performs them in the
+    sub-process itself).
+
+    The option "runIncremental" tells the sub-process to skip the crawlers whose
+    targets are already up to date (@see TaskHolder.run). By default it is driven
+    by the environment variable CENTIPEDE_LOCAL_RUN_INCREMENTAL (0 disables it).
     """
 
     __runningThreads = []
     __defaultAwaitExecution = False
+    __defaultRunWorkers = int(os.environ.get('CENTIPEDE_LOCAL_RUN_WORKERS', 0))
+    __defaultRunChunkSize = int(os.environ.get('CENTIPEDE_LOCAL_RUN_CHUNK_SIZE', 0))
+    __defaultRunProcesses = int(os.environ.get('CENTIPEDE_LOCAL_RUN_PROCESSES', 0))
+    __defaultRunIncremental = bool(int(os.environ.get('CENTIPEDE_LOCAL_RUN_INCREMENTAL', 0)))
 
     def __init__(self, *args, **kwargs):
         """
@@ -48,12 +72,36 @@ class Local(Dispatcher):
             self.__defaultAwaitExecution
         )
 
+        self.setOption(
+            "runWorkers",
+            self.__defaultRunWorkers
+        )
+
+        self.setOption(
+            "runChunkSize",
+            self.__defaultRunChunkSize
+        )
+
+        self.setOption(
+            "runProcesses",
+            self.__defaultRunProcesses
+        )
+
+        self.setOption(
+            "runIncremental",
+            self.__defaultRunIncremental
+        )
+
     def _perform(self, taskHolder):
         """
         Execute the dispatcher.
         """
         self.cleanup()
 
+        incrementalArgs = []
+        if self.option('runIncremental', taskHolder.task()):
+            incrementalArgs.append('--incremental')
+
         processExecution = ProcessExecution(
             [
                 'upython',
@@ -64,8 +112,14 @@ class Local(Dispatcher):
                     "aux",
                     "execute-local.py"
                 ),
-                self.__bakeTaskHolderToJson(taskHolder)
-            ],
+                self.__bakeTaskHolderToJson(taskHolder),
+                '--workers',
+                str(self.option('runWorkers', taskHolder.task())),
+                '--chunk-size',
+                str(self.option('runChunkSize', taskHolder.task())),
+                '--processes',
+                str(self.option('runProcesses', taskHolder.task()))
+            ] + incrementalArgs,
             self.option('env'),
             shell=True,
             redirectStderrToStdout=True
@@ -1,15 +1,28 @@
 import argparse
 from centipede.TaskHolder import TaskHolder
+from centipede.Tracer import Tracer
 
-def __run(data):
+def __run(data, workers=0, chunkSize=0, processes=0, incremental=False):
     """
     Execute the taskHolder.
     """
+    # recording a trace when CENTIPEDE_TRACE_FILE is defined
+    traceRecorder = Tracer.get().recordFromEnvironment()
+
     # loading task holder and running it
-    with open(data) as f:
-        TaskHolder.createFromJson(
-            f.read()
-        ).run()
+    try:
+        with open(data) as f:
+            TaskHolder.createFromJson(
+                f.read()
+            ).run(
+                workers=workers,
+                chunkSize=chunkSize,
+                processes=processes,
+                incremental=incremental
+            )
+    finally:
+        if traceRecorder is not None:
+            Tracer.get().finishRecording(traceRecorder)
 
 
 # command-line interface
@@ -22,7 +35,34 @@ parser.add_argument(
     help='json file containing the serialized task holder that should be executed'
 )
 
+parser.add_argument(
+    '--workers',
+    type=int,
+    default=0,
+    help='number of tasks that can be executed at the same time (sibling sub task holders)'
+)
+
+parser.add_argument(
+    '--chunk-size',
+    type=int,
+    default=0,
+    help='number of crawlers per chunk used to stream the output of the tasks to the sub task holders'
+)
+
+parser.add_argument(
+    '--processes',
+    type=int,
+    default=0,
+    help='number of processes used to perform the chunks of the tasks that can be split (dispatch.split)'
+)
+
+parser.add_argument(
+    '--incremental',
+    action='store_true',
+    help='skip the crawlers whose targets are already up to date'
+)
+
 # executing it
 if __name__ == "__main__":
     args = parser.parse_args()
-    __run(args.data)
+    __run(args.data, args.workers, args.chunk_size, args.processes, args.incremental)
@@ -7,6 +7,7 @@ from collections import OrderedDict
 from centipede.Dispatcher import Dispatcher
 from centipede.Crawler import Crawler
 from centipede.TaskHolder import TaskHolder
+from centipede.Tracer import Tracer
 
 def __runCollapsed(data, taskHolder, dataJsonFile):
     """
@@ -64,8 +65,7 @@ def __runCollapsed(data, taskHolder, dataJsonFile):
     crawlers = []
     for taskInputFilePath in taskInputFilePaths:
         with open(taskInputFilePath) as jsonFile:
-            serializedCrawlers = json.load(jsonFile)
-            crawlers += list(map(lambda x: Crawler.createFromJson(x), serializedCrawlers))
+            crawlers += Crawler.deserializeMany(jsonFile.read())
 
     dispatcher = Dispatcher.createFromJson(data['dispatcher'])
     dispatchedIds = dispatcher.dispatch(
@@ -130,12 +130,7 @@ def __runExpanded(data, taskHolder, rangeStart, rangeEnd):
 
     # writing resulted crawlers
     with open(taskResultFilePath, 'w') as jsonFile:
-        data = list(map(lambda x: x.toJson(), outputCrawlers))
-        json.dump(
-            data,
-            jsonFile,
-            indent=4
-        )
+        jsonFile.write(Crawler.serializeMany(outputCrawlers))
 
 def __run(dataJsonFile, rangeStart=None, rangeEnd=None):
     """
@@ -197,8 +192,15 @@ parser.add_argument(
 if __name__ == "__main__":
     args = parser.parse_args()
 
-    __run(
-        args.data,
-        args.range_start,
-        args.range_end
-    )
+    # recording a trace when CENTIPEDE_TRACE_FILE is defined
+    traceRecorder = Tracer.get().recordFromEnvironment()
+
+    try:
+        __run(
+            args.data,
+            args.range_start,
+            args.range_end
+        )
+    finally:
+        if traceRecorder is not None:
+            Tracer.get().finishRecording(traceRecorder)
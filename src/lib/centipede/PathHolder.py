@@ -1,11 +1,31 @@
 import os
+import stat
 
 class PathHolder(object):
     """
     Provides quick access to query information about the path.
+
+    The metadata about the path (existence, type and size) is resolved
+    through a single stat call that is cached by the path holder. Optionally,
+    the stat information can be provided during the construction either as
+    an "os.stat_result" or as an "os.DirEntry" (returned by os.scandir). The
+    type and existence of a directory entry are taken from the directory
+    listing itself (the entry is not retained), so only the size may need to
+    query the file system.
     """
 
-    def __init__(self, path):
+    __slots__ = (
+        '__path',
+        '__basename',
+        '__name',
+        '__pathExists',
+        '__isDirectory',
+        '__size',
+        '__ext',
+        '__stat'
+    )
+
+    def __init__(self, path, statResult=None):
         """
         Create a path holder object.
         """
@@ -16,16 +36,22 @@ class PathHolder(object):
         self.__isDirectory = None
         self.__size = None
         self.__ext = None
+        self.__stat = None
 
         # setting path
         self.__setPath(path)
 
+        # setting pre-computed stat information
+        if statResult is not None:
+            self.__setStat(statResult)
+
     def isDirectory(self):
         """
         Return a boolean telling if the path is a directory.
         """
         if self.__isDirectory is None:
-            self.__isDirectory = os.path.isdir(self.path())
+            statResult = self.stat()
+            self.__isDirectory = statResult is not None and stat.S_ISDIR(statResult.st_mode)
 
         return self.__isDirectory
 
@@ -49,10 +75,32 @@ class PathHolder(object):
         Return the size of the file.
         """
         if self.__size is None:
-            self.__size = os.stat(self.path()).st_size
+            statResult = self.stat()
+
+            # querying the file system again to raise the proper error
+            if statResult is None:
+                statResult = os.stat(self.path())
+
+            self.__size = statResult.st_size
 
         return self.__size
 
+    def stat(self):
+        """
+        Return the stat result about the path (or None when the path does not exist).
+
+        The stat is only queried once, following calls return the cached value.
+        """
+        if self.__stat is None and self.__pathExists is not False:
+            try:
+                self.__stat = os.stat(self.path())
+            except OSError:
+                self.__pathExists = False
+            else:
+                self.__pathExists = True
+
+        return self.__stat
+
     def baseName(self):
         """
         Return the base name about the path.
@@ -80,7 +128,7 @@ class PathHolder(object):
         Return a boolean telling if the path exists.
         """
         if self.__pathExists is None:
-            self.__pathExists = os.path.exists(self.path())
+            self.stat()
 
         return self.__pathExists
 
@@ -104,3 +152,25 @@ class PathHolder(object):
             cleanedPath = os.sep + cleanedPath
 
         self.__path = cleanedPath
+
+    def __setStat(self, statResult):
+        """
+        Set the pre-computed stat information to the path holder.
+
+        @private
+        """
+        # directory entry (os.scandir), the type comes from the directory
+        # listing (no need to query the file system on most platforms)
+        if hasattr(statResult, 'is_dir'):
+            try:
+                self.__isDirectory = statResult.is_dir()
+            except OSError:
+                self.__isDirectory = False
+
+            # entries listed from the parent directory are known to exist,
+            # except for symlinks where the target may be missing
+            if not statResult.is_symlink():
+                self.__pathExists = True
+        else:
+            self.__stat = statResult
+            self.__pathExists = True
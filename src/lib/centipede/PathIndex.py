@@ -0,0 +1,298 @@
+import os
+import time
+import threading
+from multiprocessing.pool import ThreadPool
+
+# compatibility with python 2/3
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
+
+class PathIndex(object):
+    """
+    Service used to find files under directory trees (used by findpath and rfindpath).
+
+    The contents of the directories are cached by the index. A cached directory is
+    only listed again when its modification time changes, the modification time is
+    checked at most once per refresh interval (CENTIPEDE_PATHINDEX_REFRESH_INTERVAL,
+    1 second by default). Use invalidate to discard the cached information about paths
+    modified by the current process (the outputs of tasks are invalidated automatically).
+
+    Each directory used as start path to find files (@see find) gets a file name
+    index covering its tree. The depth of the tree covered by the index can be
+    limited (CENTIPEDE_PATHINDEX_MAX_DEPTH, unlimited by default), where the
+    start path is at depth 0. When the index is created, the tree is scanned
+    breadth first where the directories of each level can be listed in parallel
+    (CENTIPEDE_PATHINDEX_WORKERS, disabled by default).
+
+    Also, make sure you always query the singleton instance through the "get"
+    method.
+    """
+
+    __singleton = None
+    __refreshIntervalEnv = 'CENTIPEDE_PATHINDEX_REFRESH_INTERVAL'
+    __workersEnv = 'CENTIPEDE_PATHINDEX_WORKERS'
+    __maxDepthEnv = 'CENTIPEDE_PATHINDEX_MAX_DEPTH'
+
+    # directories modified in the last seconds are listed again, since further
+    # modifications may happen within the resolution of the modification time
+    __minimumAge = 2.0
+
+    def __init__(self):
+        """
+        Create a path index object (@See PathIndex.get).
+        """
+        assert self.__singleton is None, "Can only have one instance!"
+
+        self.__lock = threading.RLock()
+        self.__directories = {}
+        self.__fileNameIndexes = {}
+        self.setRefreshInterval(float(os.environ.get(self.__refreshIntervalEnv, 1.0)))
+        self.setWorkers(int(os.environ.get(self.__workersEnv, 0)))
+        self.setMaxDepth(int(os.environ.get(self.__maxDepthEnv, -1)))
+
+    def refreshInterval(self):
+        """
+        Return the interval (in seconds) used to check if the cached directories have been modified.
+        """
+        return self.__refreshInterval
+
+    def setRefreshInterval(self, refreshInterval):
+        """
+        Set the interval (in seconds) used to check if the cached directories have been modified.
+        """
+        self.__refreshInterval = refreshInterval
+
+    def workers(self):
+        """
+        Return the number of threads used to list the directories when a file name index is created.
+        """
+        return self.__workers
+
+    def setWorkers(self, workers):
+        """
+        Set the number of threads used to list the directories when a file name index is created.
+        """
+        self.__workers = workers
+
+    def maxDepth(self):
+        """
+        Return the maximum depth of the directories covered by the file name indexes (-1 means unlimited).
+        """
+        return self.__maxDepth
+
+    def setMaxDepth(self, maxDepth):
+        """
+        Set the maximum depth of the directories covered by the file name indexes (-1 means unlimited).
+        """
+        with self.__lock:
+            self.__maxDepth = maxDepth
+            self.__fileNameIndexes.clear()
+
+    def find(self, fileName, startPath):
+        """
+        Return the path for the file name found recursively under the start path (or None when not found).
+
+        The start path itself is checked first, then its sub directories (depth first)
+        up to the maximum depth (@see setMaxDepth).
+        """
+        startPath = os.path.normpath(startPath)
+        nameParts = os.path.normpath(fileName).split(os.sep)
+
+        with self.__lock:
+            fileNameIndex = self.__fileNameIndex(startPath)
+
+        for directoryPath in fileNameIndex.get(nameParts[0], []):
+            resultPath = os.path.join(directoryPath, *nameParts)
+            if len(nameParts) == 1 or os.path.exists(resultPath):
+                return resultPath
+
+        return None
+
+    def rfind(self, fileName, startPath, finalPath=None):
+        """
+        Return the path for the file name found under the start path or its parent directories (or None when not found).
+
+        The search stops when reaching the final path (or the root of the file system).
+        """
+        nameParts = os.path.normpath(fileName).split(os.sep)
+        path = startPath
+        while True:
+            with self.__lock:
+                directory = self.__directory(path)
+
+            if directory is not None and nameParts[0] in directory['names']:
+                resultPath = os.path.join(path, fileName)
+                if len(nameParts) == 1 or os.path.exists(resultPath):
+                    return resultPath
+
+            if path == finalPath or path == os.sep:
+                return None
+
+            path = os.path.dirname(path)
+
+    def invalidate(self, path=None):
+        """
+        Discard the cached information about the path and its parent directory (or everything when path is None).
+
+        The modification time of the other parent directories is checked again
+        in the next query, since new directories may have been created under them.
+        """
+        with self.__lock:
+            if path is None:
+                self.__directories.clear()
+                self.__fileNameIndexes.clear()
+                return
+
+            path = os.path.normpath(path)
+            for invalidPath in (path, os.path.dirname(path)):
+                self.__directories.pop(invalidPath, None)
+
+            # the other parent directories are checked again for modifications
+            parentPath = os.path.dirname(os.path.dirname(path))
+            while True:
+                directory = self.__directories.get(parentPath)
+                if directory is not None:
+                    directory['validatedTime'] = 0.0
+
+                if os.path.dirname(parentPath) == parentPath:
+                    break
+                parentPath = os.path.dirname(parentPath)
+
+            for startPath in list(self.__fileNameIndexes.keys()):
+                if path == startPath or path.startswith(startPath.rstrip(os.sep) + os.sep):
+                    del self.__fileNameIndexes[startPath]
+
+    @classmethod
+    def get(cls):
+        """
+        Return the singleton path index instance.
+        """
+        if cls.__singleton is None:
+            cls.__singleton = PathIndex()
+
+        return cls.__singleton
+
+    def __fileNameIndex(self, startPath):
+        """
+        Return a dict containing the file name as key and the list of parent directories as value (depth first order).
+        """
+        fileNameIndex = self.__fileNameIndexes.get(startPath)
+        if fileNameIndex is not None and time.time() - fileNameIndex['validatedTime'] < self.__refreshInterval:
+            return fileNameIndex['names']
+
+        # listing the directories of the tree in parallel (breadth first)
+        if fileNameIndex is None and self.__workers > 0:
+            self.__prefetch(startPath)
+
+        names = {}
+        visited = set()
+        pendingPaths = [(startPath, 0)]
+        while pendingPaths:
+            path, depth = pendingPaths.pop()
+            directory = self.__directory(path)
+
+            # skipping directories visited through symlinks
+            if directory is None or directory['id'] in visited:
+                continue
+            visited.add(directory['id'])
+
+            for name in directory['names']:
+                names.setdefault(name, []).append(path)
+
+            if self.__maxDepth < 0 or depth < self.__maxDepth:
+                pendingPaths += [(os.path.join(path, x), depth + 1) for x in reversed(directory['subdirectories'])]
+
+        self.__fileNameIndexes[startPath] = {
+            'validatedTime': time.time(),
+            'names': names
+        }
+
+        return names
+
+    def __prefetch(self, startPath):
+        """
+        List the directories of the tree in parallel, level by level.
+        """
+        pool = ThreadPool(self.__workers)
+        try:
+            visited = set()
+            paths = [startPath]
+            depth = 0
+            while paths and (self.__maxDepth < 0 or depth <= self.__maxDepth):
+                listings = pool.map(self.__listDirectory, paths)
+                nextPaths = []
+                for path, directory in zip(paths, listings):
+                    # skipping directories visited through symlinks
+                    if directory is None or directory['id'] in visited:
+                        continue
+                    visited.add(directory['id'])
+
+                    self.__directories[path] = directory
+                    nextPaths += [os.path.join(path, x) for x in directory['subdirectories']]
+                paths = nextPaths
+                depth += 1
+        finally:
+            pool.close()
+            pool.join()
+
+    def __directory(self, path):
+        """
+        Return the cached information about the directory (or None when it is not a directory).
+        """
+        directory = self.__directories.get(path)
+        currentTime = time.time()
+        if directory is not None and currentTime - directory['validatedTime'] < self.__refreshInterval:
+            return directory
+
+        try:
+            statResult = os.stat(path)
+        except OSError:
+            statResult = None
+
+        if directory is not None and statResult is not None and directory['mtime'] == statResult.st_mtime and \
+                currentTime - statResult.st_mtime >= self.__minimumAge:
+            directory['validatedTime'] = currentTime
+            return directory
+
+        directory = self.__listDirectory(path)
+        if directory is None:
+            self.__directories.pop(path, None)
+        else:
+            self.__directories[path] = directory
+
+        return directory
+
+    @classmethod
+    def __listDirectory(cls, path):
+        """
+        Return a dict describing the contents of the directory (or None when it can not be listed).
+        """
+        try:
+            statResult = os.stat(path)
+            names = set()
+            subdirectories = []
+            if scandir is None:
+                for name in os.listdir(path):
+                    names.add(name)
+                    if os.path.isdir(os.path.join(path, name)):
+                        subdirectories.append(name)
+            else:
+                for entry in scandir(path):
+                    names.add(entry.name)
+                    try:
+                        if entry.is_dir():
+                            subdirectories.append(entry.name)
+                    except OSError:
+                        pass
+        except OSError:
+            return None
+
+        return {
+            'id': (statResult.st_dev, statResult.st_ino),
+            'mtime': statResult.st_mtime,
+            'validatedTime': time.time(),
+            'names': names,
+            'subdirectories': subdirectories
+        }
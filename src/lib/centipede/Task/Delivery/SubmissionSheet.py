@@ -124,7 +124,7 @@ class SubmissionSheet(Task):
         elif fieldName in self.optionNames():
             return self.templateOption(fieldName, crawler=crawler)
         # Finally, the value would be in the crawler
-        elif fieldName in crawler.varNames():
+        elif crawler.hasVar(fieldName):
             return crawler.var(fieldName)
 
     def __writeSpreadsheet(self):
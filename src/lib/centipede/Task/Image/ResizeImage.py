@@ -1,6 +1,5 @@
 import os
 import multiprocessing
-from ...Template import Template
 from ..Task import Task
 
 class ResizeImage(Task):
@@ -30,21 +29,11 @@ class ResizeImage(Task):
         """
         import OpenImageIO as oiio
 
-        for crawler in self.crawlers():
-            width = self.option('width')
-            height = self.option('height')
-
-            # resolving template
-            if isinstance(width, str):
-                width = int(Template(width).valueFromCrawler(
-                    crawler
-                ))
-
-            if isinstance(height, str):
-                height = int(Template(height).valueFromCrawler(
-                    crawler
-                ))
+        crawlers = self.crawlers()
+        widths = self.__resolveSizeOption('width', crawlers)
+        heights = self.__resolveSizeOption('height', crawlers)
 
+        for crawler, width, height in zip(crawlers, widths, heights):
             targetFilePath = self.target(crawler)
 
             # trying to create the directory automatically in case it does not exist
@@ -93,6 +82,16 @@ class ResizeImage(Task):
         # default result based on the target filePath
         return super(ResizeImage, self)._perform()
 
+    def __resolveSizeOption(self, optionName, crawlers):
+        """
+        Return a list containing the value of the size option for each crawler (resolving the template if necessary).
+        """
+        value = self.option(optionName)
+        if isinstance(value, str):
+            return list(map(int, self.optionTemplate(optionName).valuesFromCrawlers(crawlers)))
+
+        return [value] * len(crawlers)
+
 
 # registering task
 Task.register(
@@ -53,7 +53,7 @@ class GafferScene(Task):
                     context.set("targetFile", self.target(crawler))
 
                     # adding frame range information when available
-                    if 'frame' in crawler.varNames():
+                    if crawler.hasVar('frame'):
                         context.setFrame(crawler.var('frame'))
                         context.set("startFrame", crawlerGroup[0].var('frame'))
                         context.set("endFrame", crawlerGroup[-1].var('frame'))
@@ -4,7 +4,6 @@ import tempfile
 import subprocess
 from collections import OrderedDict
 from ..Task import Task
-from ...Template import Template
 
 # compatibility with python 2/3
 try:
@@ -94,7 +93,8 @@ class NukeScript(Task):
 
                 # resolving template if necessary...
                 if isinstance(optionValue, basestring):
-                    options[optionName] = Template(optionValue).valueFromCrawler(
+                    options[optionName] = self.templateOption(
+                        optionName,
                         crawler
                     )
                 else:
@@ -35,7 +35,7 @@ class SGPublish(Task):
         self.__publishData["description"] = self.templateOption('comment', crawler=sourceCrawler)
         self.__publishData["version_number"] = sourceCrawler.var('version')
 
-        if "_sgTask" in sourceCrawler.varNames():
+        if sourceCrawler.hasVar("_sgTask"):
             self.__publishData["task"] = sourceCrawler.var("_sgTask")
 
         publishName = self.templateOption('publishName', crawler=sourceCrawler)
@@ -62,9 +62,9 @@ class SGPublish(Task):
         project = sg.find_one('Project', [['name', 'is', sourceCrawler.var('job')]])
         self.__publishData['project'] = project
 
-        if "shot" in sourceCrawler.varNames() or "assetName" in sourceCrawler.varNames():
-            varName = "shot" if "shot" in sourceCrawler.varNames() else "assetName"
-            varType = "Shot" if "shot" in sourceCrawler.varNames() else "Asset"
+        if sourceCrawler.hasVar("shot") or sourceCrawler.hasVar("assetName"):
+            varName = "shot" if sourceCrawler.hasVar("shot") else "assetName"
+            varType = "Shot" if sourceCrawler.hasVar("shot") else "Asset"
 
             filters = [
                 ['code', 'is', sourceCrawler.var(varName)],
@@ -172,7 +172,7 @@ class SGPublish(Task):
         lastFrame = None
         imageSeqPath = None
         movCrawler = FsPath.createFromPath(movieFilePath)
-        if firstFrame in movCrawler.varNames():
+        if movCrawler.hasVar('firstFrame'):
             firstFrame = movCrawler.var('firstFrame')
             lastFrame = movCrawler.var('lastFrame')
 
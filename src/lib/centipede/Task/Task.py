@@ -1,9 +1,13 @@
+import os
 import json
 import sys
 from ..Resource import Resource
 from ..Crawler.Fs import FsPath
 from ..Crawler import Crawler
 from ..Template import Template
+from .TaskStateStore import TaskStateStore
+from ..Tracer import Tracer
+from ..PathIndex import PathIndex
 from collections import OrderedDict
 
 # compatibility with python 2/3
@@ -35,6 +39,10 @@ class Task(object):
 
     Task Metadata:
         - output.verbose: boolean used to print out the output of the task (default False)
+        - output.incremental: boolean used to skip the crawlers whose targets are up to date (default False)
+        - output.incrementalHash: boolean used to fingerprint the source files by content rather than modification time
+        - dispatch.split: boolean telling the crawlers can be performed in chunks (@see split)
+        - dispatch.splitSize: integer used as size of the chunks (overrides the size used by the dispatcher)
     """
 
     __registered = {}
@@ -150,11 +158,22 @@ class Task(object):
         """
         Return a value resolved by the Template module.
         """
-        value = self.option(name)
+        template = self.optionTemplate(name)
         if crawler:
-            return Template(value).valueFromCrawler(crawler, vars)
+            return template.valueFromCrawler(crawler, vars)
         else:
-            return Template(value).value(vars)
+            return template.value(vars)
+
+    def optionTemplate(self, name):
+        """
+        Return a new template object for an option.
+
+        Creating the template is cheap since the compiled tokens are shared by all
+        templates created for the same string (@see Template). A new template is
+        returned on purpose, impure procedures such as (tmpdir) or (newver) are
+        cached by the template instance and must be resolved again per crawler.
+        """
+        return Template(self.option(name))
 
     def setOption(self, name, value):
         """
@@ -212,6 +231,11 @@ class Task(object):
     def output(self):
         """
         Perform and result a list of crawlers created by task.
+
+        In incremental mode (output.incremental) the crawlers whose targets are up
+        to date (@see TaskStateStore) are not performed again, instead the output
+        crawlers stored when they were performed are used as output. Tasks that can
+        not be split are only skipped when all their crawlers are up to date.
         """
         verbose = self.hasMetadata('output.verbose') and self.metadata('output.verbose')
         if verbose:
@@ -223,10 +247,24 @@ class Task(object):
                 if ctxVarName not in contextVars:
                     contextVars[ctxVarName] = crawler.var(ctxVarName)
 
-        outputCrawlers = self._perform()
+        traceScope = Tracer.get().scope('task', self.type(), crawlers=len(self.crawlers()))
+        with traceScope:
+            if self.hasMetadata('output.incremental') and self.metadata('output.incremental'):
+                outputCrawlers = self.__incrementalPerform()
+            else:
+                outputCrawlers = self._perform()
+
+            if Tracer.get().isEnabled():
+                traceScope.setArg('outputCrawlers', len(outputCrawlers))
+                traceScope.setArg('bytesWritten', self.__bytesWritten(outputCrawlers))
 
-        # Copy all context variables to output crawlers
+        # Copy all context variables to output crawlers, also discarding the
+        # information cached about the paths written by the task (findpath...)
+        pathIndex = PathIndex.get()
         for outputCrawler in outputCrawlers:
+            if outputCrawler.hasVar('filePath'):
+                pathIndex.invalidate(outputCrawler.var('filePath'))
+
             if verbose:
                 sys.stdout.write(
                     '  - {}\n'.format(
@@ -243,6 +281,33 @@ class Task(object):
 
         return outputCrawlers
 
+    def isSplittable(self):
+        """
+        Return a boolean telling if the crawlers of the task can be performed in chunks (dispatch.split).
+        """
+        return bool(self.hasMetadata('dispatch.split') and self.metadata('dispatch.split'))
+
+    def split(self, chunkSize):
+        """
+        Return a list of tasks where each task holds a chunk of the crawlers.
+
+        Only tasks that can be split are divided (@see isSplittable), where the size
+        of the chunks comes from the metadata "dispatch.splitSize" when defined.
+        Otherwise, the result contains only the task itself.
+        """
+        if self.hasMetadata('dispatch.splitSize'):
+            chunkSize = self.metadata('dispatch.splitSize')
+
+        crawlers = self.crawlers()
+        if not self.isSplittable() or chunkSize <= 0 or len(crawlers) <= chunkSize:
+            return [self]
+
+        result = []
+        for index in range(0, len(crawlers), chunkSize):
+            result.append(self.__createSubTask(crawlers[index:index + chunkSize]))
+
+        return result
+
     def clone(self):
         """
         Clone the current task.
@@ -279,13 +344,14 @@ class Task(object):
         for optionName in self.optionNames():
             options[optionName] = self.option(optionName)
 
-        # crawler data
-        crawlerData = []
-        for crawler in self.crawlers():
-            crawlerData.append({
-                'filePath': self.target(crawler),
-                'serializedCrawler': crawler.toJson()
-            })
+        # crawler data (stored in batch, @see Crawler.bakeMany)
+        crawlers = self.crawlers()
+        crawlerData = {}
+        if crawlers:
+            crawlerData = {
+                'filePaths': list(map(self.target, crawlers)),
+                'crawlers': Crawler.bakeMany(crawlers)
+            }
 
         # custom resources
         loadedResources = Resource.get().loaded(ignoreFromEnvironment=True)
@@ -320,6 +386,16 @@ class Task(object):
 
         Task.__registered[name] = taskClass
 
+    @staticmethod
+    def unregister(name):
+        """
+        Remove the registration of a task type.
+        """
+        assert name in Task.__registered, \
+            "No registered task type for \"{0}\"".format(name)
+
+        del Task.__registered[name]
+
     @staticmethod
     def registeredNames():
         """
@@ -349,7 +425,7 @@ class Task(object):
         taskType = contents["type"]
         taskOptions = contents.get("options", {})
         taskMetadata = contents.get("metadata", {})
-        crawlerData = contents.get("crawlerData", [])
+        crawlerData = contents.get("crawlerData", {})
         loadResources = contents.get("resources", [])
 
         # loading resources
@@ -370,15 +446,94 @@ class Task(object):
             task.setMetadata(metadataName, metadataValue)
 
         # adding crawlers
-        for crawlerDataItem in crawlerData:
-            filePath = crawlerDataItem['filePath']
-            crawler = Crawler.createFromJson(
-                crawlerDataItem['serializedCrawler']
-            )
-            task.add(crawler, filePath)
+        if isinstance(crawlerData, dict):
+            crawlers = Crawler.deserializeMany(crawlerData.get('crawlers', []))
+            for crawler, filePath in zip(crawlers, crawlerData.get('filePaths', [])):
+                task.add(crawler, filePath)
+
+        # crawlers serialized individually through Crawler.toJson
+        else:
+            for crawlerDataItem in crawlerData:
+                filePath = crawlerDataItem['filePath']
+                crawler = Crawler.createFromJson(
+                    crawlerDataItem['serializedCrawler']
+                )
+                task.add(crawler, filePath)
 
         return task
 
+    @classmethod
+    def __bytesWritten(cls, outputCrawlers):
+        """
+        Return the total size (in bytes) of the files resulted by the task.
+        """
+        result = 0
+        for outputCrawler in outputCrawlers:
+            filePath = outputCrawler.varOr('filePath')
+            if filePath is not None and os.path.isfile(filePath):
+                result += os.path.getsize(filePath)
+
+        return result
+
+    def __createSubTask(self, crawlers):
+        """
+        Return a new task with the same options and metadata holding only the input crawlers.
+        """
+        subTask = self.__class__(self.type())
+
+        for optionName in self.optionNames():
+            subTask.setOption(optionName, self.option(optionName))
+
+        for metadataName in self.metadataNames():
+            subTask.setMetadata(metadataName, self.metadata(metadataName))
+
+        for crawler in crawlers:
+            subTask.add(crawler, self.target(crawler))
+
+        return subTask
+
+    def __incrementalPerform(self):
+        """
+        Perform only the crawlers that are not up to date returning the output of all crawlers.
+        """
+        taskStateStore = TaskStateStore.default()
+        useContentHash = bool(self.hasMetadata('output.incrementalHash') and self.metadata('output.incrementalHash'))
+
+        upToDateCrawlers = []
+        outdatedCrawlers = []
+        for crawler in self.crawlers():
+            storedOutputCrawlers = None
+            if taskStateStore.isUpToDate(self, crawler, useContentHash):
+                storedOutputCrawlers = taskStateStore.output(self, crawler)
+
+            if storedOutputCrawlers is None:
+                outdatedCrawlers.append(crawler)
+            else:
+                upToDateCrawlers.append((crawler, storedOutputCrawlers))
+
+        # tasks that can not be split need to perform all crawlers together
+        if outdatedCrawlers and not self.isSplittable():
+            upToDateCrawlers = []
+            outdatedCrawlers = self.crawlers()
+
+        performedOutputCrawlers = []
+        if outdatedCrawlers:
+            outdatedTask = self if not upToDateCrawlers else self.__createSubTask(outdatedCrawlers)
+            performedOutputCrawlers = outdatedTask._perform()
+            taskStateStore.update(outdatedTask, outdatedCrawlers, performedOutputCrawlers, useContentHash)
+
+        # the output of the crawlers that are up to date is restored from the store,
+        # skipping the output crawlers that have been produced again
+        outputCrawlers = []
+        fullPaths = set(map(lambda x: x.var('fullPath'), performedOutputCrawlers))
+        for crawler, storedOutputCrawlers in upToDateCrawlers:
+            for outputCrawler in storedOutputCrawlers:
+                if outputCrawler.var('fullPath') not in fullPaths:
+                    fullPaths.add(outputCrawler.var('fullPath'))
+                    outputCrawlers.append(outputCrawler)
+
+        return outputCrawlers + performedOutputCrawlers
+
     def _perform(self):
         """
         For re-implementation: should implement the computation of the task and return a list of crawlers as output.
@@ -0,0 +1,221 @@
+import os
+import json
+import hashlib
+import sqlite3
+import threading
+from ..Crawler import Crawler
+
+class TaskStateStore(object):
+    """
+    Persistent store used by the incremental execution of the tasks (@see Task.output).
+
+    The store is a sqlite database under the store directory. Each entry is keyed
+    by a digest about the task type, the task options, the source path and the
+    target path of a crawler. It holds the fingerprint of the source file, the
+    fingerprint of the target file computed when the task was performed and the
+    output crawlers produced for the crawler (@see output). A crawler is up to date
+    when both fingerprints remain the same.
+
+    The fingerprint of a file is based on its size and modification time. The
+    contents of the source files can be hashed instead (useContentHash), which
+    is slower but detects files restored with a different modification time.
+
+    The default store is located under the directory defined by the environment
+    variable CENTIPEDE_TASK_STATE_DIR (otherwise under "~/.centipede").
+    The database uses the default rollback journal (rather than WAL) so it can be
+    located on a network file system.
+    """
+
+    __fileName = 'taskState.sqlite'
+    __storeDirEnvName = 'CENTIPEDE_TASK_STATE_DIR'
+    __defaultStore = None
+    __hashBlockSize = 1024 * 1024
+
+    def __init__(self, storeDirectory):
+        """
+        Create a task state store object.
+        """
+        self.__storeDirectory = storeDirectory
+        self.__connections = threading.local()
+
+        if not os.path.exists(storeDirectory):
+            os.makedirs(storeDirectory)
+
+        # creating the database
+        self.__connection().execute(
+            'CREATE TABLE IF NOT EXISTS state ('
+            'key TEXT PRIMARY KEY, source TEXT, target TEXT, output TEXT)'
+        )
+
+    def storeDirectory(self):
+        """
+        Return the directory where the store is located.
+        """
+        return self.__storeDirectory
+
+    def isUpToDate(self, task, crawler, useContentHash=False):
+        """
+        Return a boolean telling if the target of the crawler is up to date for the task.
+        """
+        sourcePath = crawler.varOr('filePath')
+        if sourcePath is None:
+            return False
+
+        row = self.__connection().execute(
+            'SELECT source, target FROM state WHERE key=?',
+            (self.__key(task, crawler),)
+        ).fetchone()
+
+        if row is None:
+            return False
+
+        targetFingerprint = self.fingerprint(task.target(crawler))
+        if targetFingerprint is None or json.loads(row[1]) != targetFingerprint:
+            return False
+
+        sourceFingerprint = self.fingerprint(sourcePath, useContentHash)
+        return sourceFingerprint is not None and json.loads(row[0]) == sourceFingerprint
+
+    def output(self, task, crawler):
+        """
+        Return a list of the output crawlers stored for the crawler performed by the task (or None when not stored).
+        """
+        if crawler.varOr('filePath') is None:
+            return None
+
+        row = self.__connection().execute(
+            'SELECT output FROM state WHERE key=?',
+            (self.__key(task, crawler),)
+        ).fetchone()
+
+        if row is None or row[0] is None:
+            return None
+
+        return Crawler.deserializeMany(row[0])
+
+    def update(self, task, crawlers, outputCrawlers=[], useContentHash=False):
+        """
+        Store the current fingerprints and the output crawlers about the crawlers performed by the task.
+
+        Each output crawler is stored for the crawler whose target is the file path of
+        the output crawler. The output crawlers that can not be related to a single
+        crawler are stored for all the crawlers.
+        """
+        targetOutputCrawlers = {}
+        for crawler in crawlers:
+            targetOutputCrawlers[os.path.normpath(task.target(crawler))] = []
+
+        sharedOutputCrawlers = []
+        for outputCrawler in outputCrawlers:
+            filePath = outputCrawler.varOr('filePath')
+            if filePath is not None and os.path.normpath(filePath) in targetOutputCrawlers:
+                targetOutputCrawlers[os.path.normpath(filePath)].append(outputCrawler)
+            else:
+                sharedOutputCrawlers.append(outputCrawler)
+
+        entries = []
+        for crawler in crawlers:
+            sourcePath = crawler.varOr('filePath')
+            if sourcePath is None:
+                continue
+
+            targetPath = task.target(crawler)
+            entries.append(
+                (
+                    self.__key(task, crawler),
+                    json.dumps(self.fingerprint(sourcePath, useContentHash)),
+                    json.dumps(self.fingerprint(targetPath)),
+                    Crawler.serializeMany(
+                        targetOutputCrawlers[os.path.normpath(targetPath)] + sharedOutputCrawlers
+                    )
+                )
+            )
+
+        connection = self.__connection()
+        with connection:
+            connection.executemany(
+                'INSERT OR REPLACE INTO state (key, source, target, output) VALUES (?, ?, ?, ?)',
+                entries
+            )
+
+    def clear(self):
+        """
+        Remove all entries from the store.
+        """
+        connection = self.__connection()
+        with connection:
+            connection.execute('DELETE FROM state')
+
+    @classmethod
+    def fingerprint(cls, path, useContentHash=False):
+        """
+        Return a list describing the contents of the file (or None when it does not exist).
+        """
+        try:
+            statResult = os.stat(path)
+        except (OSError, TypeError, ValueError):
+            return None
+
+        if useContentHash and os.path.isfile(path):
+            contentHash = hashlib.sha1()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(cls.__hashBlockSize), b''):
+                    contentHash.update(block)
+
+            return [statResult.st_size, contentHash.hexdigest()]
+
+        if hasattr(statResult, 'st_mtime_ns'):
+            return [statResult.st_size, statResult.st_mtime_ns]
+
+        return [statResult.st_size, int(statResult.st_mtime * 1e9)]
+
+    @classmethod
+    def default(cls):
+        """
+        Return the default task state store.
+        """
+        storeDirectory = os.environ.get(
+            cls.__storeDirEnvName,
+            os.path.join(os.path.expanduser('~'), '.centipede')
+        )
+
+        if cls.__defaultStore is None or cls.__defaultStore.storeDirectory() != storeDirectory:
+            cls.__defaultStore = TaskStateStore(storeDirectory)
+
+        return cls.__defaultStore
+
+    def __connection(self):
+        """
+        Return the database connection used by the current thread.
+        """
+        if not hasattr(self.__connections, 'connection'):
+            connection = sqlite3.connect(
+                os.path.join(self.__storeDirectory, self.__fileName),
+                timeout=30
+            )
+            connection.execute('PRAGMA journal_mode=DELETE')
+            self.__connections.connection = connection
+
+        return self.__connections.connection
+
+    @classmethod
+    def __key(cls, task, crawler):
+        """
+        Return a digest about the task type, task options, source path and target path of the crawler.
+        """
+        options = {}
+        for optionName in task.optionNames():
+            options[optionName] = task.option(optionName)
+
+        contents = json.dumps(
+            [
+                task.type(),
+                options,
+                os.path.normpath(crawler.var('filePath')),
+                os.path.normpath(task.target(crawler))
+            ],
+            sort_keys=True,
+            default=str
+        )
+
+        return hashlib.sha1(contents.encode('utf-8')).hexdigest()
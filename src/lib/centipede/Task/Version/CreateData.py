@@ -67,6 +67,12 @@ class CreateData(Task):
         """
         return self.__rootPath
 
+    def setRootPath(self, rootPath):
+        """
+        Override the root path (by default the target of the first crawler).
+        """
+        self.__rootPath = rootPath
+
     def configPath(self):
         """
         Return the path about the location for the configuration used by centipede.
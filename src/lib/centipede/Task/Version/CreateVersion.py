@@ -2,6 +2,7 @@ import os
 import time
 from ..Task import Task
 from ...Crawler.Fs import FsPath
+from ...VersionIndex import VersionIndex
 from .CreateData import CreateData
 
 class FileNotUnderDataDirectoryError(Exception):
@@ -78,9 +79,16 @@ class CreateVersion(CreateData):
         Run the task.
 
         We need to wrap this call to make sure the versionPath is created before
-        any of the sub-classes try to write to it through _perform.
+        any of the sub-classes try to write to it through _perform. The version
+        directory is reserved at this point (rather than when the target is
+        computed), in case the version has been taken in the meantime by a
+        concurrent publish the following available version is used instead.
         """
-        os.makedirs(self.versionPath())
+        versionsPath = os.path.dirname(self.versionPath())
+        version = VersionIndex.get().reserve(versionsPath, self.version())
+        if version != self.version():
+            self.setRootPath(os.path.join(versionsPath, VersionIndex.versionName(version)))
+            self.__version = version
 
         return super(CreateVersion, self).output()
 
@@ -134,7 +142,7 @@ class CreateVersion(CreateData):
 
         # Add generic info that is expected to be on the crawler
         for info in self.__genericCrawlerInfo:
-            if info in crawler.varNames():
+            if crawler.hasVar(info):
                 self.addInfo(info, crawler.var(info))
 
         # looking for the version based on the version folder name
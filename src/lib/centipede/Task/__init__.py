@@ -1,4 +1,5 @@
 from .Task import Task
+from .TaskStateStore import TaskStateStore
 from . import Fs
 from . import Image
 from . import ImageSequence
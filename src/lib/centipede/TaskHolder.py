@@ -1,13 +1,81 @@
 import json
+import math
+import threading
+import multiprocessing
+
+# compatibility with python 2/3
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
 from .Task import Task
 from .TaskWrapper import TaskWrapper
 from .Template import Template
 from .CrawlerMatcher import CrawlerMatcher
 from .CrawlerQuery import CrawlerQuery
+from .Crawler import Crawler
+from .Tracer import Tracer
 
 class TaskHolderInvalidVarNameError(Exception):
     """Task holder invalid var name error."""
 
+def _performTaskChunk(contents):
+    """
+    Perform a chunk of a task inside of a worker process (@see _TaskProcessPool).
+    """
+    taskWrapperType, taskWrapperOptions, taskJson = contents
+
+    taskWrapper = TaskWrapper.create(taskWrapperType)
+    for optionName, optionValue in taskWrapperOptions.items():
+        taskWrapper.setOption(optionName, optionValue)
+
+    return Crawler.serializeMany(
+        taskWrapper.run(Task.createFromJson(taskJson))
+    )
+
+class _TaskProcessPool(object):
+    """
+    Pool of processes used to perform the chunks of the tasks that can be split.
+    """
+
+    def __init__(self, processes):
+        """
+        Create a task process pool object.
+        """
+        assert processes > 0, "Invalid number of processes!"
+
+        self.__processes = processes
+        self.__pool = multiprocessing.Pool(processes)
+
+    def processes(self):
+        """
+        Return the number of processes used by the pool.
+        """
+        return self.__processes
+
+    def run(self, taskWrapper, tasks):
+        """
+        Return a generator that performs the tasks yielding their output crawlers (in the same order of the tasks).
+
+        The tasks are performed in parallel by the worker processes, where each
+        output is available as soon as its task and the previous ones are done.
+        """
+        taskWrapperOptions = {}
+        for optionName in taskWrapper.optionNames():
+            taskWrapperOptions[optionName] = taskWrapper.option(optionName)
+
+        contents = [(taskWrapper.type(), taskWrapperOptions, task.toJson()) for task in tasks]
+        for output in self.__pool.imap(_performTaskChunk, contents):
+            yield Crawler.deserializeMany(output)
+
+    def close(self):
+        """
+        Wait for the worker processes to finish and terminate them.
+        """
+        self.__pool.close()
+        self.__pool.join()
+
 class TaskHolder(object):
     """
     Holds task and sub task holders associated with a target template and crawler matcher.
@@ -178,23 +246,7 @@ class TaskHolder(object):
         The crawlers are added to the task using "query" method to resolve
         the target template.
         """
-        for crawler, filePath in self.query(crawlers).items():
-
-            if addTaskHolderVars:
-                # cloning crawler so we can modify it safely
-                crawler = crawler.clone()
-
-                for varName in self.varNames():
-                    crawler.setVar(
-                        varName,
-                        self.var(varName),
-                        varName in self.contextVarNames()
-                    )
-
-            self.__task.add(
-                crawler,
-                filePath
-            )
+        self.__addCrawlersToTask(self.__task, crawlers, addTaskHolderVars)
 
     def crawlerMatcher(self):
         """
@@ -226,11 +278,18 @@ class TaskHolder(object):
     def query(self, crawlers):
         """
         Query crawlers that meet the specification.
+
+        The crawlers can be a list of crawlers or a crawler index (@see CrawlerIndex)
+        shared by multiple task holders.
         """
-        return self.__query.query(
-            crawlers,
-            self.__vars
-        )
+        with Tracer.get().scope('query', self.__task.type()) as traceScope:
+            result = self.__query.query(
+                crawlers,
+                self.__vars
+            )
+            traceScope.setArg('crawlers', len(result))
+
+        return result
 
     def toJson(self, includeSubTaskHolders=True):
         """
@@ -248,16 +307,71 @@ class TaskHolder(object):
         """
         return self.createFromJson(self.toJson(includeSubTaskHolders))
 
-    def run(self, crawlers=[]):
+    def run(self, crawlers=[], workers=0, chunkSize=0, processes=0, incremental=False):
         """
         Perform the task.
 
         Return all the crawlers resulted by the execution of the task (and sub tasks).
-        """
-        return self.__recursiveTaskRunner(
-            self,
-            crawlers
-        )
+
+        When workers is greater than 0 the sibling sub task holders are executed
+        concurrently, where the number of tasks executing at the same time is
+        limited by the workers. Sub task holders marked with "dispatch.await" are
+        executed after their siblings (including their sub task holders) are done,
+        following the same dependency semantics used by the renderfarm dispatcher.
+
+        When chunkSize is greater than 0 the task holders are executed in streaming
+        mode: the tasks that can be split (@see Task.split) are performed chunk by
+        chunk and the output of each chunk is passed right away to the sub task
+        holders (executed by their own threads). Therefore, sub task holders that
+        can be split start working on the chunks already done by the parent task,
+        the other ones (and the ones marked with "dispatch.await") wait for the
+        whole output of the parent task. A task that can not be split is performed
+        in one batch, its output is then passed in chunks to its sub task holders
+        so streaming carries on through the rest of the tree.
+
+        When processes is greater than 0 the tasks that can be split are performed
+        in chunks by a pool of processes, where the size of the chunks comes from
+        the metadata "dispatch.splitSize" (otherwise the crawlers are divided
+        evenly by the processes). The output crawlers are merged in the same order
+        of the chunks. The tasks that can not be split are performed by the current
+        process.
+
+        When incremental is enabled the crawlers whose targets are already up to
+        date are not performed again, and their existing outputs are passed to the
+        sub task holders (@see Task.output). It works as a shortcut for setting the
+        metadata "output.incremental" on the tasks of all task holders.
+        """
+        taskHolder = self
+        if incremental:
+            taskHolder = self.clone()
+            self.__setIncremental(taskHolder)
+
+        workersSemaphore = threading.BoundedSemaphore(workers) if workers > 0 else None
+        processPool = _TaskProcessPool(processes) if processes > 0 else None
+
+        try:
+            if chunkSize <= 0:
+                return self.__recursiveTaskRunner(
+                    taskHolder,
+                    crawlers,
+                    workersSemaphore,
+                    processPool
+                )
+
+            inputQueue = queue.Queue()
+            inputQueue.put(list(crawlers))
+            inputQueue.put(None)
+
+            return self.__streamTaskRunner(
+                taskHolder,
+                inputQueue,
+                chunkSize,
+                workersSemaphore,
+                processPool
+            )
+        finally:
+            if processPool is not None:
+                processPool.close()
 
     @classmethod
     def createFromJson(cls, jsonContents):
@@ -372,29 +486,260 @@ class TaskHolder(object):
 
         return taskHolder
 
+    def __addCrawlersToTask(self, task, crawlers, addTaskHolderVars=True):
+        """
+        Add the crawlers resolved by the query to the task.
+        """
+        with Tracer.get().scope('addCrawlers', task.type()):
+            for crawler, filePath in self.query(crawlers).items():
+
+                if addTaskHolderVars:
+                    # cloning crawler so we can modify it safely
+                    crawler = crawler.clone()
+
+                    for varName in self.varNames():
+                        crawler.setVar(
+                            varName,
+                            self.var(varName),
+                            varName in self.contextVarNames()
+                        )
+
+                task.add(
+                    crawler,
+                    filePath
+                )
+
     @classmethod
-    def __recursiveTaskRunner(cls, taskHolder, crawlers):
+    def __recursiveTaskRunner(cls, taskHolder, crawlers, workersSemaphore=None, processPool=None):
         """
         Perform the task runner recursively.
         """
-        taskHolder.addCrawlers(crawlers)
+        traceScope = Tracer.get().scope('taskHolder', taskHolder.task().type(), status=taskHolder.status())
+        with traceScope:
+            taskHolder.addCrawlers(crawlers)
+            traceScope.setArg('crawlers', len(taskHolder.task().crawlers()))
 
-        # ignoring the execution of the task
-        if taskHolder.status() == 'ignore' or not taskHolder.task().crawlers():
-            return []
+            # ignoring the execution of the task
+            if taskHolder.status() == 'ignore' or not taskHolder.task().crawlers():
+                return []
+
+            # bypassing task execution
+            result = []
+            if taskHolder.status() == 'bypass':
+                taskCrawlers = taskHolder.task().crawlers()
+
+            # running task through the wrapper
+            else:
+                tasks = [taskHolder.task()]
+
+                # splitting the task in chunks that are performed by the process pool
+                if processPool is not None:
+                    tasks = taskHolder.task().split(
+                        int(math.ceil(len(taskHolder.task().crawlers()) / float(processPool.processes())))
+                    )
+
+                taskCrawlers = []
+                for chunkTaskCrawlers in cls.__performTasks(taskHolder, tasks, workersSemaphore, processPool):
+                    taskCrawlers += chunkTaskCrawlers
+                result += taskCrawlers
+
+        # calling subtask holders
+        result += cls.__subTaskHoldersRunner(
+            taskHolder.subTaskHolders(),
+            taskCrawlers,
+            workersSemaphore,
+            processPool
+        )
+
+        return result
+
+    @classmethod
+    def __subTaskHoldersRunner(cls, subTaskHolders, crawlers, workersSemaphore, processPool=None):
+        """
+        Perform the sub task holders returning the result in the same order of the sub task holders.
+
+        The sub task holders marked with "dispatch.await" are performed (one after
+        another) after all the other sub task holders are done. The other ones are
+        performed concurrently when the workers semaphore is provided, where each
+        one of them receives its own clones of the crawlers (crawlers are not
+        thread-safe, querying them can set variables such as width and height).
+        """
+        awaitSubTaskHolders = list(filter(cls.__isAwait, subTaskHolders))
+        parallelSubTaskHolders = [x for x in subTaskHolders if x not in awaitSubTaskHolders]
+
+        results = {}
+        if workersSemaphore is None or len(parallelSubTaskHolders) < 2:
+            for subTaskHolder in parallelSubTaskHolders:
+                results[subTaskHolder] = cls.__recursiveTaskRunner(subTaskHolder, crawlers, workersSemaphore, processPool)
+        else:
+            errors = []
+            threads = []
+
+            def __run(subTaskHolder, subTaskCrawlers):
+                try:
+                    results[subTaskHolder] = cls.__recursiveTaskRunner(subTaskHolder, subTaskCrawlers, workersSemaphore, processPool)
+                except Exception as err:
+                    errors.append(err)
+
+            # the threads only wait for the semaphore when executing the
+            # tasks, therefore the nested sub task holders can not lock
+            # the workers
+            for subTaskHolder in parallelSubTaskHolders:
+                subTaskCrawlers = [x.clone() for x in crawlers]
+                thread = threading.Thread(target=__run, args=(subTaskHolder, subTaskCrawlers))
+                thread.start()
+                threads.append(thread)
+
+            for thread in threads:
+                thread.join()
+
+            if errors:
+                raise errors[0]
+
+        for awaitSubTaskHolder in awaitSubTaskHolders:
+            results[awaitSubTaskHolder] = cls.__recursiveTaskRunner(awaitSubTaskHolder, crawlers, workersSemaphore, processPool)
 
-        # bypassing task execution
         result = []
-        if taskHolder.status() == 'bypass':
-            taskCrawlers = taskHolder.task().crawlers()
+        for subTaskHolder in subTaskHolders:
+            result += results[subTaskHolder]
+
+        return result
 
-        # running task through the wrapper
+    @classmethod
+    def __streamTaskRunner(cls, taskHolder, inputQueue, chunkSize, workersSemaphore, processPool=None):
+        """
+        Perform the task holder in streaming mode.
+
+        The input crawlers are read in chunks from the input queue (None tells there
+        are no more chunks). Task holders whose task can not be split read all the
+        chunks first and perform the task in one batch.
+        """
+        if taskHolder.status() == 'ignore':
+            for chunkCrawlers in iter(inputQueue.get, None):
+                pass
+            return []
+
+        isSplittable = taskHolder.status() == 'bypass' or taskHolder.task().isSplittable()
+        if isSplittable:
+            inputChunks = iter(inputQueue.get, None)
         else:
-            taskCrawlers = taskHolder.taskWrapper().run(taskHolder.task())
-            result += taskCrawlers
+            crawlers = []
+            for chunkCrawlers in iter(inputQueue.get, None):
+                crawlers += chunkCrawlers
+            inputChunks = [crawlers] if crawlers else []
+
+        subTaskHolders = taskHolder.subTaskHolders()
+        awaitSubTaskHolders = list(filter(cls.__isAwait, subTaskHolders))
+        results = {}
+        errors = []
+
+        def __run(subTaskHolder, subInputQueue):
+            try:
+                results[subTaskHolder] = cls.__streamTaskRunner(subTaskHolder, subInputQueue, chunkSize, workersSemaphore, processPool)
+            except Exception as err:
+                errors.append(err)
+
+        # each sub task holder receives the output chunks through its own thread
+        subInputQueues = []
+        threads = []
+        for subTaskHolder in subTaskHolders:
+            if subTaskHolder in awaitSubTaskHolders:
+                continue
+
+            subInputQueue = queue.Queue()
+            thread = threading.Thread(target=__run, args=(subTaskHolder, subInputQueue))
+            thread.start()
+            subInputQueues.append(subInputQueue)
+            threads.append(thread)
 
-        # calling subtask holders
-        for subTaskHolder in taskHolder.subTaskHolders():
-            result += cls.__recursiveTaskRunner(subTaskHolder, taskCrawlers)
+        result = []
+        taskCrawlers = []
+        try:
+            for chunkCrawlers in inputChunks:
+                traceScope = Tracer.get().scope('taskHolder', taskHolder.task().type(), status=taskHolder.status())
+                with traceScope:
+                    task = taskHolder.task().clone()
+                    task.clear()
+                    taskHolder.__addCrawlersToTask(task, chunkCrawlers)
+                    traceScope.setArg('crawlers', len(task.crawlers()))
+
+                    if not task.crawlers():
+                        continue
+
+                    tasks = task.split(chunkSize) if isSplittable else [task]
+                    if taskHolder.status() == 'bypass':
+                        chunkTasksCrawlers = [x.crawlers() for x in tasks]
+                    else:
+                        chunkTasksCrawlers = cls.__performTasks(taskHolder, tasks, workersSemaphore, processPool)
+
+                    for chunkTaskCrawlers in chunkTasksCrawlers:
+                        if taskHolder.status() != 'bypass':
+                            result += chunkTaskCrawlers
+
+                        taskCrawlers += chunkTaskCrawlers
+
+                        # the output of a task performed in one batch is passed in
+                        # chunks to the sub task holders, each one of them receives its
+                        # own clones of the crawlers since they are queried concurrently
+                        for index in range(0, len(chunkTaskCrawlers), chunkSize):
+                            for subInputQueue in subInputQueues:
+                                subInputQueue.put([x.clone() for x in chunkTaskCrawlers[index:index + chunkSize]])
+        finally:
+            for subInputQueue in subInputQueues:
+                subInputQueue.put(None)
+
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+
+        # the sub task holders marked with await are performed after the other ones
+        # are done
+        for awaitSubTaskHolder in awaitSubTaskHolders:
+            if taskCrawlers:
+                results[awaitSubTaskHolder] = cls.__recursiveTaskRunner(awaitSubTaskHolder, taskCrawlers, workersSemaphore, processPool)
+
+        for subTaskHolder in subTaskHolders:
+            result += results.get(subTaskHolder, [])
 
         return result
+
+    @classmethod
+    def __performTasks(cls, taskHolder, tasks, workersSemaphore, processPool):
+        """
+        Return a generator that performs the tasks through the task wrapper yielding their output crawlers.
+
+        The tasks are performed by the process pool when there is more than one
+        task, otherwise they are performed by the current process.
+        """
+        if processPool is not None and len(tasks) > 1:
+            for taskCrawlers in processPool.run(taskHolder.taskWrapper(), tasks):
+                yield taskCrawlers
+            return
+
+        for task in tasks:
+            if workersSemaphore is None:
+                yield taskHolder.taskWrapper().run(task)
+            else:
+                with workersSemaphore:
+                    taskCrawlers = taskHolder.taskWrapper().run(task)
+                yield taskCrawlers
+
+    @classmethod
+    def __setIncremental(cls, taskHolder):
+        """
+        Enable the incremental execution on the tasks of the task holder recursively.
+        """
+        taskHolder.task().setMetadata('output.incremental', True)
+
+        for subTaskHolder in taskHolder.subTaskHolders():
+            cls.__setIncremental(subTaskHolder)
+
+    @classmethod
+    def __isAwait(cls, taskHolder):
+        """
+        Return a boolean telling if the task holder is marked to await its siblings (dispatch.await).
+        """
+        task = taskHolder.task()
+        return bool(task.hasMetadata('dispatch.await') and task.metadata('dispatch.await'))
@@ -1,10 +1,10 @@
 import os
-import json
 import tempfile
 from ulauncher import EnvModifier, ProcessExecution
 from .TaskWrapper import TaskWrapper
 from ..Task import Task
 from ..Crawler import Crawler
+from ..Tracer import Tracer
 
 class SubprocessFailedError(Exception):
     """Subprocess failed Error."""
@@ -96,7 +96,8 @@ class Subprocess(TaskWrapper):
             redirectStderrToStdout=True
         )
 
-        processExecution.execute()
+        with Tracer.get().scope('subprocess', self.type(), task=task.type(), command=command):
+            processExecution.execute()
 
         # checking if process has failed based on the return code
         if not processExecution.executionSuccess() and not self.option('ignoreExitCode'):
@@ -108,12 +109,8 @@ class Subprocess(TaskWrapper):
 
         # the task passes the result by serializing it as json, we need to load the json file
         # and re-create the crawlers.
-        result = []
         with open(serializedTaskFile) as jsonFile:
-            for serializedJsonCrawler in json.load(jsonFile):
-                result.append(
-                    Crawler.createFromJson(serializedJsonCrawler)
-                )
+            result = Crawler.deserializeMany(jsonFile.read())
 
         return result
 
@@ -131,14 +128,12 @@ class Subprocess(TaskWrapper):
         task = Task.createFromJson(serializedJsonTaskContent)
 
         # running task and serializing the output as json.
-        serializedCrawlers = []
-        for crawler in task.output():
-            serializedCrawlers.append(crawler.toJson())
+        serializedCrawlers = Crawler.serializeMany(task.output())
 
         # we use the environment to tell where the result has been serialized
         # so it can be resulted back by the parent process.
         with open(serializedTaskFilePath, 'w') as f:
-            f.write(json.dumps(serializedCrawlers))
+            f.write(serializedCrawlers)
 
     def __envModifier(self):
         """
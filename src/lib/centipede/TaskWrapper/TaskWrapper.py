@@ -1,4 +1,5 @@
 from ..Task import Task
+from ..Tracer import Tracer
 
 class TaskWrapperTypeNotFoundError(Exception):
     """Task wrapper type not found error."""
@@ -59,7 +60,8 @@ class TaskWrapper(object):
         """
         assert isinstance(task, Task), "Invalid task type!"
 
-        return self._perform(task)
+        with Tracer.get().scope('taskWrapper', self.type(), task=task.type(), crawlers=len(task.crawlers())):
+            return self._perform(task)
 
     def _perform(self, task):
         """
@@ -1,6 +1,8 @@
 import os
-import uuid
+import threading
+from collections import OrderedDict
 from .TemplateProcedure import TemplateProcedure
+from .Tracer import Tracer
 
 # compatibility with python 2/3
 try:
@@ -33,16 +35,40 @@ class Template(object):
     <parent> - Passes the computed parent path to a procedure. Keep in mind this
     is only supported by template procedures.
         '{prefix}/testing/(computeVersion <parent>)/{name}.(pad {frame} 10).{ext}'
+
+    The template string is compiled once (when it is assigned to the template)
+    to a list of tokens (literals, variables, procedures and required path
+    levels) that are evaluated directly when the value is computed. The
+    compiled tokens are interned by the input string, therefore templates
+    created multiple times for the same string (for instance per crawler)
+    are only compiled once.
+
+    The existence of the required paths (/!) can be cached during a scope
+    (for instance a query) through beginExistenceCache and endExistenceCache,
+    so each distinct path is only checked once. Paths created or removed
+    during the scope can be discarded through invalidateExistenceCache.
     """
 
-    __safeTokenId = uuid.uuid4()
+    # token types used by the compiled template
+    __textToken = 0
+    __varToken = 1
+    __procedureToken = 2
+    __requiredToken = 3
+    __parentToken = 4
+
+    # compiled templates shared by all templates (keyed by the input string)
+    __compiledCache = {}
+    __compiledCacheLock = threading.Lock()
+    __compiledCacheMaxSize = int(os.environ.get('CENTIPEDE_TEMPLATE_COMPILED_CACHE_SIZE', 10000))
+
+    # existence of the required paths cached per thread (@see beginExistenceCache)
+    __existenceCacheScope = threading.local()
 
     def __init__(self, inputString=""):
         """
         Create a template object.
         """
         self.setInputString(inputString)
-        self.__setVarNames()
         self.__procedureValueCache = {}
 
     def inputString(self):
@@ -59,19 +85,20 @@ class Template(object):
             "Invalid template string!"
 
         self.__inputString = inputString
+        self.__compile()
 
     def varNames(self):
         """
         Return a list of variable names found in the input string.
         """
-        return self.__varNames
+        return list(self.__varNames)
 
     def valueFromCrawler(self, crawler, vars={}):
         """
         Return the value of the template based on a crawler.
         """
         contextVariableValues = {}
-        for varName in self.varNames():
+        for varName in self.__varNames:
             if varName in vars:
                 contextVariableValues[varName] = str(vars[varName])
             else:
@@ -79,26 +106,191 @@ class Template(object):
 
         return self.value(contextVariableValues)
 
+    def valuesFromCrawlers(self, crawlers, vars={}):
+        """
+        Return a list containing the value of the template for each crawler.
+
+        The template is resolved once per distinct combination of the variables
+        used by the template, the tokens that only depend on variables shared
+        by all crawlers (prefix) are resolved only once and the existence of
+        the required paths is checked once per path.
+        """
+        with Tracer.get().scope('template', self.inputString(), crawlers=len(crawlers)):
+            return self.__valuesFromCrawlers(crawlers, vars)
+
+    def __valuesFromCrawlers(self, crawlers, vars):
+        """
+        Return a list containing the value of the template for each crawler (@see valuesFromCrawlers).
+        """
+        varNames = self.__varNames
+        crawlerKeys = []
+        for crawler in crawlers:
+            crawlerKeys.append(tuple(
+                str(vars[varName]) if varName in vars else str(crawler.var(varName)) for varName in varNames
+            ))
+
+        distinctKeys = list(OrderedDict.fromkeys(crawlerKeys))
+        if not distinctKeys:
+            return []
+
+        # figuring out the tokens that can be resolved once for all crawlers
+        sharedVarNames = set()
+        for index, varName in enumerate(varNames):
+            if all(x[index] == distinctKeys[0][index] for x in distinctKeys[1:]):
+                sharedVarNames.add(varName)
+
+        splitIndex = len(self.__tokens)
+        for index, token in enumerate(self.__tokens):
+            if not self.__tokenVarNames(token).issubset(sharedVarNames):
+                splitIndex = index
+                break
+
+        prefix = []
+        prefixRequiredLevels = []
+        self.__resolveTokens(
+            self.__tokens[:splitIndex],
+            dict(zip(varNames, distinctKeys[0])),
+            prefix,
+            prefixRequiredLevels
+        )
+        prefix = ''.join(prefix)
+
+        # resolving the remaining tokens per distinct combination
+        values = {}
+        checkedPaths = self.__checkedPaths()
+        for key in distinctKeys:
+            result = [prefix]
+            requiredLevels = list(prefixRequiredLevels)
+            self.__resolveTokens(
+                self.__tokens[splitIndex:],
+                dict(zip(varNames, key)),
+                result,
+                requiredLevels
+            )
+
+            values[key] = self.__resolveRequiredLevels(
+                ''.join(result),
+                requiredLevels,
+                checkedPaths
+            )
+
+        return [values[x] for x in crawlerKeys]
+
     def value(self, vars={}):
         """
         Return the value of the template based on the input variables.
         """
         self.__validateTemplateVariables(vars)
 
-        # resolving variables values
-        resolvedTemplate = self.inputString()
-        for varName, varValue in vars.items():
-            resolvedTemplate = resolvedTemplate.replace(
-                ('{' + varName + '}'),
-                self.__escapeTemplateTokens(varValue)
-            )
+        result = []
+        requiredLevels = []
+        self.__resolveTokens(self.__tokens, vars, result, requiredLevels)
+
+        return self.__resolveRequiredLevels(''.join(result), requiredLevels, self.__checkedPaths())
+
+    @classmethod
+    def compiledCacheSize(cls):
+        """
+        Return the number of input strings whose compiled tokens are cached.
+        """
+        return len(cls.__compiledCache)
+
+    @classmethod
+    def clearCompiledCache(cls):
+        """
+        Remove all compiled tokens from the cache.
+        """
+        with cls.__compiledCacheLock:
+            cls.__compiledCache.clear()
+
+    @classmethod
+    def beginExistenceCache(cls):
+        """
+        Begin a scope where the existence of the required paths is cached (for the current thread).
+
+        Scopes can be nested (the cache is shared until the outermost scope ends), each
+        call must be paired with a call to endExistenceCache.
+        """
+        scope = cls.__existenceCacheScope
+        if not getattr(scope, 'depth', 0):
+            scope.depth = 0
+            scope.paths = {}
+
+        scope.depth += 1
+
+    @classmethod
+    def endExistenceCache(cls):
+        """
+        End a scope started by beginExistenceCache.
+        """
+        scope = cls.__existenceCacheScope
+        assert getattr(scope, 'depth', 0), "Existence cache scope has not been started!"
+
+        scope.depth -= 1
+        if not scope.depth:
+            scope.paths = None
+
+    @classmethod
+    def invalidateExistenceCache(cls, path=None):
+        """
+        Discard the cached existence of the path (or all paths when path is None).
+
+        The paths under the input path and its parent directories are discarded as well.
+        """
+        paths = getattr(cls.__existenceCacheScope, 'paths', None)
+        if not paths:
+            return
+
+        if path is None:
+            paths.clear()
+            return
+
+        path = os.path.normpath(path)
+        for cachedPath in list(paths.keys()):
+            normalizedPath = os.path.normpath(cachedPath)
+            if normalizedPath == path or \
+                    normalizedPath.startswith(path + os.sep) or \
+                    path.startswith(normalizedPath.rstrip(os.sep) + os.sep):
+                del paths[cachedPath]
+
+    @classmethod
+    def __checkedPaths(cls):
+        """
+        Return the dict used to cache the existence of the required paths.
+
+        When an existence cache scope is not active a new dict is returned.
+        """
+        paths = getattr(cls.__existenceCacheScope, 'paths', None)
+        if paths is None:
+            return {}
+
+        return paths
+
+    def __resolveTokens(self, tokens, vars, result, requiredLevels):
+        """
+        Resolve the tokens appending the values to the result (and the position of the required levels).
+        """
+        for tokenType, tokenValue in tokens:
+            if tokenType == self.__textToken:
+                result.append(tokenValue)
 
-        # resolving function values
-        finalResolvedTemplate = ""
-        for templatePart in resolvedTemplate.split("("):
+            elif tokenType == self.__varToken:
+                result.append(str(vars[tokenValue]))
 
-            endIndex = templatePart.find(')')
-            if endIndex != -1:
+            elif tokenType == self.__requiredToken:
+                result.append('/')
+                requiredLevels.append(len(''.join(result)))
+
+            else:
+                procedureName, procedureTokens = tokenValue
+                rawTemplateProcedure = self.__resolveProcedure(procedureTokens, vars, result)
+                if procedureName is None:
+                    procedureName = TemplateProcedure.parse(rawTemplateProcedure)[0]
+
+                # pure procedures are cached by the template procedure itself
+                if TemplateProcedure.isPure(procedureName):
+                    result.append(TemplateProcedure.parseRun(rawTemplateProcedure))
+                    continue
 
                 # processing the procedure only when it has not been
                 # evaluated yet, otherwise return it from the cache.
@@ -107,57 +299,77 @@ class Template(object):
                 # default behaviour should be to always cache it (never change it)
                 # otherwise it could side effect in template procedures that create
                 # new versions...
-                rawTemplateProcedure = templatePart[:endIndex]
+                if rawTemplateProcedure not in self.__procedureValueCache:
+                    self.__procedureValueCache[rawTemplateProcedure] = TemplateProcedure.parseRun(
+                        rawTemplateProcedure
+                    )
 
-                # this is a special token that allows to pass the parent path
-                # to a procedure, replacing it with the parent path at this point.
-                rawTemplateProcedure = rawTemplateProcedure.replace(
-                    "<parent>",
-                    self.__escapeTemplateTokens(finalResolvedTemplate.replace("/!", "/"), 0)
-                )
+                result.append(self.__procedureValueCache[rawTemplateProcedure])
 
-                if rawTemplateProcedure not in self.__procedureValueCache:
-                    # replacing any reserved token from the result of the procedure
-                    self.__procedureValueCache[rawTemplateProcedure] = self.__escapeTemplateTokens(
-                        TemplateProcedure.parseRun(
-                            rawTemplateProcedure
-                        )
+    @classmethod
+    def __resolveRequiredLevels(cls, value, requiredLevels, checkedPaths):
+        """
+        Return the value making sure the levels marked as required exist (otherwise raise RequiredPathNotFoundError).
+
+        The checkedPaths dict is used to avoid checking the same path multiple times.
+        """
+        for levelStart in requiredLevels:
+            levelEnd = value.find(os.sep, levelStart)
+            if levelEnd == -1:
+                levelEnd = len(value)
+
+            resolvedPath = value[:levelEnd]
+            if resolvedPath not in checkedPaths:
+                checkedPaths[resolvedPath] = os.path.exists(resolvedPath)
+
+            if not checkedPaths[resolvedPath]:
+                raise RequiredPathNotFoundError(
+                    'Template contains a path marked as required:\n"{0}"\n\nThis error is caused because the target path does not exist in the file system:\n{1}'.format(
+                        '!' + value[levelStart:levelEnd],
+                        resolvedPath
                     )
+                )
+
+        return value
 
-                procedureValue = self.__procedureValueCache[rawTemplateProcedure]
-                finalResolvedTemplate += procedureValue + templatePart[endIndex + 1:]
+    @classmethod
+    def __tokenVarNames(cls, token):
+        """
+        Return a set containing the variable names used by the token.
+        """
+        tokenType, tokenValue = token
+        if tokenType == cls.__varToken:
+            return set([tokenValue])
+
+        if tokenType == cls.__procedureToken:
+            return set(x[1] for x in tokenValue[1] if x[0] == cls.__varToken)
+
+        return set()
+
+    def __resolveProcedure(self, tokens, vars, result):
+        """
+        Return the raw procedure (name and arguments) based on the input variables.
+        """
+        rawTemplateProcedure = []
+        for tokenType, tokenValue in tokens:
+            if tokenType == self.__textToken:
+                rawTemplateProcedure.append(tokenValue)
+
+            elif tokenType == self.__varToken:
+                rawTemplateProcedure.append(str(vars[tokenValue]))
+
+            # this is a special token that allows to pass the parent path
+            # to a procedure, replacing it with the parent path at this point.
             else:
-                finalResolvedTemplate += templatePart
-
-        # resolving required path levels
-        if "/!" in finalResolvedTemplate:
-            finalPath = []
-            for pathLevel in self.__escapeTemplateTokens(finalResolvedTemplate, 0).split(os.sep):
-                if pathLevel.startswith("!"):
-                    finalPath.append(pathLevel[1:])
-                    resolvedPath = os.sep.join(finalPath)
-                    if not os.path.exists(resolvedPath):
-                        raise RequiredPathNotFoundError(
-                            'Template contains a path marked as required:\n"{0}"\n\nThis error is caused because the target path does not exist in the file system:\n{1}'.format(
-                                pathLevel,
-                                resolvedPath
-                            )
-                        )
-
-                else:
-                    finalPath.append(pathLevel)
-            finalResolvedTemplate = os.sep.join(finalPath)
-
-        # restoring all the espaped tokens to the original value
-        finalResolvedTemplate = self.__escapeTemplateTokens(finalResolvedTemplate, 0)
-
-        return finalResolvedTemplate
+                rawTemplateProcedure.append(''.join(result))
+
+        return ''.join(rawTemplateProcedure)
 
     def __validateTemplateVariables(self, vars):
         """
         Make sure the variables used by template are available, otherwise thown an exception (VariableNotFoundError).
         """
-        for requiredVarName in self.varNames():
+        for requiredVarName in self.__varNames:
             if requiredVarName not in vars:
                 raise VariableNotFoundError(
                     'Could not find a value for the variable {0}'.format(
@@ -165,49 +377,123 @@ class Template(object):
                     )
                 )
 
-    def __setVarNames(self):
+    def __compile(self):
         """
-        Set the variable names found in the input template.
+        Compile the input string to the tokens used to compute the value of the template (using the compiled cache).
         """
-        result = set()
+        inputString = self.inputString()
+        compiled = self.__compiledCache.get(inputString)
+        if compiled is None:
+            self.__compileTokens()
+            compiled = (self.__varNames, self.__tokens)
+
+            with self.__compiledCacheLock:
+                if len(self.__compiledCache) >= self.__compiledCacheMaxSize:
+                    self.__compiledCache.clear()
+                self.__compiledCache[inputString] = compiled
 
-        # detecting variables
-        for templatePart in self.inputString().split("{"):
-            if templatePart is '' or "}" not in templatePart:
+        self.__varNames, self.__tokens = compiled
+
+    def __compileTokens(self):
+        """
+        Compile the input string to the tokens used to compute the value of the template.
+        """
+        self.__varNames = []
+        self.__tokens = []
+
+        # splitting the template in parts where each part can start with
+        # a procedure (the procedure ends at the first ")" of the part)
+        for partTokens in self.__splitTokens(self.__parseVars(self.inputString()), '('):
+            procedureTokens = []
+            for index, (tokenType, tokenValue) in enumerate(partTokens):
+                if tokenType != self.__textToken or ')' not in tokenValue:
+                    continue
+
+                endIndex = tokenValue.find(')')
+                procedureTokens = partTokens[:index]
+                procedureTokens.append((self.__textToken, tokenValue[:endIndex]))
+                partTokens = [(self.__textToken, tokenValue[endIndex + 1:])] + partTokens[index + 1:]
+
+                procedureTokens = self.__parseToken(procedureTokens, '<parent>', self.__parentToken)
+                self.__tokens.append((
+                    self.__procedureToken,
+                    (self.__procedureName(procedureTokens), procedureTokens)
+                ))
+                break
+
+            self.__tokens += self.__parseToken(partTokens, '/!', self.__requiredToken)
+
+        # removing empty literals
+        self.__tokens = list(filter(
+            lambda x: x[0] != self.__textToken or x[1],
+            self.__tokens
+        ))
+
+    def __parseVars(self, inputString):
+        """
+        Return a list of tokens (literals and variables) for the input string.
+        """
+        parts = inputString.split('{')
+        result = [(self.__textToken, parts[0])]
+        for templatePart in parts[1:]:
+            if "}" not in templatePart:
+                result.append((self.__textToken, '{' + templatePart))
                 continue
 
             endIndex = templatePart.find('}')
-            result.add(templatePart[:endIndex])
+            varName = templatePart[:endIndex]
+            if varName not in self.__varNames:
+                self.__varNames.append(varName)
+
+            result.append((self.__varToken, varName))
+            result.append((self.__textToken, templatePart[endIndex + 1:]))
 
-        self.__varNames = list(result)
+        return result
 
     @classmethod
-    def __escapeTemplateTokens(cls, value, direction=1):
-        """
-        Escape special template tokens from the input string.
-        """
-        safeFunctionStart = '<{}>'.format(cls.__safeTokenId)
-        safeFunctionEnd = '</{}>'.format(cls.__safeTokenId)
-        safeLevelExist = '[{}]'.format(cls.__safeTokenId)
-        safeParentPath = '[[{}]]'.format(cls.__safeTokenId)
-
-        if direction:
-            return str(value).replace(
-                "(", safeFunctionStart
-            ).replace(
-                ")", safeFunctionEnd
-            ).replace(
-                "/!", safeLevelExist
-            ).replace(
-                "<parent>", safeParentPath
-            )
+    def __procedureName(cls, procedureTokens):
+        """
+        Return the name of the procedure when it is known before resolving the procedure tokens (otherwise None).
+        """
+        if not procedureTokens or procedureTokens[0][0] != cls.__textToken:
+            return None
 
-        return str(value).replace(
-            safeFunctionStart, "("
-        ).replace(
-            safeFunctionEnd, ")"
-        ).replace(
-            safeLevelExist, "/!"
-        ).replace(
-            safeParentPath, "<parent>"
-        )
+        text = procedureTokens[0][1].lstrip(' ')
+        if ' ' in text:
+            return text.split(' ')[0]
+
+        if len(procedureTokens) == 1 and text:
+            return text
+
+        return None
+
+    @classmethod
+    def __splitTokens(cls, tokens, separator):
+        """
+        Return a list of parts (list of tokens) split by the separator found in the literals.
+        """
+        result = [[]]
+        for tokenType, tokenValue in tokens:
+            if tokenType != cls.__textToken:
+                result[-1].append((tokenType, tokenValue))
+                continue
+
+            textParts = tokenValue.split(separator)
+            result[-1].append((tokenType, textParts[0]))
+            for textPart in textParts[1:]:
+                result.append([(tokenType, textPart)])
+
+        return result
+
+    @classmethod
+    def __parseToken(cls, tokens, specialToken, specialTokenType):
+        """
+        Return a list of tokens where the special token found in the literals is replaced by the special token type.
+        """
+        result = []
+        for index, partTokens in enumerate(cls.__splitTokens(tokens, specialToken)):
+            if index:
+                result.append((specialTokenType, None))
+            result += partTokens
+
+        return result
@@ -23,11 +23,13 @@ class _ImageSequence(object):
 # frame padding
 TemplateProcedure.register(
     'pad',
-    _ImageSequence.padding
+    _ImageSequence.padding,
+    isPure=True
 )
 
 # retime frame padding
 TemplateProcedure.register(
     'retimepad',
-    _ImageSequence.retimePadding
+    _ImageSequence.retimePadding,
+    isPure=True
 )
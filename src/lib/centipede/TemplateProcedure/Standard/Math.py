@@ -83,35 +83,41 @@ class _Math(object):
 # sum
 TemplateProcedure.register(
     'sum',
-    _Math.sumInt
+    _Math.sumInt,
+    isPure=True
 )
 
 # subtraction
 TemplateProcedure.register(
     'sub',
-    _Math.subtractInt
+    _Math.subtractInt,
+    isPure=True
 )
 
 # multiply
 TemplateProcedure.register(
     'mult',
-    _Math.multiplyInt
+    _Math.multiplyInt,
+    isPure=True
 )
 
 # divide
 TemplateProcedure.register(
     'div',
-    _Math.divideInt
+    _Math.divideInt,
+    isPure=True
 )
 
 # minimum
 TemplateProcedure.register(
     'min',
-    _Math.minimumInt
+    _Math.minimumInt,
+    isPure=True
 )
 
 # maximum
 TemplateProcedure.register(
     'max',
-    _Math.maximumInt
+    _Math.maximumInt,
+    isPure=True
 )
@@ -1,5 +1,6 @@
 import os
 from ..TemplateProcedure import TemplateProcedure
+from ...PathIndex import PathIndex
 
 class _Path(object):
     """
@@ -33,7 +34,8 @@ class _Path(object):
         Find and return a specific file.
 
         Starts from the "startPath" and it goes backwards until it finds the specified file or reaches the "finalPath".
-        If a file is not found, raises an IOError exception.
+        If a file is not found, raises an IOError exception. The directories are queried through the path
+        index (@see PathIndex).
 
         :param fileName: The file name to find.
         :type fileName: str
@@ -42,15 +44,11 @@ class _Path(object):
         :param finalPath: It stops to search when reaching this path.
         :type: finalPath: str
         """
-        resultPath = os.path.join(startPath, fileName)
-        if os.path.exists(resultPath):
-            return resultPath
-
-        if startPath == finalPath or startPath == '/':
+        resultPath = PathIndex.get().rfind(fileName, startPath, finalPath)
+        if resultPath is None:
             raise IOError('File was not found')
 
-        previousPath = os.path.dirname(startPath)
-        return _Path.rfindpath(fileName, previousPath, finalPath)
+        return resultPath
 
     @staticmethod
     def findpath(fileName, startPath):
@@ -58,47 +56,37 @@ class _Path(object):
         Find and return a specific file.
 
         Starts from the "startPath" and it goes forwards until it finds the specified file. If a file is not found,
-        return an empty string.
+        return an empty string. The directories are queried through the path index (@see PathIndex).
 
         :param fileName: The file name to find.
         :type fileName: str
         :param startPath: The path to start.
         :type startPath: str
         """
-        result = ''
-        resultPath = os.path.join(startPath, fileName)
-        if os.path.exists(resultPath):
-            return resultPath
-
-        # When it can not access the next directory (e.g. permissions errors), It raises a StopIteration Error.
-        try:
-            dirList = next(os.walk(startPath))[1]
-        except StopIteration:
-            dirList = []
-
-        for dirName in dirList:
-            nextPath = os.path.join(startPath, dirName)
-            result = _Path.findpath(fileName, nextPath)
-            if result:
-                return result
+        resultPath = PathIndex.get().find(fileName, startPath)
+        if resultPath is None:
+            return ''
 
-        return result
+        return resultPath
 
 
 # registering template procedures
 TemplateProcedure.register(
     'dirname',
-    _Path.dirname
+    _Path.dirname,
+    isPure=True
 )
 
 TemplateProcedure.register(
     'parentdirname',
-    _Path.parentdirname
+    _Path.parentdirname,
+    isPure=True
 )
 
 TemplateProcedure.register(
     'basename',
-    _Path.basename
+    _Path.basename,
+    isPure=True
 )
 
 TemplateProcedure.register(
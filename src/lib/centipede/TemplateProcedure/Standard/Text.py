@@ -37,23 +37,27 @@ class _Text(object):
 # upper case
 TemplateProcedure.register(
     'upper',
-    _Text.upper
+    _Text.upper,
+    isPure=True
 )
 
 # lower case
 TemplateProcedure.register(
     'lower',
-    _Text.lower
+    _Text.lower,
+    isPure=True
 )
 
 # replace
 TemplateProcedure.register(
     'replace',
-    _Text.replace
+    _Text.replace,
+    isPure=True
 )
 
 # remove
 TemplateProcedure.register(
     'remove',
-    _Text.remove
+    _Text.remove,
+    isPure=True
 )
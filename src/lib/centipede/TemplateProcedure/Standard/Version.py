@@ -1,12 +1,15 @@
-import os
-import re
 from ..TemplateProcedure import TemplateProcedure
+from ...VersionIndex import VersionIndex
 
 class _Version(object):
     """
     Basic version template procedures.
 
-    The versionsPath is usually specified using <parent> token.
+    The versionsPath is usually specified using <parent> token. The versions
+    are queried through the version index (@see VersionIndex). These procedures
+    never create the version directory, since templates can be evaluated many
+    times before a task runs (filters, previews, dispatching). The new version
+    is reserved when it gets created (@see CreateVersion.output).
     """
 
     @staticmethod
@@ -14,36 +17,14 @@ class _Version(object):
         """
         Return a new version.
         """
-        version = _Version.__queryLatest(versionsPath)
-
-        return 'v' + str(version + 1).zfill(3)
+        return VersionIndex.versionName(VersionIndex.get().new(versionsPath))
 
     @staticmethod
     def latest(versionsPath):
         """
         Return a new version, in case none version is found it returns v000.
         """
-        version = _Version.__queryLatest(versionsPath)
-
-        return 'v' + str(version).zfill(3)
-
-    @staticmethod
-    def __queryLatest(versionsPath):
-        """
-        Return the latest version found under the versions path.
-
-        In case none version is found, it returns 0 by default.
-        """
-        version = 0
-        versionRegEx = "^v[0-9]{3}$"
-
-        # finding the latest version
-        if os.path.exists(versionsPath):
-            for directory in os.listdir(versionsPath):
-                if re.match(versionRegEx, directory):
-                    version = max(int(directory[1:]), version)
-
-        return version
+        return VersionIndex.versionName(VersionIndex.get().latest(versionsPath))
 
 
 # new version procedure
@@ -1,3 +1,7 @@
+import os
+import threading
+from collections import OrderedDict
+
 # compatibility with python 2/3
 try:
     basestring
@@ -10,20 +14,69 @@ class TemplateProcedureNotFoundError(Exception):
 class TemplateProcedure(object):
     """
     Template procedures are used to provide functions to the template engine.
+
+    Procedures registered as pure (the result only depends on the arguments) are
+    memoized by a process-wide LRU cache, the size of the cache can be
+    configured through the environment variable CENTIPEDE_TEMPLATEPROCEDURE_CACHE_SIZE.
     """
 
     __registered = {}
+    __pureNames = set()
+
+    # process-wide cache used by the pure procedures
+    __cache = OrderedDict()
+    __cacheLock = threading.Lock()
+    __cacheSize = int(os.environ.get('CENTIPEDE_TEMPLATEPROCEDURE_CACHE_SIZE', 10000))
+    __cacheHits = 0
+    __cacheMisses = 0
+
+    # marker returned when a result is not found in the cache (results can be None)
+    __cacheMiss = object()
 
     @staticmethod
-    def register(name, procedureCallable):
+    def register(name, procedureCallable, isPure=False):
         """
         Register a procedureCallable as procedure.
+
+        Pure procedures (isPure) must return the same result for the same
+        arguments without side effects, their results are cached.
         """
         assert hasattr(procedureCallable, '__call__'), \
             "Invalid callable!"
 
         TemplateProcedure.__registered[name] = procedureCallable
 
+        if isPure:
+            TemplateProcedure.__pureNames.add(name)
+        else:
+            TemplateProcedure.__pureNames.discard(name)
+
+        # results computed by a previous registration are no longer valid
+        TemplateProcedure.__clearCachedResults(name)
+
+    @staticmethod
+    def unregister(name):
+        """
+        Remove the registration of a procedure.
+        """
+        if name not in TemplateProcedure.__registered:
+            raise TemplateProcedureNotFoundError(
+                'Could not find procedure name: "{0}"'.format(
+                    name
+                )
+            )
+
+        del TemplateProcedure.__registered[name]
+        TemplateProcedure.__pureNames.discard(name)
+        TemplateProcedure.__clearCachedResults(name)
+
+    @staticmethod
+    def isPure(procedureName):
+        """
+        Return a boolean telling if the procedure has been registered as pure.
+        """
+        return procedureName in TemplateProcedure.__pureNames
+
     @staticmethod
     def registeredNames():
         """
@@ -36,15 +89,51 @@ class TemplateProcedure(object):
         """
         Run the procedure and return a value base on the args.
         """
-        if procedureName not in TemplateProcedure.__registered:
-            raise TemplateProcedureNotFoundError(
-                'Could not find procedure name: "{0}"'.format(
-                    procedureName
-                )
-            )
+        if procedureName not in TemplateProcedure.__pureNames:
+            return TemplateProcedure.__execute(procedureName, args)
 
-        # executing procedure
-        return str(TemplateProcedure.__registered[procedureName](*args))
+        cacheKey = (procedureName,) + tuple(map(str, args))
+        result = TemplateProcedure.__cachedResult(cacheKey)
+        if result is TemplateProcedure.__cacheMiss:
+            result = TemplateProcedure.__execute(procedureName, args)
+            TemplateProcedure.__cacheResult(cacheKey, result)
+
+        return result
+
+    @staticmethod
+    def cacheStats():
+        """
+        Return a dict containing the statistics about the cache used by the pure procedures.
+        """
+        return {
+            'hits': TemplateProcedure.__cacheHits,
+            'misses': TemplateProcedure.__cacheMisses,
+            'size': len(TemplateProcedure.__cache),
+            'maxSize': TemplateProcedure.__cacheSize
+        }
+
+    @staticmethod
+    def setCacheSize(size):
+        """
+        Set the maximum number of results stored by the cache used by the pure procedures.
+        """
+        assert isinstance(size, int) and size >= 0, \
+            "Invalid cache size!"
+
+        with TemplateProcedure.__cacheLock:
+            TemplateProcedure.__cacheSize = size
+            while len(TemplateProcedure.__cache) > size:
+                TemplateProcedure.__cache.popitem(last=False)
+
+    @staticmethod
+    def clearCache():
+        """
+        Remove all results from the cache used by the pure procedures (also resets the statistics).
+        """
+        with TemplateProcedure.__cacheLock:
+            TemplateProcedure.__cache.clear()
+            TemplateProcedure.__cacheHits = 0
+            TemplateProcedure.__cacheMisses = 0
 
     @staticmethod
     def parseRun(procedure):
@@ -60,14 +149,93 @@ class TemplateProcedure(object):
         The arguments are always parsed as string, and they should be
         handled per procedure callable bases.
         """
+        # the results of pure procedures are cached by the procedure string
+        # itself, avoiding to parse it again
+        result = TemplateProcedure.__cachedResult(procedure)
+        if result is not TemplateProcedure.__cacheMiss:
+            return result
+
+        procedureName, procedureArgs = TemplateProcedure.parse(procedure)
+        if procedureName not in TemplateProcedure.__pureNames:
+            return TemplateProcedure.__execute(procedureName, procedureArgs)
+
+        result = TemplateProcedure.__execute(procedureName, procedureArgs)
+        TemplateProcedure.__cacheResult(procedure, result)
+
+        return result
+
+    @staticmethod
+    def parse(procedure):
+        """
+        Return a tuple containing the procedure name and a list of arguments (@see parseRun).
+        """
         assert isinstance(procedure, basestring), \
             "Invalid procedure type!"
 
-        cleanedTemplateProcedure = list(filter(
-            lambda x: x != '', procedure.strip(" ").split(" ")
-        ))
+        cleanedTemplateProcedure = [x for x in procedure.split(" ") if x != '']
 
-        procedureName = cleanedTemplateProcedure[0]
-        procedureArgs = cleanedTemplateProcedure[1:]
+        return (cleanedTemplateProcedure[0], cleanedTemplateProcedure[1:])
+
+    @staticmethod
+    def __execute(procedureName, args):
+        """
+        Execute the procedure returning the result as string.
+        """
+        if procedureName not in TemplateProcedure.__registered:
+            raise TemplateProcedureNotFoundError(
+                'Could not find procedure name: "{0}"'.format(
+                    procedureName
+                )
+            )
+
+        # executing procedure
+        return str(TemplateProcedure.__registered[procedureName](*args))
+
+    @staticmethod
+    def __cachedResult(cacheKey):
+        """
+        Return the cached result of a pure procedure or the cache miss marker when it is not cached.
+        """
+        cache = TemplateProcedure.__cache
+        with TemplateProcedure.__cacheLock:
+            if cacheKey not in cache:
+                return TemplateProcedure.__cacheMiss
+
+            TemplateProcedure.__cacheHits += 1
+
+            # moving the result to the end (most recently used)
+            result = cache.pop(cacheKey)
+            cache[cacheKey] = result
+
+        return result
+
+    @staticmethod
+    def __cacheResult(cacheKey, result):
+        """
+        Store the result of a pure procedure in the cache (discarding the least recently used results).
+        """
+        cache = TemplateProcedure.__cache
+        with TemplateProcedure.__cacheLock:
+            TemplateProcedure.__cacheMisses += 1
+            cache[cacheKey] = result
+            while len(cache) > TemplateProcedure.__cacheSize:
+                cache.popitem(last=False)
+
+    @staticmethod
+    def __clearCachedResults(procedureName):
+        """
+        Remove the cached results of a procedure.
+
+        The results are cached either by a tuple (procedure name and arguments) or
+        by the procedure string itself (@see parseRun).
+        """
+        cache = TemplateProcedure.__cache
+        with TemplateProcedure.__cacheLock:
+            for cacheKey in list(cache.keys()):
+                if isinstance(cacheKey, tuple):
+                    cacheKeyName = cacheKey[0]
+                else:
+                    cacheKeyName = TemplateProcedure.parse(cacheKey)[0]
 
-        return TemplateProcedure.run(procedureName, *procedureArgs)
+                if cacheKeyName == procedureName:
+                    del cache[cacheKey]
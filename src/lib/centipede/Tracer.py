@@ -0,0 +1,311 @@
+import os
+import sys
+import json
+import time
+import threading
+
+class TraceHook(object):
+    """
+    Abstract hook called around the scopes traced by the tracer (@see Tracer.addHook).
+
+    The event passed to the hook is a dict following the chrome trace event
+    format (name, cat, ph, ts, pid, tid and args). The duration (dur) is only
+    available when the scope ends. Both values are expressed in microseconds.
+    """
+
+    def begin(self, event):
+        """
+        For re-implementation: called when a traced scope begins.
+        """
+        pass
+
+    def end(self, event):
+        """
+        For re-implementation: called when a traced scope ends.
+        """
+        pass
+
+class ChromeTraceRecorder(TraceHook):
+    """
+    Hook that records the traced scopes as chrome trace events.
+
+    The recorded events can be written as json (@see write), which can be loaded
+    by chrome://tracing or any other viewer that supports the trace event format.
+    """
+
+    def __init__(self, filePath=''):
+        """
+        Create a chrome trace recorder object.
+        """
+        self.__filePath = filePath
+        self.__events = []
+        self.__lock = threading.Lock()
+
+    def filePath(self):
+        """
+        Return the file path used to write the events by default.
+        """
+        return self.__filePath
+
+    def events(self):
+        """
+        Return a list containing the recorded events.
+        """
+        with self.__lock:
+            return list(self.__events)
+
+    def end(self, event):
+        """
+        Record the event of the scope that has ended.
+        """
+        with self.__lock:
+            self.__events.append(event)
+
+    def toJson(self):
+        """
+        Return the recorded events as chrome trace json.
+        """
+        return json.dumps(
+            {
+                'traceEvents': self.events(),
+                'displayTimeUnit': 'ms'
+            },
+            default=str
+        )
+
+    def write(self, filePath=''):
+        """
+        Write the recorded events to the file path (or to the default file path when not specified).
+        """
+        filePath = filePath or self.__filePath
+        assert filePath, "Invalid file path!"
+
+        if os.path.dirname(filePath) and not os.path.exists(os.path.dirname(filePath)):
+            os.makedirs(os.path.dirname(filePath))
+
+        with open(filePath, 'w') as f:
+            f.write(self.toJson())
+
+    def summary(self):
+        """
+        Return a table (string) about the recorded events grouped by category and name.
+
+        For each group the table includes the number of calls, the total, mean and
+        maximum durations (in milliseconds), the number of crawlers and the bytes written.
+        """
+        groups = {}
+        for event in self.events():
+            key = (event['cat'], event['name'])
+            if key not in groups:
+                groups[key] = {
+                    'count': 0,
+                    'total': 0.0,
+                    'max': 0.0,
+                    'crawlers': 0,
+                    'bytesWritten': 0
+                }
+
+            group = groups[key]
+            group['count'] += 1
+            group['total'] += event['dur'] / 1000.0
+            group['max'] = max(group['max'], event['dur'] / 1000.0)
+            group['crawlers'] += event['args'].get('crawlers', 0)
+            group['bytesWritten'] += event['args'].get('bytesWritten', 0)
+
+        lineFormat = '{0:<12} {1:<40} {2:>8} {3:>12} {4:>12} {5:>12} {6:>10} {7:>14}\n'
+        result = lineFormat.format('category', 'name', 'calls', 'total ms', 'mean ms', 'max ms', 'crawlers', 'bytes written')
+        for key, group in sorted(groups.items(), key=lambda x: -x[1]['total']):
+            result += lineFormat.format(
+                key[0],
+                key[1][-40:],
+                group['count'],
+                '{0:.3f}'.format(group['total']),
+                '{0:.3f}'.format(group['total'] / group['count']),
+                '{0:.3f}'.format(group['max']),
+                group['crawlers'],
+                group['bytesWritten']
+            )
+
+        return result
+
+class _TraceScope(object):
+    """
+    Context manager used to trace a scope.
+    """
+
+    def __init__(self, hooks, category, name, args):
+        """
+        Create a trace scope object.
+        """
+        self.__hooks = hooks
+        self.__event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'pid': os.getpid(),
+            'tid': threading.current_thread().ident,
+            'args': args
+        }
+
+    def setArg(self, name, value):
+        """
+        Set an argument about the scope (included in the event).
+        """
+        self.__event['args'][name] = value
+
+    def __enter__(self):
+        """
+        Begin the scope.
+        """
+        self.__event['ts'] = time.time() * 1e6
+        for hook in self.__hooks:
+            hook.begin(self.__event)
+
+        return self
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+        """
+        End the scope.
+        """
+        self.__event['dur'] = time.time() * 1e6 - self.__event['ts']
+        if exceptionType is not None:
+            self.__event['args']['error'] = exceptionType.__name__
+
+        for hook in self.__hooks:
+            hook.end(self.__event)
+
+        return False
+
+class _NullTraceScope(object):
+    """
+    Context manager used when tracing is disabled.
+    """
+
+    def setArg(self, name, value):
+        """
+        Ignore the argument.
+        """
+        pass
+
+    def __enter__(self):
+        """
+        Begin the scope.
+        """
+        return self
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+        """
+        End the scope.
+        """
+        return False
+
+class Tracer(object):
+    """
+    Service used to trace the execution (task holders, queries, templates, crawling, task wrappers and tasks).
+
+    The traced scopes are reported to the hooks added to the tracer (@see TraceHook).
+    When no hooks are added the scopes are not traced at all:
+        with Tracer.get().scope('task', task.type(), crawlers=len(task.crawlers())) as traceScope:
+            outputCrawlers = task.output()
+            traceScope.setArg('outputCrawlers', len(outputCrawlers))
+
+    The execution scripts (execute-local and execute-renderfarm) record a chrome
+    trace when the environment variable CENTIPEDE_TRACE_FILE is defined
+    (@see recordFromEnvironment). The file path can contain "{pid}" which is
+    replaced by the process id, so multiple processes (renderfarm chunks) write
+    their own files.
+
+    Also, make sure you always query the singleton instance through the "get"
+    method.
+    """
+
+    __singleton = None
+    __traceFileEnv = 'CENTIPEDE_TRACE_FILE'
+    __nullScope = _NullTraceScope()
+
+    def __init__(self):
+        """
+        Create a tracer object (@See Tracer.get).
+        """
+        assert self.__singleton is None, "Can only have one instance!"
+
+        self.__hooks = ()
+        self.__lock = threading.Lock()
+
+    def addHook(self, hook):
+        """
+        Add a hook called around the traced scopes.
+        """
+        assert isinstance(hook, TraceHook), \
+            "Invalid TraceHook type!"
+
+        # the hooks are stored as tuple so scopes can use them without locking
+        with self.__lock:
+            self.__hooks = self.__hooks + (hook,)
+
+    def removeHook(self, hook):
+        """
+        Remove a hook from the tracer.
+        """
+        with self.__lock:
+            self.__hooks = tuple(x for x in self.__hooks if x is not hook)
+
+    def hooks(self):
+        """
+        Return a list of hooks added to the tracer.
+        """
+        return list(self.__hooks)
+
+    def isEnabled(self):
+        """
+        Return a boolean telling if the scopes are being traced (there are hooks).
+        """
+        return bool(self.__hooks)
+
+    def scope(self, category, name, **args):
+        """
+        Return a context manager that traces the scope.
+        """
+        hooks = self.__hooks
+        if not hooks:
+            return self.__nullScope
+
+        return _TraceScope(hooks, category, name, args)
+
+    def recordFromEnvironment(self):
+        """
+        Return a chrome trace recorder added to the tracer when CENTIPEDE_TRACE_FILE is defined (otherwise None).
+        """
+        filePath = os.environ.get(self.__traceFileEnv, '')
+        if not filePath:
+            return None
+
+        recorder = ChromeTraceRecorder(filePath.replace('{pid}', str(os.getpid())))
+        self.addHook(recorder)
+
+        return recorder
+
+    def finishRecording(self, recorder, stream=None):
+        """
+        Remove the recorder from the tracer, write its trace file and the summary table to the stream (stdout by default).
+        """
+        assert isinstance(recorder, ChromeTraceRecorder), \
+            "Invalid ChromeTraceRecorder type!"
+
+        self.removeHook(recorder)
+        recorder.write()
+
+        stream = stream or sys.stdout
+        stream.write('Trace written to: {0}\n'.format(recorder.filePath()))
+        stream.write(recorder.summary())
+        stream.flush()
+
+    @classmethod
+    def get(cls):
+        """
+        Return the singleton tracer instance.
+        """
+        if cls.__singleton is None:
+            cls.__singleton = Tracer()
+
+        return cls.__singleton
@@ -0,0 +1,136 @@
+import os
+import re
+import time
+import threading
+
+# compatibility with python 2/3
+try:
+    FileExistsError
+except NameError:
+    FileExistsError = OSError
+
+class VersionIndex(object):
+    """
+    Service used to query and reserve versions (v001, v002...) under a versions directory.
+
+    The latest version found under a directory is cached until the modification
+    time of the directory changes, so the directory is only listed again when
+    versions are added or removed.
+
+    A version can be reserved (@see reserve), the reservation creates the version
+    directory atomically. Therefore, concurrent reservations (threads or
+    processes) always get distinct versions.
+
+    Also, make sure you always query the singleton instance through the "get"
+    method.
+    """
+
+    __singleton = None
+    __versionRegEx = re.compile("^v[0-9]{3}$")
+
+    # directories modified in the last seconds are listed again, since further
+    # modifications may happen within the resolution of the modification time
+    __minimumAge = 2.0
+
+    def __init__(self):
+        """
+        Create a version index object (@See VersionIndex.get).
+        """
+        assert self.__singleton is None, "Can only have one instance!"
+
+        self.__lock = threading.RLock()
+        self.__entries = {}
+
+    def latest(self, versionsPath):
+        """
+        Return the latest version found under the versions path.
+
+        In case none version is found, it returns 0 by default.
+        """
+        with self.__lock:
+            return self.__queryLatest(os.path.normpath(versionsPath))
+
+    def new(self, versionsPath):
+        """
+        Return the version following the latest version (it does not reserve it).
+        """
+        return self.latest(versionsPath) + 1
+
+    def reserve(self, versionsPath, version=None):
+        """
+        Reserve and return a new version by creating the version directory under the versions path.
+
+        When a version is provided the reservation starts from it, in case the version
+        has been taken in the meantime the following available version is reserved.
+        """
+        versionsPath = os.path.normpath(versionsPath)
+        with self.__lock:
+            if not os.path.exists(versionsPath):
+                os.makedirs(versionsPath)
+
+            if version is None:
+                version = self.latest(versionsPath) + 1
+            while True:
+                try:
+                    os.mkdir(os.path.join(versionsPath, self.versionName(version)))
+                except FileExistsError:
+                    # the version has been created by another process
+                    if not os.path.isdir(os.path.join(versionsPath, self.versionName(version))):
+                        raise
+                    version += 1
+                else:
+                    break
+
+        return version
+
+    def clear(self):
+        """
+        Remove all the information cached by the index.
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    @classmethod
+    def versionName(cls, version):
+        """
+        Return the name used by the version (for instance: v001).
+        """
+        return 'v' + str(version).zfill(3)
+
+    @classmethod
+    def get(cls):
+        """
+        Return the singleton version index instance.
+        """
+        if cls.__singleton is None:
+            cls.__singleton = VersionIndex()
+
+        return cls.__singleton
+
+    def __queryLatest(self, versionsPath):
+        """
+        Return the latest version found on disk under the versions path (using the cache when possible).
+        """
+        try:
+            statResult = os.stat(versionsPath)
+        except OSError:
+            self.__entries.pop(versionsPath, None)
+            return 0
+
+        mtime = statResult.st_mtime
+        entry = self.__entries.get(versionsPath)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+
+        # finding the latest version
+        version = 0
+        for directory in os.listdir(versionsPath):
+            if self.__versionRegEx.match(directory):
+                version = max(int(directory[1:]), version)
+
+        if time.time() - mtime >= self.__minimumAge:
+            self.__entries[versionsPath] = (mtime, version)
+        else:
+            self.__entries.pop(versionsPath, None)
+
+        return version
@@ -1,9 +1,13 @@
+from .Tracer import Tracer, TraceHook, ChromeTraceRecorder
 from .PathHolder import PathHolder
+from .VersionIndex import VersionIndex
+from .PathIndex import PathIndex
 from . import Crawler
 from .Template import Template, RequiredPathNotFoundError, VariableNotFoundError
 from .CrawlerQuery import CrawlerQuery
 from . import TemplateProcedure
 from .CrawlerMatcher import CrawlerMatcher
+from .CrawlerIndex import CrawlerIndex
 from . import Task
 from . import TaskWrapper
 from .TaskHolder import TaskHolder, TaskHolderInvalidVarNameError
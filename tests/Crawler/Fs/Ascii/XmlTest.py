@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 import unittest
 from ....BaseTestCase import BaseTestCase
 from centipede.Crawler.Fs import FsPath
@@ -34,6 +36,26 @@ class XmlTest(BaseTestCase):
         self.assertEqual(crawler.queryTag('{TestNamespace}testD1', ignoreNameSpace=False)[0], "1 2 3")
         self.assertEqual(crawler.queryTag('testB')[1]['id'], "123")
 
+    def testXmlClone(self):
+        """
+        Test that the query cache is not shared by cloned crawlers.
+        """
+        temporaryDir = tempfile.mkdtemp()
+        try:
+            xmlFile = os.path.join(temporaryDir, 'test.xml')
+            shutil.copy(self.__xmlFile, xmlFile)
+            crawler = FsPath.createFromPath(xmlFile)
+            self.assertEqual(crawler.queryTag('testC')[0], "testing child C")
+
+            with open(xmlFile, 'w') as f:
+                f.write('<testA><testC>modified</testC></testA>')
+
+            clone = crawler.clone()
+            self.assertEqual(clone.queryTag('testC')[0], "modified")
+            self.assertEqual(crawler.queryTag('testC')[0], "testing child C")
+        finally:
+            shutil.rmtree(temporaryDir)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,17 @@
 import os
+import gc
+import sys
 import glob
+import json
+import shutil
+import tempfile
+import tracemalloc
 import unittest
 from ...BaseTestCase import BaseTestCase
 from centipede.Crawler import Crawler
 from centipede.Crawler.Fs import FsPath
 from centipede.Crawler.Fs import File
+from centipede.Crawler.Fs import CrawlCache
 from centipede.PathHolder import PathHolder
 from centipede.Crawler.Fs.Render import ExrRender
 from centipede.Crawler.Fs.Image import Exr
@@ -17,6 +24,15 @@ class FsPathTest(BaseTestCase):
     __dir = os.path.join(BaseTestCase.dataDirectory(), "glob")
     __turntableFile = os.path.join(__dir, "images", "RND_ass_lookdev_default_beauty_tt.1001.exr")
     __shotRenderFile = os.path.join(__dir, "images", "RND-TST-SHT_lighting_beauty_sr.1001.exr")
+    __testCrawlerTypes = ("dummy", "dummyHints", "dummyDispatch", "dummyInheritedHints", "dummyWidenedHints", "dummyCache")
+
+    def tearDown(self):
+        """
+        Remove the crawler types registered by the tests.
+        """
+        for crawlerType in self.__testCrawlerTypes:
+            if crawlerType in Crawler.registeredNames():
+                Crawler.unregister(crawlerType)
 
     def testFsCrawler(self):
         """
@@ -61,6 +77,35 @@ class FsPathTest(BaseTestCase):
         otherCrawlerPaths = list(map(lambda x: x.var("filePath"), otherCrawlers))
         self.assertCountEqual(crawlerPaths, otherCrawlerPaths)
 
+    def testFsPathGlobParallel(self):
+        """
+        Test that the parallel glob returns the same result as the serial glob.
+        """
+        crawler = Crawler.create(PathHolder(self.__dir))
+        crawlerPaths = list(map(lambda x: x.var("filePath"), crawler.glob(useCache=False)))
+        parallelPaths = list(map(lambda x: x.var("filePath"), crawler.glob(useCache=False, workers=4)))
+        self.assertEqual(crawlerPaths, parallelPaths)
+
+        crawlers = crawler.glob(filterTypes=['exr'], useCache=False, workers=4)
+        crawlerPaths = list(map(lambda x: x.var("filePath"), crawlers))
+        result = glob.glob("{}/**/**.exr".format(self.__dir), recursive=True)
+        self.assertCountEqual(result, crawlerPaths)
+
+    def testFsPathIterGlob(self):
+        """
+        Test that the iterGlob yields the same crawlers returned by glob.
+        """
+        crawler = Crawler.create(PathHolder(self.__dir))
+        crawlerPaths = list(map(lambda x: x.var("filePath"), crawler.glob(useCache=False)))
+        iterPaths = list(map(lambda x: x.var("filePath"), crawler.iterGlob()))
+        self.assertEqual(crawlerPaths, iterPaths)
+
+        crawlers = crawler.iterGlob(filterTypes=[ExrRender])
+        self.assertNotIsInstance(crawlers, list)
+        crawlerPaths = list(map(lambda x: x.var("filePath"), crawlers))
+        result = glob.glob("{}/**/RND**.exr".format(self.__dir), recursive=True)
+        self.assertCountEqual(result, crawlerPaths)
+
     def testPathVariables(self):
         """
         Test that the crawler variables are set properly.
@@ -81,6 +126,52 @@ class FsPathTest(BaseTestCase):
         crawler = Crawler.create(PathHolder(self.__turntableFile))
         self.assertRaises(InvalidTagError, crawler.tag, "dummyTag")
 
+    def testCrawlerAccessors(self):
+        """
+        Test the accessors used to query variables and tags without listing them.
+        """
+        crawler = Crawler.create(PathHolder(self.__turntableFile))
+        self.assertTrue(crawler.hasVar('filePath'))
+        self.assertFalse(crawler.hasVar('dummyVar'))
+        self.assertEqual(crawler.varOr('filePath'), self.__turntableFile)
+        self.assertIsNone(crawler.varOr('dummyVar'))
+        self.assertEqual(crawler.varOr('dummyVar', 'default'), 'default')
+
+        self.assertFalse(crawler.hasTag('dummyTag'))
+        self.assertEqual(crawler.tagOr('dummyTag', 'default'), 'default')
+        crawler.setTag('dummyTag', 'value')
+        self.assertTrue(crawler.hasTag('dummyTag'))
+        self.assertEqual(crawler.tagOr('dummyTag', 'default'), 'value')
+
+    def testCrawlerAccessorsGlob(self):
+        """
+        Test that the accessors match the variable and tag names of the crawlers found by glob.
+        """
+        temporaryDir = tempfile.mkdtemp()
+        try:
+            for frame in range(20):
+                open(os.path.join(temporaryDir, 'plate.{:04d}.exr'.format(frame)), 'w').close()
+            crawlers = FsPath.createFromPath(temporaryDir).glob(['exr'])
+        finally:
+            shutil.rmtree(temporaryDir)
+
+        self.assertEqual(len(crawlers), 20)
+        for crawler in crawlers:
+            for varName in ('frame', 'padding', 'filePath', 'dummy'):
+                self.assertEqual(crawler.hasVar(varName), varName in crawler.varNames())
+
+            for tagName in ('group', 'dummy'):
+                self.assertEqual(crawler.hasTag(tagName), tagName in crawler.tagNames())
+
+            self.assertEqual(crawler.varOr('frame'), crawler.var('frame'))
+            self.assertIsNone(crawler.varOr('dummy'))
+            self.assertEqual(crawler.varOr('dummy', 'default'), 'default')
+            self.assertEqual(crawler.tagOr('group'), crawler.tag('group'))
+            self.assertIsNone(crawler.tagOr('dummy'))
+            self.assertEqual(crawler.tagOr('dummy', 'default'), 'default')
+
+        self.assertEqual(len(Crawler.group(crawlers)), 1)
+
     def testCrawlerRegistration(self):
         """
         Test that you can register a new crawler.
@@ -95,16 +186,318 @@ class FsPathTest(BaseTestCase):
         self.assertIn(DummyCrawler, Crawler.registeredSubclasses("generic"))
         self.assertIn(DummyCrawler, Crawler.registeredSubclasses(FsPath))
 
+    def testCrawlerDispatchHints(self):
+        """
+        Test that the crawler types are narrowed down by the dispatch hints.
+        """
+        temporaryFile = tempfile.NamedTemporaryFile(suffix='.dispatchtest')
+        pathHolder = PathHolder(temporaryFile.name)
+
+        class DummyHintsCrawler(File):
+            @classmethod
+            def test(cls, pathHolder, parentCrawler):
+                raise Exception("test should not be called")
+
+            @classmethod
+            def dispatchHints(cls):
+                hints = super(DummyHintsCrawler, cls).dispatchHints()
+                hints['extensions'] = ['dummyext']
+                return hints
+
+        Crawler.register("dummyHints", DummyHintsCrawler)
+        self.assertNotIsInstance(Crawler.create(pathHolder), DummyHintsCrawler)
+
+        # the latest registered crawler type has priority
+        class DummyDispatchCrawler(File):
+            @classmethod
+            def test(cls, pathHolder, parentCrawler):
+                if not super(DummyDispatchCrawler, cls).test(pathHolder, parentCrawler):
+                    return False
+                return pathHolder.ext() == 'dispatchtest'
+
+        Crawler.register("dummyDispatch", DummyDispatchCrawler)
+        crawler = Crawler.create(pathHolder)
+        self.assertIsInstance(crawler, DummyDispatchCrawler)
+        self.assertEqual(crawler.var('type'), 'dummyDispatch')
+
+        # re-implemented test inherits the hints
+        class DummyInheritedHintsCrawler(DummyHintsCrawler):
+            @classmethod
+            def test(cls, pathHolder, parentCrawler):
+                raise Exception("test should not be called")
+
+        Crawler.register("dummyInheritedHints", DummyInheritedHintsCrawler)
+        self.assertIsInstance(Crawler.create(pathHolder), DummyDispatchCrawler)
+
+        # re-implemented test widening the inherited hints
+        class DummyWidenedHintsCrawler(DummyHintsCrawler):
+            @classmethod
+            def test(cls, pathHolder, parentCrawler):
+                return pathHolder.ext() == 'dispatchtest'
+
+            @classmethod
+            def dispatchHints(cls):
+                hints = super(DummyWidenedHintsCrawler, cls).dispatchHints()
+                hints['extensions'] = hints['extensions'] + ['dispatchtest']
+                return hints
+
+        Crawler.register("dummyWidenedHints", DummyWidenedHintsCrawler)
+        self.assertEqual(
+            DummyWidenedHintsCrawler.dispatchHints(),
+            {'dataType': PathHolder, 'kind': 'file', 'extensions': ['dummyext', 'dispatchtest']}
+        )
+        self.assertIsInstance(Crawler.create(pathHolder), DummyWidenedHintsCrawler)
+
+        # removing the registration
+        Crawler.unregister("dummyWidenedHints")
+        self.assertNotIn("dummyWidenedHints", Crawler.registeredNames())
+        self.assertIsInstance(Crawler.create(pathHolder), DummyDispatchCrawler)
+        temporaryFile.close()
+
+    def testCrawlerInheritedDispatchHints(self):
+        """
+        Test that the crawlers re-implementing the test inherit the dispatch hints of the base class.
+        """
+        from centipede.Crawler.Fs.Render import ShotRender
+        from centipede.Crawler.Fs.Lut import Ccc
+        from centipede.Crawler.Fs.Ascii import Xml
+
+        self.assertEqual(ShotRender.dispatchHints(), Exr.dispatchHints())
+        self.assertEqual(Ccc.dispatchHints()['extensions'], ['ccc', 'cc'])
+        for crawlerClass in (Ccc, Xml):
+            self.assertEqual(crawlerClass.dispatchHints()['dataType'], PathHolder)
+            self.assertEqual(crawlerClass.dispatchHints()['kind'], 'file')
+
+        self.assertIsInstance(FsPath.createFromPath(self.__shotRenderFile), ShotRender)
+
+    def testCrawlerVarScope(self):
+        """
+        Test that the variables are inherited from the parent crawler without affecting it.
+        """
+        parentCrawler = FsPath.createFromPath(self.dataDirectory())
+        parentCrawler.setVar('parentVar', 'a', True)
+        crawler = FsPath.createFromPath(os.path.join(self.dataDirectory(), "test.txt"), parentCrawler=parentCrawler)
+        self.assertTrue(crawler.hasVar('parentVar'))
+        self.assertEqual(crawler.var('parentVar'), 'a')
+        self.assertIn('parentVar', crawler.contextVarNames())
+        self.assertEqual(crawler.var('sourceDirectory'), parentCrawler.var('sourceDirectory'))
+
+        # changes are isolated between the parent and child crawlers
+        parentCrawler.setVar('parentVar', 'b')
+        parentCrawler.setVar('otherVar', 'b')
+        crawler.setVar('childVar', 'c')
+        self.assertEqual(crawler.var('parentVar'), 'a')
+        self.assertFalse(crawler.hasVar('otherVar'))
+        self.assertFalse(parentCrawler.hasVar('childVar'))
+        self.assertNotIn('parentVar', parentCrawler.contextVarNames())
+        self.assertIn('parentVar', crawler.contextVarNames())
+
+    def testCrawlerCompactMemory(self):
+        """
+        Test that crawlers use slots and share the variables of the parent crawler until they are modified.
+        """
+        # crawler types shipped with centipede (resources can register their own)
+        for crawlerType in Crawler.registeredNames():
+            crawlerClass = Crawler.registeredType(crawlerType)
+            if not crawlerClass.__module__.startswith('centipede.Crawler'):
+                continue
+
+            for baseClass in crawlerClass.__mro__[:-1]:
+                self.assertIn('__slots__', vars(baseClass), baseClass.__name__)
+
+        temporaryDir = tempfile.mkdtemp()
+        try:
+            for frame in range(10):
+                open(os.path.join(temporaryDir, 'plate.{:04d}.exr'.format(frame)), 'w').close()
+
+            parentCrawler = FsPath.createFromPath(temporaryDir)
+            parentCrawler.setVar('listVar', [1])
+            crawlers = parentCrawler.glob(['exr'], useCache=False)
+        finally:
+            shutil.rmtree(temporaryDir)
+
+        self.assertEqual(len(crawlers), 10)
+        for crawler in crawlers:
+            self.assertFalse(hasattr(crawler, '__dict__'))
+
+            # the variables of the parent are shared rather than copied
+            self.assertIs(crawler.var('listVar'), parentCrawler.var('listVar'))
+
+        # writing to a crawler does not copy (or modify) the shared variables
+        crawlers[0].setVar('otherVar', 'a')
+        self.assertIs(crawlers[0].var('listVar'), parentCrawler.var('listVar'))
+        self.assertFalse(crawlers[1].hasVar('otherVar'))
+        self.assertFalse(parentCrawler.hasVar('otherVar'))
+
+        # writing to the parent only affects the parent
+        parentCrawler.setVar('listVar', [2])
+        for crawler in crawlers:
+            self.assertEqual(crawler.var('listVar'), [1])
+
+    def testCrawlerMemoryBenchmark(self):
+        """
+        Report the memory used per crawler when globbing an image sequence (it does not assert the memory).
+
+        The compact crawlers are compared against the same information held by
+        dicts per crawler (the representation used before the slotted crawlers).
+        Reference (5000 exr frames, python 3.11): ~1690 bytes per crawler using
+        a dict per crawler, ~950 bytes per crawler using the compact representation.
+        """
+        class DictCrawler(object):
+            def __init__(self, crawler):
+                self.vars = dict((x, crawler.var(x)) for x in crawler.varNames())
+                self.contextVarNames = set(crawler.contextVarNames())
+                self.tags = dict((x, crawler.tag(x)) for x in crawler.tagNames())
+                self.children = None
+                self.globCache = None
+                self.pathHolder = {'path': crawler.pathHolder().path()}
+
+        def memoryUsage(callable):
+            gc.collect()
+            tracemalloc.start()
+            try:
+                snapshot = tracemalloc.take_snapshot()
+                result = callable()
+                gc.collect()
+                usage = sum(x.size_diff for x in tracemalloc.take_snapshot().compare_to(snapshot, 'filename'))
+            finally:
+                tracemalloc.stop()
+
+            return result, usage
+
+        totalFrames = 2000
+        temporaryDir = tempfile.mkdtemp()
+        try:
+            for frame in range(totalFrames):
+                open(os.path.join(temporaryDir, 'plate.{:04d}.exr'.format(frame)), 'w').close()
+
+            # only the converted crawlers are kept alive by the dict glob
+            crawlers, compactUsage = memoryUsage(
+                lambda: FsPath.createFromPath(temporaryDir).glob()
+            )
+            dictCrawlers, dictUsage = memoryUsage(
+                lambda: list(map(DictCrawler, FsPath.createFromPath(temporaryDir).glob()))
+            )
+        finally:
+            shutil.rmtree(temporaryDir)
+
+        self.assertEqual(len(crawlers), totalFrames + 1)
+        self.assertEqual(len(dictCrawlers), totalFrames + 1)
+        sys.stderr.write(
+            '\ncrawler memory ({0} exr frames): {1:.0f} bytes per crawler (dict), {2:.0f} bytes per crawler (compact) '.format(
+                totalFrames,
+                dictUsage / float(len(dictCrawlers)),
+                compactUsage / float(len(crawlers))
+            )
+        )
+
+    def testCrawlCache(self):
+        """
+        Test that the children of unchanged directories are restored from the crawl cache.
+        """
+        temporaryDir = tempfile.mkdtemp()
+        sourceDir = os.path.join(temporaryDir, 'source')
+        os.makedirs(os.path.join(sourceDir, 'plates'))
+        for frame in range(3):
+            open(os.path.join(sourceDir, 'plates', 'plate.{:04d}.exr'.format(frame)), 'w').close()
+        open(os.path.join(sourceDir, 'notes.txt'), 'w').close()
+
+        # making sure the directories are old enough to be cached
+        for directory in (sourceDir, os.path.join(sourceDir, 'plates')):
+            os.utime(directory, (1000000000, 1000000000))
+
+        os.environ['CENTIPEDE_CRAWL_CACHE_DIR'] = os.path.join(temporaryDir, 'cache')
+        try:
+            crawlers = FsPath.createFromPath(sourceDir).glob()
+            cachedCrawlers = FsPath.createFromPath(sourceDir).glob()
+            self.assertEqual(len(crawlers), 6)
+            self.assertEqual(
+                list(map(lambda x: (type(x), x.var('fullPath')), crawlers)),
+                list(map(lambda x: (type(x), x.var('fullPath')), cachedCrawlers))
+            )
+            for crawler, cachedCrawler in zip(crawlers, cachedCrawlers):
+                self.assertCountEqual(crawler.varNames(), cachedCrawler.varNames())
+                self.assertCountEqual(crawler.tagNames(), cachedCrawler.tagNames())
+                for varName in crawler.varNames():
+                    self.assertEqual(crawler.var(varName), cachedCrawler.var(varName))
+                self.assertEqual(crawler.pathHolder().path(), cachedCrawler.pathHolder().path())
+
+            # the entries are written to the database once the glob is done
+            crawlCache = CrawlCache(os.path.join(temporaryDir, 'cache'))
+            crawler = FsPath.createFromPath(sourceDir)
+            self.assertIsNotNone(crawlCache.children(crawler))
+
+            # buffered entries are only visible to other processes after a flush
+            plateCrawler = FsPath.createFromPath(os.path.join(sourceDir, 'plates'))
+            plateCrawler.setVar('flushTest', True)
+            CrawlCache.default().setChildren(plateCrawler, plateCrawler.children())
+            self.assertIsNotNone(CrawlCache.default().children(plateCrawler))
+            self.assertIsNone(crawlCache.children(plateCrawler))
+            CrawlCache.default().flush()
+            self.assertIsNotNone(crawlCache.children(plateCrawler))
+
+            # removing a file without changing the modification time of the
+            # directory, the cached children are still used
+            os.remove(os.path.join(sourceDir, 'notes.txt'))
+            os.utime(sourceDir, (1000000000, 1000000000))
+            self.assertEqual(len(FsPath.createFromPath(sourceDir).glob()), 6)
+
+            # modified directories are crawled again
+            os.utime(sourceDir, (1000000100, 1000000100))
+            self.assertEqual(len(FsPath.createFromPath(sourceDir).glob()), 5)
+
+            # registering a different class under the same crawler type name
+            # invalidates the cached children
+            class DummyCrawler(File):
+                @classmethod
+                def test(cls, pathHolder, parentCrawler):
+                    return False
+
+            class OtherDummyCrawler(DummyCrawler):
+                pass
+
+            Crawler.register('dummyCache', DummyCrawler)
+            crawler = FsPath.createFromPath(sourceDir)
+            crawler.glob()
+            self.assertIsNotNone(CrawlCache.default().children(crawler))
+
+            Crawler.unregister('dummyCache')
+            Crawler.register('dummyCache', OtherDummyCrawler)
+            self.assertIsNone(CrawlCache.default().children(crawler))
+
+            CrawlCache.default().clear()
+        finally:
+            del os.environ['CENTIPEDE_CRAWL_CACHE_DIR']
+            shutil.rmtree(temporaryDir)
+
+        self.assertIsNone(CrawlCache.default())
+
     def testCrawlerClone(self):
         """
         Test that cloning crawlers works.
         """
         crawler = Crawler.create(PathHolder(self.__turntableFile))
+        crawler.setVar('listVar', [1], True)
         clone = crawler.clone()
+        self.assertIsInstance(clone, type(crawler))
         self.assertCountEqual(crawler.varNames(), clone.varNames())
         self.assertCountEqual(crawler.contextVarNames(), clone.contextVarNames())
         self.assertCountEqual(crawler.tagNames(), clone.tagNames())
 
+        # changes are isolated between the crawler and the clone
+        clone.setVar('name', 'cloneName')
+        clone.var('listVar').append(2)
+        clone.setTag('cloneTag', 'value')
+        self.assertNotEqual(crawler.var('name'), 'cloneName')
+        self.assertEqual(crawler.var('listVar'), [1])
+        self.assertNotIn('cloneTag', crawler.tagNames())
+        crawler.setVar('filePath', 'otherPath')
+        self.assertNotEqual(clone.var('filePath'), 'otherPath')
+
+        # the path holder is not shared with the clone
+        self.assertIsNot(clone.pathHolder(), crawler.pathHolder())
+        self.assertEqual(clone.pathHolder().path(), self.__turntableFile)
+
     def testCrawlerJson(self):
         """
         Test that you can convert a crawler to json and back.
@@ -116,6 +509,75 @@ class FsPathTest(BaseTestCase):
         self.assertCountEqual(crawler.contextVarNames(), crawlerResult.contextVarNames())
         self.assertCountEqual(crawler.tagNames(), crawlerResult.tagNames())
 
+    def testCrawlerSerializeMany(self):
+        """
+        Test that you can serialize a list of crawlers in batch and back.
+        """
+        temporaryDir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(temporaryDir, 'subdir'))
+        for frame in range(3):
+            open(os.path.join(temporaryDir, 'plate.{:04d}.exr'.format(frame)), 'w').close()
+
+        try:
+            crawlers = FsPath.createFromPath(temporaryDir).glob()
+        finally:
+            shutil.rmtree(temporaryDir)
+
+        crawlers[0].setVar('listVar', [1], True)
+        crawlers[0].setTag('testTag', 'value')
+        crawlers[1].setVar('listVar', [1], True)
+        crawlerResults = Crawler.deserializeMany(Crawler.serializeMany(crawlers))
+
+        self.assertEqual(len(crawlers), len(crawlerResults))
+        for crawler, crawlerResult in zip(crawlers, crawlerResults):
+            self.assertIs(type(crawler), type(crawlerResult))
+            self.assertCountEqual(crawler.varNames(), crawlerResult.varNames())
+            self.assertCountEqual(crawler.contextVarNames(), crawlerResult.contextVarNames())
+            self.assertCountEqual(crawler.tagNames(), crawlerResult.tagNames())
+            for varName in crawler.varNames():
+                self.assertEqual(crawler.var(varName), crawlerResult.var(varName))
+
+        # shared mutable values should not be shared between crawlers
+        crawlerResults[0].var('listVar').append(2)
+        self.assertEqual(crawlerResults[1].var('listVar'), [1])
+        self.assertEqual(crawlerResults[0].tag('testTag'), 'value')
+
+        # crawlers serialized individually through toJson are still supported
+        legacyContents = json.dumps(list(map(lambda x: x.toJson(), crawlers)))
+        crawlerResults = Crawler.deserializeMany(legacyContents)
+        self.assertEqual(
+            list(map(lambda x: x.var('fullPath'), crawlers)),
+            list(map(lambda x: x.var('fullPath'), crawlerResults))
+        )
+
+    def testCrawlerSerializeManySequence(self):
+        """
+        Test the payload size and the round-trip of the batch serialization on an image sequence.
+
+        Reference (10k exr frames, python 3.11): legacy json ~5.4mb, batch ~0.9mb.
+        """
+        crawlers = []
+        for frame in range(1000):
+            crawlers.append(
+                FsPath.createFromPath('/tmp/centipedeSequence/plate.{:04d}.exr'.format(frame))
+            )
+
+        legacyContents = json.dumps(list(map(lambda x: x.toJson(), crawlers)))
+        batchContents = Crawler.serializeMany(crawlers)
+        self.assertLess(len(batchContents) * 4, len(legacyContents))
+
+        legacyResult = list(map(Crawler.createFromJson, json.loads(legacyContents)))
+        batchResult = Crawler.deserializeMany(batchContents)
+        self.assertEqual(len(legacyResult), len(batchResult))
+        self.assertEqual(batchResult[-1].var('frame'), 999)
+        for legacyCrawler, batchCrawler in zip(legacyResult, batchResult):
+            self.assertIs(type(legacyCrawler), type(batchCrawler))
+            self.assertEqual(
+                dict((x, legacyCrawler.var(x)) for x in legacyCrawler.varNames()),
+                dict((x, batchCrawler.var(x)) for x in batchCrawler.varNames())
+            )
+            self.assertCountEqual(legacyCrawler.contextVarNames(), batchCrawler.contextVarNames())
+
     def testCrawlerCreate(self):
         """
         Test that you can create a crawler with a specific type.
@@ -134,5 +596,28 @@ class FsPathTest(BaseTestCase):
         pathHolder = PathHolder("/")
         self.assertEqual(pathHolder.baseName(), os.sep)
 
+    def testPathHolderStat(self):
+        """
+        Test that PathHolder can be created from a pre-computed stat information.
+        """
+        testFile = os.path.join(BaseTestCase.dataDirectory(), "test.txt")
+        pathHolder = PathHolder(testFile, os.stat(testFile))
+        self.assertTrue(pathHolder.exists())
+        self.assertTrue(pathHolder.isFile())
+        self.assertEqual(pathHolder.size(), os.path.getsize(testFile))
+
+        dirEntries = dict((x.name, x) for x in os.scandir(BaseTestCase.dataDirectory()))
+        pathHolder = PathHolder(testFile, dirEntries["test.txt"])
+        self.assertTrue(pathHolder.exists())
+        self.assertFalse(pathHolder.isDirectory())
+        self.assertEqual(pathHolder.size(), os.path.getsize(testFile))
+
+        pathHolder = PathHolder(os.path.join(BaseTestCase.dataDirectory(), "glob"), dirEntries["glob"])
+        self.assertTrue(pathHolder.isDirectory())
+
+        pathHolder = PathHolder(os.path.join(BaseTestCase.dataDirectory(), "badFile.txt"))
+        self.assertFalse(pathHolder.exists())
+        self.assertIsNone(pathHolder.stat())
+
 if __name__ == "__main__":
     unittest.main()
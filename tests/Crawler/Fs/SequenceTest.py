@@ -0,0 +1,151 @@
+import os
+import shutil
+import tempfile
+import unittest
+from ...BaseTestCase import BaseTestCase
+from centipede.Crawler import Crawler
+from centipede.Crawler.Fs import FsPath
+from centipede.Crawler.Fs import Sequence
+from centipede.Crawler.Fs.Image import Exr
+
+class SequenceTest(BaseTestCase):
+    """Test Sequence crawler."""
+
+    __frames = [1, 2, 3, 5, 6, 10]
+
+    def setUp(self):
+        """
+        Create a temporary directory containing an image sequence.
+        """
+        self.__dir = tempfile.mkdtemp()
+        for frame in self.__frames:
+            open(os.path.join(self.__dir, 'plate.{:04d}.exr'.format(frame)), 'w').close()
+        open(os.path.join(self.__dir, 'notes.txt'), 'w').close()
+
+    def tearDown(self):
+        """
+        Remove the temporary directory.
+        """
+        shutil.rmtree(self.__dir)
+
+    def testSequenceCollapse(self):
+        """
+        Test that the directory walk produces a single crawler per sequence.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        crawler.setVar('collapseSequences', True)
+        crawlers = crawler.glob()
+        self.assertEqual(len(crawlers), 3)
+
+        sequences = crawler.glob(['sequence'])
+        self.assertEqual(len(sequences), 1)
+        sequence = sequences[0]
+        self.assertIsInstance(sequence, Sequence)
+        self.assertEqual(sequence.var('type'), 'sequence')
+        self.assertEqual(sequence.var('frameType'), 'exr')
+        self.assertEqual(sequence.var('name'), 'plate')
+        self.assertEqual(sequence.var('padding'), 4)
+        self.assertEqual(sequence.var('frameRanges'), [[1, 3], [5, 6], [10, 10]])
+        self.assertEqual(sequence.var('firstFrame'), 1)
+        self.assertEqual(sequence.var('lastFrame'), 10)
+        self.assertEqual(sequence.var('fullPath'), os.path.join(self.__dir, 'plate.####.exr'))
+        self.assertEqual(sequence.frames(), self.__frames)
+        self.assertNotIn('frame', sequence.varNames())
+
+    def testSequenceCollapseCreatesOneCrawler(self):
+        """
+        Test that the directory walk creates a single frame crawler per sequence.
+        """
+        createdPaths = []
+
+        class CountExr(Exr):
+            def __init__(self, *args, **kwargs):
+                super(CountExr, self).__init__(*args, **kwargs)
+                createdPaths.append(self.var('filePath'))
+
+            @classmethod
+            def test(cls, pathHolder, parentCrawler):
+                return super(CountExr, cls).test(pathHolder, parentCrawler) and \
+                    pathHolder.path().startswith(parentCrawler.var('filePath'))
+
+        Crawler.register('countExrSequenceTest', CountExr)
+        try:
+            for frame in self.__frames:
+                open(os.path.join(self.__dir, 'other_{:04d}.exr'.format(frame)), 'w').close()
+
+            crawler = FsPath.createFromPath(self.__dir)
+            crawler.setVar('collapseSequences', True)
+            sequences = crawler.glob(['sequence'])
+        finally:
+            Crawler.unregister('countExrSequenceTest')
+
+        self.assertEqual(len(createdPaths), 2)
+        self.assertCountEqual(
+            [x.var('baseName') for x in sequences],
+            ['plate.####.exr', 'other_####.exr']
+        )
+        for sequence in sequences:
+            self.assertEqual(sequence.var('frameType'), 'countExrSequenceTest')
+            self.assertEqual(sequence.frames(), self.__frames)
+
+    def testSequenceParseFileName(self):
+        """
+        Test that the file names are parsed following the naming of the frames.
+        """
+        self.assertEqual(Sequence.parseFileName('plate.0001.exr'), ('plate.####.exr', 1))
+        self.assertEqual(Sequence.parseFileName('plate_0012.exr'), ('plate_####.exr', 12))
+        self.assertEqual(Sequence.parseFileName('a.b.10.tif'), ('a.b.##.tif', 10))
+        self.assertIsNone(Sequence.parseFileName('plate_01.exr'))
+        self.assertIsNone(Sequence.parseFileName('0001.exr'))
+        self.assertIsNone(Sequence.parseFileName('notes.txt'))
+
+    def testSequenceFrameCrawlers(self):
+        """
+        Test that the sequence can be expanded to per frame crawlers.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        crawler.setVar('collapseSequences', True)
+        sequence = crawler.glob(['sequence'])[0]
+        sequence.setVar('shot', 'AB_001', True)
+
+        frameCrawlers = sequence.frameCrawlers()
+        expectedCrawlers = sorted(
+            FsPath.createFromPath(self.__dir).glob(['exr']),
+            key=lambda x: x.var('frame')
+        )
+        self.assertEqual(len(frameCrawlers), len(expectedCrawlers))
+        for frameCrawler, expectedCrawler in zip(frameCrawlers, expectedCrawlers):
+            self.assertIsInstance(frameCrawler, Exr)
+            for varName in expectedCrawler.varNames():
+                self.assertEqual(frameCrawler.var(varName), expectedCrawler.var(varName))
+            self.assertEqual(frameCrawler.tag('group'), expectedCrawler.tag('group'))
+            self.assertEqual(frameCrawler.var('shot'), 'AB_001')
+            self.assertIn('shot', frameCrawler.contextVarNames())
+
+    def testSequenceCreate(self):
+        """
+        Test that sequence crawlers are created from lists and tuples of frame crawlers.
+        """
+        frameCrawlers = FsPath.createFromPath(self.__dir).glob(['exr'])
+        for data in (list(frameCrawlers), tuple(frameCrawlers)):
+            sequence = Crawler.create(data)
+            self.assertIsInstance(sequence, Sequence)
+            self.assertEqual(sequence.frames(), self.__frames)
+
+    def testSequenceSerialization(self):
+        """
+        Test that sequence crawlers can be serialized.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        crawler.setVar('collapseSequences', True)
+        sequence = crawler.glob(['sequence'])[0]
+
+        for result in (Crawler.createFromJson(sequence.toJson()), Crawler.deserializeMany(Crawler.serializeMany([sequence]))[0]):
+            self.assertIsInstance(result, Sequence)
+            self.assertEqual(result.var('fullPath'), sequence.var('fullPath'))
+            self.assertEqual(result.frames(), self.__frames)
+            self.assertEqual(len(result.frameCrawlers()), len(self.__frames))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,3 +7,4 @@ from . import Texture
 from . import Video
 from .DirectoryTest import DirectoryTest
 from .FsPathTest import FsPathTest
+from .SequenceTest import SequenceTest
@@ -0,0 +1,69 @@
+import os
+import unittest
+from .BaseTestCase import BaseTestCase
+from centipede.Crawler.Fs import FsPath
+from centipede.CrawlerMatcher import CrawlerMatcher
+from centipede.CrawlerIndex import CrawlerIndex
+from centipede.TaskHolderLoader import JsonLoader
+
+class CrawlerIndexTest(BaseTestCase):
+    """Test CrawlerIndex."""
+
+    __jsonConfig = os.path.join(BaseTestCase.dataDirectory(), 'config', 'test.json')
+
+    def setUp(self):
+        """
+        Create the crawlers used by the tests.
+        """
+        self.__crawlers = []
+        for index in range(40):
+            crawlerType = ('exr', 'jpg', 'png')[index % 3]
+            crawler = FsPath.createFromPath(
+                '/tmp/plates/shot_{0}/plate.{1}.{2}'.format(index % 4, 1000 + index, crawlerType),
+                crawlerType
+            )
+            crawler.setVar('shot', 'AB_00{0}'.format(index % 4))
+            if index % 5:
+                crawler.setVar('imageType', 'sequence')
+            self.__crawlers.append(crawler)
+
+    def testCrawlerIndexMatch(self):
+        """
+        Test that the crawlers matched through the index are the same matched by the matcher.
+        """
+        crawlerIndex = CrawlerIndex(self.__crawlers)
+        matchers = [
+            CrawlerMatcher(),
+            CrawlerMatcher(['exr']),
+            CrawlerMatcher(['exr', 'png']),
+            CrawlerMatcher(['exr'], {'shot': 'AB_001'}),
+            CrawlerMatcher(['jpg'], {'shot': ['AB_000', 'AB_003'], 'imageType': 'sequence'}),
+            CrawlerMatcher(matchVars={'shot': 'AB_00[12]'}),
+            CrawlerMatcher(matchVars={'shot': ['AB_002', 'AB_*']}),
+            CrawlerMatcher(['exr'], {'shot': 'XX'}),
+            CrawlerMatcher(matchVars={'missing': 'value'})
+        ]
+
+        for matcher in matchers:
+            self.assertEqual(
+                crawlerIndex.match(matcher),
+                list(filter(matcher.match, self.__crawlers))
+            )
+
+    def testCrawlerIndexTaskHolderQuery(self):
+        """
+        Test that task holders can be queried through the index.
+        """
+        taskHolderLoader = JsonLoader()
+        taskHolderLoader.addFromJsonFile(self.__jsonConfig)
+        crawlers = self.__crawlers + FsPath.createFromPath(os.path.dirname(self.__jsonConfig)).glob()
+        crawlerIndex = CrawlerIndex(crawlers)
+
+        for taskHolder in taskHolderLoader.taskHolders():
+            result = taskHolder.query(crawlerIndex)
+            self.assertTrue(result)
+            self.assertEqual(list(result.items()), list(taskHolder.query(crawlers).items()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from .BaseTestCase import BaseTestCase
+from centipede.Crawler import Crawler
+from centipede.Crawler.Fs import FsPath
+from centipede.Crawler.Fs.Image import Exr
+from centipede.CrawlerMatcher import CrawlerMatcher
+
+class CrawlerMatcherTest(BaseTestCase):
+    """Test CrawlerMatcher."""
+
+    def testCrawlerMatcherTypes(self):
+        """
+        Test that crawlers are matched by type (including derived types).
+        """
+        crawler = FsPath.createFromPath('/tmp/plates/plate.1001.exr', 'exr')
+        self.assertTrue(CrawlerMatcher(['exr']).match(crawler))
+        self.assertFalse(CrawlerMatcher(['jpg', 'png']).match(crawler))
+        self.assertTrue(CrawlerMatcher(['jpg', 'exr']).match(crawler))
+        self.assertFalse(CrawlerMatcher(['jpg']).match(crawler))
+        self.assertTrue(CrawlerMatcher().match(crawler))
+
+        # types registered after the matcher has been used
+        class CustomExr(Exr):
+            @classmethod
+            def test(cls, data, parentCrawler=None):
+                return False
+
+        matcher = CrawlerMatcher(['exr'])
+        self.assertTrue(matcher.match(crawler))
+        Crawler.register('customExrMatcherTest', CustomExr)
+        try:
+            customCrawler = FsPath.createFromPath('/tmp/plates/plate.1001.exr', 'exr')
+            customCrawler.setVar('type', 'customExrMatcherTest')
+            self.assertTrue(matcher.match(customCrawler))
+        finally:
+            Crawler.unregister('customExrMatcherTest')
+
+    def testCrawlerMatcherVars(self):
+        """
+        Test that crawlers are matched by variables (exact values and glob patterns).
+        """
+        crawler = FsPath.createFromPath('/tmp/plates/plate.1001.exr', 'exr')
+        crawler.setVar('shot', 'AB_001')
+        crawler.setVar('width', 1920)
+
+        self.assertTrue(CrawlerMatcher(matchVars={'shot': 'AB_001'}).match(crawler))
+        self.assertTrue(CrawlerMatcher(matchVars={'shot': 'AB_*'}).match(crawler))
+        self.assertTrue(CrawlerMatcher(matchVars={'shot': ['CD_002', 'AB_00?']}).match(crawler))
+        self.assertTrue(CrawlerMatcher(matchVars={'width': 1920}).match(crawler))
+        self.assertTrue(CrawlerMatcher(matchVars={'width': '19[0-9]0'}).match(crawler))
+        self.assertFalse(CrawlerMatcher(matchVars={'shot': 'AB'}).match(crawler))
+        self.assertFalse(CrawlerMatcher(matchVars={'shot': ['CD_*', 'AB_01?']}).match(crawler))
+        self.assertFalse(CrawlerMatcher(matchVars={'seq': '*'}).match(crawler))
+        self.assertFalse(CrawlerMatcher(['jpg'], {'shot': 'AB_001'}).match(crawler))
+
+    def testCrawlerMatcherCompiled(self):
+        """
+        Test that the specification of the matcher is compiled once and invalidated by new registrations.
+        """
+        crawler = FsPath.createFromPath('/tmp/plates/plate.1001.exr', 'exr')
+        crawler.setVar('imageType', 'sequence')
+        crawler.setVar('shot', 'AB_001')
+        matcher = CrawlerMatcher(['exr'], {'imageType': ['sequence'], 'shot': 'AB_*'})
+
+        self.assertEqual(matcher.matchVarExactValues('imageType'), frozenset(['sequence']))
+        self.assertIsNone(matcher.matchVarExactValues('shot'))
+        self.assertIsNone(CrawlerMatcher().matchTypeSet())
+
+        # the compiled type set is reused while no crawler types are registered
+        typeSet = matcher.matchTypeSet()
+        self.assertIn('exr', typeSet)
+        self.assertTrue(matcher.match(crawler))
+        self.assertIs(matcher.matchTypeSet(), typeSet)
+
+        class CustomExr(Exr):
+            @classmethod
+            def test(cls, data, parentCrawler=None):
+                return False
+
+        Crawler.register('customExrCompiledTest', CustomExr)
+        try:
+            self.assertIsNot(matcher.matchTypeSet(), typeSet)
+            self.assertEqual(matcher.matchTypeSet(), typeSet | frozenset(['customExrCompiledTest']))
+        finally:
+            Crawler.unregister('customExrCompiledTest')
+
+        self.assertEqual(matcher.matchTypeSet(), typeSet)
+
+
+if __name__ == "__main__":
+    unittest.main()
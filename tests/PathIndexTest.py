@@ -0,0 +1,133 @@
+import os
+import shutil
+import tempfile
+import unittest
+from .BaseTestCase import BaseTestCase
+from centipede.PathIndex import PathIndex
+
+class PathIndexTest(BaseTestCase):
+    """Test PathIndex."""
+
+    def setUp(self):
+        """
+        Create a temporary directory tree.
+        """
+        self.__dir = tempfile.mkdtemp()
+        for directory in ('a/b/c', 'a/d', 'e'):
+            os.makedirs(os.path.join(self.__dir, directory))
+        for filePath in ('a/b/c/target.txt', 'e/target.txt', 'a/d/other.txt', 'root.txt'):
+            open(os.path.join(self.__dir, filePath), 'w').close()
+
+        # making sure the directories are old enough to be cached
+        for root, dirs, files in os.walk(self.__dir):
+            os.utime(root, (1000000000, 1000000000))
+
+        self.__refreshInterval = PathIndex.get().refreshInterval()
+        self.__workers = PathIndex.get().workers()
+        PathIndex.get().invalidate()
+
+    def tearDown(self):
+        """
+        Remove the temporary directory tree.
+        """
+        PathIndex.get().setRefreshInterval(self.__refreshInterval)
+        PathIndex.get().setWorkers(self.__workers)
+        shutil.rmtree(self.__dir)
+
+    def testPathIndexFind(self):
+        """
+        Test that files are found under the start path.
+        """
+        pathIndex = PathIndex.get()
+        self.assertEqual(pathIndex.find('root.txt', self.__dir), os.path.join(self.__dir, 'root.txt'))
+        self.assertEqual(pathIndex.find('other.txt', self.__dir), os.path.join(self.__dir, 'a', 'd', 'other.txt'))
+        self.assertEqual(pathIndex.find('d/other.txt', self.__dir), os.path.join(self.__dir, 'a', 'd', 'other.txt'))
+        self.assertEqual(pathIndex.find('c', self.__dir), os.path.join(self.__dir, 'a', 'b', 'c'))
+        self.assertEqual(pathIndex.find('target.txt', os.path.join(self.__dir, 'e')), os.path.join(self.__dir, 'e', 'target.txt'))
+        self.assertIn(
+            pathIndex.find('target.txt', self.__dir),
+            (os.path.join(self.__dir, 'a', 'b', 'c', 'target.txt'), os.path.join(self.__dir, 'e', 'target.txt'))
+        )
+        self.assertIsNone(pathIndex.find('missing.txt', self.__dir))
+        self.assertIsNone(pathIndex.find('target.txt', os.path.join(self.__dir, 'missing')))
+
+    def testPathIndexParallelFind(self):
+        """
+        Test that the index created by parallel scanning finds the same files.
+        """
+        pathIndex = PathIndex.get()
+        pathIndex.setWorkers(4)
+        self.assertEqual(pathIndex.find('other.txt', self.__dir), os.path.join(self.__dir, 'a', 'd', 'other.txt'))
+        self.assertEqual(pathIndex.find('c', self.__dir), os.path.join(self.__dir, 'a', 'b', 'c'))
+
+    def testPathIndexRFind(self):
+        """
+        Test that files are found under the parent directories.
+        """
+        pathIndex = PathIndex.get()
+        startPath = os.path.join(self.__dir, 'a', 'b', 'c')
+        self.assertEqual(pathIndex.rfind('target.txt', startPath), os.path.join(startPath, 'target.txt'))
+        self.assertEqual(pathIndex.rfind('root.txt', startPath), os.path.join(self.__dir, 'root.txt'))
+        self.assertEqual(pathIndex.rfind('d/other.txt', startPath), os.path.join(self.__dir, 'a', 'd', 'other.txt'))
+        self.assertIsNone(pathIndex.rfind('root.txt', startPath, os.path.join(self.__dir, 'a')))
+
+    def testPathIndexRefresh(self):
+        """
+        Test that the index is refreshed when the directories are modified.
+        """
+        pathIndex = PathIndex.get()
+        pathIndex.setRefreshInterval(3600)
+        self.assertIsNone(pathIndex.find('new.txt', self.__dir))
+
+        # the cached contents are used within the refresh interval
+        newFilePath = os.path.join(self.__dir, 'a', 'd', 'new.txt')
+        open(newFilePath, 'w').close()
+        self.assertIsNone(pathIndex.find('new.txt', self.__dir))
+
+        # invalidating the modified path
+        pathIndex.invalidate(newFilePath)
+        self.assertEqual(pathIndex.find('new.txt', self.__dir), newFilePath)
+
+        # checking the modification time of the directories
+        pathIndex.setRefreshInterval(0)
+        os.remove(newFilePath)
+        self.assertIsNone(pathIndex.find('new.txt', self.__dir))
+        self.assertIsNone(pathIndex.rfind('new.txt', os.path.join(self.__dir, 'a', 'd')))
+
+    def testPathIndexInvalidateNewDirectories(self):
+        """
+        Test that invalidating a path also detects the new directories created for it.
+        """
+        pathIndex = PathIndex.get()
+        pathIndex.setRefreshInterval(3600)
+        self.assertIsNone(pathIndex.find('new.txt', self.__dir))
+
+        newFilePath = os.path.join(self.__dir, 'a', 'f', 'g', 'new.txt')
+        os.makedirs(os.path.dirname(newFilePath))
+        open(newFilePath, 'w').close()
+        pathIndex.invalidate(newFilePath)
+        self.assertEqual(pathIndex.find('new.txt', self.__dir), newFilePath)
+
+    def testPathIndexMaxDepth(self):
+        """
+        Test that the file name index only covers the directories up to the maximum depth.
+        """
+        pathIndex = PathIndex.get()
+        maxDepth = pathIndex.maxDepth()
+        try:
+            for workers in (0, 4):
+                pathIndex.invalidate()
+                pathIndex.setWorkers(workers)
+                pathIndex.setMaxDepth(1)
+                self.assertEqual(pathIndex.find('target.txt', self.__dir), os.path.join(self.__dir, 'e', 'target.txt'))
+                self.assertIsNone(pathIndex.find('other.txt', self.__dir))
+                self.assertEqual(pathIndex.find('b', self.__dir), os.path.join(self.__dir, 'a', 'b'))
+
+                pathIndex.setMaxDepth(-1)
+                self.assertEqual(pathIndex.find('other.txt', self.__dir), os.path.join(self.__dir, 'a', 'd', 'other.txt'))
+        finally:
+            pathIndex.setMaxDepth(maxDepth)
+
+
+if __name__ == "__main__":
+    unittest.main()
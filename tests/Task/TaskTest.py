@@ -1,11 +1,16 @@
 import os
+import shutil
+import threading
+import tempfile
 import unittest
 from ..BaseTestCase import BaseTestCase
 from centipede.Crawler.Fs import FsPath
 from centipede.TaskHolderLoader import JsonLoader
 from centipede.TaskWrapper import TaskWrapper
 from centipede.Template import Template
+from centipede.TemplateProcedure import TemplateProcedure
 from centipede.Task import Task
+from centipede.Task.Fs import Copy
 from centipede.Task.Task import InvalidCrawlerError
 from centipede.Task.Task import TaskInvalidOptionError
 from centipede.Task.Task import TaskInvalidOptionValue
@@ -13,12 +18,54 @@ from centipede.Task.Task import TaskTypeNotFoundError
 from centipede.TaskHolder import TaskHolder, TaskHolderInvalidVarNameError
 from centipede.Crawler.Fs.Image import Jpg, Exr
 from centipede.Crawler import Crawler
+from centipede.PathIndex import PathIndex
 
 class TaskTest(BaseTestCase):
     """Test for tasks."""
 
     __jsonConfig = os.path.join(BaseTestCase.dataDirectory(), 'config', 'test.json')
 
+    def setUp(self):
+        """
+        Reset the task types registered by the test.
+        """
+        self.__testTaskTypes = []
+
+    def tearDown(self):
+        """
+        Remove the task types registered by the test.
+        """
+        for taskType in self.__testTaskTypes:
+            Task.unregister(taskType)
+
+    def __registerCallbackTask(self, taskType, callback, baseClass=Task):
+        """
+        Register a task type that calls callback(task, event, crawlers) when it begins and ends performing.
+
+        The crawlers are the input crawlers when it begins and the output crawlers when it ends.
+        """
+        class CallbackTask(baseClass):
+            def _perform(self):
+                callback(self, 'begin', self.crawlers())
+                result = super(CallbackTask, self)._perform()
+                callback(self, 'end', result)
+                return result
+
+        Task.register(taskType, CallbackTask)
+        self.__testTaskTypes.append(taskType)
+
+    @classmethod
+    def __createTaskHolder(cls, taskType, name, targetTemplate="{filePath}", metadata={}):
+        """
+        Create a task holder for a task type registered by the test.
+        """
+        task = Task.create(taskType)
+        task.setOption('name', name)
+        for metadataName, metadataValue in metadata.items():
+            task.setMetadata(metadataName, metadataValue)
+
+        return TaskHolder(task, Template(targetTemplate))
+
     def testTaskRegistration(self):
         """
         Test that you can register a new Task.
@@ -106,6 +153,312 @@ class TaskTest(BaseTestCase):
         taskHolder2.setStatus("ignore")
         self.assertEqual(len(taskHolder.run(crawlers)), len(crawlers))
 
+    def testParallelSubTaskHolders(self):
+        """
+        Test that sibling sub task holders run concurrently honoring dispatch.await.
+        """
+        events = []
+        siblingsBarrier = threading.Barrier(2, timeout=10)
+        lock = threading.Lock()
+
+        def callback(task, event, crawlers):
+            name = task.option('name')
+            with lock:
+                events.append((event, name))
+
+            # "a" and "b" can only pass the barrier when they run at the same time
+            if event == 'begin' and name in ('a', 'b') and task.option('parallel'):
+                siblingsBarrier.wait()
+        self.__registerCallbackTask('parallelTest', callback)
+
+        crawlers = [FsPath.createFromPath(self.__jsonConfig)]
+        taskHolder = self.__createTaskHolder('parallelTest', 'parent')
+        subTaskHolders = [
+            self.__createTaskHolder('parallelTest', 'await', metadata={'dispatch.await': True}),
+            self.__createTaskHolder('parallelTest', 'a'),
+            self.__createTaskHolder('parallelTest', 'b')
+        ]
+        for subTaskHolder in subTaskHolders:
+            taskHolder.addSubTaskHolder(subTaskHolder)
+        subTaskHolders[1].addSubTaskHolder(self.__createTaskHolder('parallelTest', 'c'))
+
+        for parallel in (True, False):
+            for subTaskHolder in subTaskHolders[1:]:
+                subTaskHolder.task().setOption('parallel', parallel)
+
+            del events[:]
+            if parallel:
+                result = taskHolder.run(crawlers, workers=4)
+            else:
+                result = taskHolder.run(crawlers)
+            self.assertEqual(len(result), len(crawlers) * 5)
+            self.assertFalse(siblingsBarrier.broken)
+
+            # the sub task holders run after the parent and "await" runs after
+            # its siblings (including their sub task holders)
+            self.assertEqual(events[:2], [('begin', 'parent'), ('end', 'parent')])
+            self.assertEqual(events[-2:], [('begin', 'await'), ('end', 'await')])
+            self.assertLess(events.index(('end', 'a')), events.index(('begin', 'c')))
+            self.assertEqual(len(events), 10)
+
+        # the same semantics apply when running the task holders serially
+        self.assertEqual(
+            [x[1] for x in events if x[0] == 'begin'],
+            ['parent', 'a', 'c', 'b', 'await']
+        )
+
+    def testParallelSubTaskHoldersLazyVars(self):
+        """
+        Test that parallel sub task holders do not share the crawlers whose variables are loaded on demand.
+        """
+        parentOutputCrawlers = []
+
+        def callback(task, event, crawlers):
+            if event == 'end' and task.option('name') == 'parent':
+                parentOutputCrawlers.extend(crawlers)
+        self.__registerCallbackTask('lazyVarsTest', callback)
+
+        exrFile = os.path.join(BaseTestCase.dataDirectory(), 'test.exr')
+        tempDir = tempfile.mkdtemp()
+        try:
+            crawlers = []
+            for index in range(20):
+                filePath = os.path.join(tempDir, 'test_{0}.exr'.format(index))
+                os.symlink(exrFile, filePath)
+                crawlers.append(FsPath.createFromPath(filePath))
+
+            taskHolder = self.__createTaskHolder('lazyVarsTest', 'parent')
+            for name in ('a', 'b'):
+                taskHolder.addSubTaskHolder(
+                    self.__createTaskHolder(
+                        'lazyVarsTest',
+                        name,
+                        os.path.join(tempDir, '{width}x{height}', name, '{baseName}')
+                    )
+                )
+
+            result = taskHolder.run(crawlers, workers=2)
+        finally:
+            shutil.rmtree(tempDir)
+
+        self.assertEqual(
+            sorted(x.var('filePath') for x in result[len(crawlers):]),
+            sorted(
+                os.path.join(tempDir, '1828x1556', name, x.var('baseName')) for name in ('a', 'b') for x in crawlers
+            )
+        )
+
+        # the width and height were loaded by the clones of the crawlers
+        # received by the sub task holders
+        self.assertEqual(len(parentOutputCrawlers), len(crawlers))
+        for crawler in parentOutputCrawlers:
+            self.assertNotIn('width', crawler.varNames())
+
+    def testStreamSubTaskHolders(self):
+        """
+        Test that sub task holders start working on the chunks already done by the parent task.
+        """
+        plateFilePaths = ['/tmp/plates/plate.{0}.exr'.format(1000 + x) for x in range(4)]
+        crawlers = list(map(FsPath.createFromPath, plateFilePaths))
+        chunks = {}
+        streamed = []
+        firstChunkEvents = {
+            'stream': threading.Event(),
+            'wholeStreamChild': threading.Event()
+        }
+        lock = threading.Lock()
+
+        def callback(task, event, crawlers):
+            name = task.option('name')
+            if event != 'begin':
+                return
+
+            with lock:
+                chunks.setdefault(name, []).append(len(crawlers))
+
+            if name in firstChunkEvents:
+                firstChunkEvents[name].set()
+
+            # the last chunk only proceeds once the sub task holder has received
+            # the first chunk, which can not happen without streaming
+            waitFor = {'parent': 'stream', 'wholeStream': 'wholeStreamChild'}.get(name)
+            if waitFor and crawlers[-1].var('filePath') == plateFilePaths[-1]:
+                streamed.append((name, firstChunkEvents[waitFor].wait(10)))
+        self.__registerCallbackTask('streamTest', callback)
+
+        taskHolder = self.__createTaskHolder('streamTest', 'parent', metadata={'dispatch.split': True})
+        taskHolder.addSubTaskHolder(
+            self.__createTaskHolder('streamTest', 'stream', metadata={'dispatch.split': True})
+        )
+        wholeTaskHolder = self.__createTaskHolder('streamTest', 'whole', metadata={'dispatch.split': False})
+        taskHolder.addSubTaskHolder(wholeTaskHolder)
+        taskHolder.addSubTaskHolder(
+            self.__createTaskHolder('streamTest', 'await', metadata={'dispatch.split': True, 'dispatch.await': True})
+        )
+
+        # the output of a task that can not be split is streamed to its sub task holders
+        wholeStreamTaskHolder = self.__createTaskHolder('streamTest', 'wholeStream', metadata={'dispatch.split': True})
+        wholeTaskHolder.addSubTaskHolder(wholeStreamTaskHolder)
+        wholeStreamTaskHolder.addSubTaskHolder(
+            self.__createTaskHolder('streamTest', 'wholeStreamChild', metadata={'dispatch.split': True})
+        )
+
+        result = taskHolder.run(crawlers, chunkSize=1)
+        self.assertEqual(len(result), len(crawlers) * 6)
+        self.assertEqual(
+            [x.var('filePath') for x in result[:len(crawlers)]],
+            [x.var('filePath') for x in crawlers]
+        )
+
+        self.assertEqual(sorted(streamed), [('parent', True), ('wholeStream', True)])
+        self.assertEqual(chunks['parent'], [1] * 4)
+        self.assertEqual(chunks['stream'], [1] * 4)
+        self.assertEqual(chunks['whole'], [4])
+        self.assertEqual(chunks['wholeStream'], [1] * 4)
+        self.assertEqual(chunks['wholeStreamChild'], [1] * 4)
+        self.assertEqual(chunks['await'], [4])
+
+    def testProcessPoolTaskHolder(self):
+        """
+        Test that tasks that can be split are performed in chunks by a pool of processes.
+        """
+        tempDir = tempfile.mkdtemp()
+        try:
+            crawlers = []
+            for index in range(7):
+                filePath = os.path.join(tempDir, 'source', 'file_{0}.txt'.format(index))
+                if not os.path.exists(os.path.dirname(filePath)):
+                    os.makedirs(os.path.dirname(filePath))
+                with open(filePath, 'w') as f:
+                    f.write(str(index))
+                crawlers.append(FsPath.createFromPath(filePath))
+
+            task = Task.create('copy')
+            task.setMetadata('dispatch.splitSize', 2)
+            taskHolder = TaskHolder(task, Template(os.path.join(tempDir, 'target', '{baseName}')))
+            taskHolder.addSubTaskHolder(
+                TaskHolder(Task.create('copy'), Template(os.path.join(tempDir, 'subTarget', '{baseName}')))
+            )
+
+            for chunkSize in (0, 3):
+                result = taskHolder.run(crawlers, chunkSize=chunkSize, processes=2)
+                self.assertEqual(
+                    [x.var('filePath') for x in result],
+                    [os.path.join(tempDir, 'target', x.var('baseName')) for x in crawlers] +
+                    [os.path.join(tempDir, 'subTarget', x.var('baseName')) for x in crawlers]
+                )
+
+                for crawler in result:
+                    with open(crawler.var('filePath')) as f:
+                        self.assertEqual(f.read(), crawler.var('name').split('_')[-1])
+        finally:
+            shutil.rmtree(tempDir)
+
+    def testIncrementalTaskHolder(self):
+        """
+        Test that the crawlers whose targets are up to date are skipped by the incremental execution.
+        """
+        executions = []
+
+        def callback(task, event, crawlers):
+            if event == 'begin':
+                executions.append((task.option('name'), len(crawlers)))
+                return
+
+            # output crawlers that differ from the ones created by the default implementation
+            for crawler in crawlers:
+                crawler.setVar('performedBy', task.option('name'))
+        self.__registerCallbackTask('incrementalTest', callback, Copy)
+
+        tempDir = tempfile.mkdtemp()
+        stateDirEnv = os.environ.get('CENTIPEDE_TASK_STATE_DIR')
+        os.environ['CENTIPEDE_TASK_STATE_DIR'] = os.path.join(tempDir, 'state')
+        try:
+            crawlers = []
+            for index in range(3):
+                filePath = os.path.join(tempDir, 'source', 'file_{0}.txt'.format(index))
+                if not os.path.exists(os.path.dirname(filePath)):
+                    os.makedirs(os.path.dirname(filePath))
+                with open(filePath, 'w') as f:
+                    f.write(str(index))
+                crawlers.append(FsPath.createFromPath(filePath))
+
+            taskHolders = []
+            for name, isSplittable in (('target', True), ('subTarget', False)):
+                taskHolders.append(
+                    self.__createTaskHolder(
+                        'incrementalTest',
+                        name,
+                        os.path.join(tempDir, name, '{baseName}'),
+                        {'dispatch.split': isSplittable}
+                    )
+                )
+            taskHolder = taskHolders[0]
+            taskHolder.addSubTaskHolder(taskHolders[1])
+
+            def run(incremental=True):
+                del executions[:]
+                result = taskHolder.run(crawlers, incremental=incremental)
+                self.assertEqual(
+                    sorted([(x.var('filePath'), x.var('performedBy')) for x in result]),
+                    sorted(
+                        [(os.path.join(tempDir, 'target', x.var('baseName')), 'target') for x in crawlers] +
+                        [(os.path.join(tempDir, 'subTarget', x.var('baseName')), 'subTarget') for x in crawlers]
+                    )
+                )
+                return dict(executions)
+
+            self.assertEqual(run(), {'target': 3, 'subTarget': 3})
+            self.assertEqual(run(), {})
+
+            # modified source
+            with open(crawlers[1].var('filePath'), 'w') as f:
+                f.write('modified')
+            self.assertEqual(run(), {'target': 1, 'subTarget': 3})
+            self.assertEqual(run(), {})
+
+            # removed target
+            os.remove(os.path.join(tempDir, 'target', crawlers[2].var('baseName')))
+            self.assertEqual(run(), {'target': 1})
+
+            # the incremental execution is opt-in
+            self.assertEqual(run(False), {'target': 3, 'subTarget': 3})
+            self.assertFalse(taskHolder.task().hasMetadata('output.incremental'))
+        finally:
+            if stateDirEnv is None:
+                del os.environ['CENTIPEDE_TASK_STATE_DIR']
+            else:
+                os.environ['CENTIPEDE_TASK_STATE_DIR'] = stateDirEnv
+            shutil.rmtree(tempDir)
+
+    def testTaskSplit(self):
+        """
+        Test that tasks are split in chunks only when they are splittable.
+        """
+        task = Task.create('copy')
+        for index in range(5):
+            crawler = FsPath.createFromPath('/tmp/plates/plate.{0}.exr'.format(1000 + index))
+            task.add(crawler, '/tmp/target/{0}'.format(crawler.var('baseName')))
+
+        # copy is splittable by default using chunks of 20 crawlers
+        self.assertEqual(task.split(2), [task])
+
+        task.setMetadata('dispatch.split', False)
+        self.assertEqual(task.split(2), [task])
+
+        task.setMetadata('dispatch.split', True)
+        task.setMetadata('dispatch.splitSize', 2)
+        chunkTasks = task.split(10)
+        self.assertEqual([len(x.crawlers()) for x in chunkTasks], [2, 2, 1])
+        self.assertEqual(sum([x.crawlers() for x in chunkTasks], []), task.crawlers())
+        for chunkTask in chunkTasks:
+            self.assertEqual(chunkTask.type(), 'copy')
+            for crawler in chunkTask.crawlers():
+                self.assertEqual(chunkTask.target(crawler), task.target(crawler))
+
+        task.setMetadata('dispatch.splitSize', 3)
+        self.assertEqual([len(x.crawlers()) for x in task.split(10)], [3, 2])
+
     def testTaskClone(self):
         """
         Test that cloning tasks works properly.
@@ -159,6 +512,38 @@ class TaskTest(BaseTestCase):
             self.assertEqual(dummyTask.templateOption('testOption', vars=vars), 'randomValue')
             self.assertEqual(dummyTask.templateOption('testExpr'), '2')
 
+    def testTaskOptionTemplate(self):
+        """
+        Test that impure procedures used by the options are resolved per crawler.
+        """
+        dummyTask = Task.create('copy')
+        dummyTask.setOption('testOption', '{testCustomVar}_a')
+        optionTemplate = dummyTask.optionTemplate('testOption')
+        self.assertIsInstance(optionTemplate, Template)
+        self.assertEqual(dummyTask.templateOption('testOption', vars={'testCustomVar': 'x'}), 'x_a')
+
+        dummyTask.setOption('testOption', '{testCustomVar}_b')
+        self.assertEqual(dummyTask.templateOption('testOption', vars={'testCustomVar': 'x'}), 'x_b')
+
+        calls = []
+
+        def impureProcedure():
+            calls.append(None)
+            return str(len(calls))
+
+        TemplateProcedure.register('impureTaskOptionTest', impureProcedure)
+        try:
+            dummyTask.setOption('testOption', '{baseName}_(impureTaskOptionTest)')
+            crawlers = [
+                FsPath.createFromPath('/tmp/plates/plate.{0}.exr'.format(1000 + x)) for x in range(2)
+            ]
+            self.assertEqual(
+                [dummyTask.templateOption('testOption', crawler=x) for x in crawlers],
+                ['plate.1000.exr_1', 'plate.1001.exr_2']
+            )
+        finally:
+            TemplateProcedure.unregister('impureTaskOptionTest')
+
     def testTaskOutput(self):
         """
         Test that task output is returned properly.
@@ -189,6 +574,28 @@ class TaskTest(BaseTestCase):
         for crawler in result:
             self.assertIn('contextVarTest', crawler.contextVarNames())
 
+    def testTaskOutputPathIndex(self):
+        """
+        Test that the paths written by a task are invalidated in the path index.
+        """
+        pathIndex = PathIndex.get()
+        refreshInterval = pathIndex.refreshInterval()
+        tempDir = tempfile.mkdtemp()
+        try:
+            pathIndex.setRefreshInterval(3600)
+            self.assertEqual(TemplateProcedure.run('findpath', 'test.exr', tempDir), '')
+
+            crawler = FsPath.createFromPath(os.path.join(BaseTestCase.dataDirectory(), 'test.exr'))
+            targetPath = os.path.join(tempDir, 'a', 'b', 'test.exr')
+            copyTask = Task.create('copy')
+            copyTask.add(crawler, targetPath)
+            copyTask.output()
+
+            self.assertEqual(TemplateProcedure.run('findpath', 'test.exr', tempDir), targetPath)
+        finally:
+            pathIndex.setRefreshInterval(refreshInterval)
+            shutil.rmtree(tempDir)
+
     def testTaskJson(self):
         """
         Test that you can convert a Task to json and back.
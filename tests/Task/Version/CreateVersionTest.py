@@ -0,0 +1,55 @@
+import unittest
+import os
+import shutil
+import tempfile
+from ...BaseTestCase import BaseTestCase
+from centipede.Task import Task
+from centipede.Crawler.Fs import FsPath
+
+class CreateVersionTest(BaseTestCase):
+    """Test CreateVersion task."""
+
+    def setUp(self):
+        """
+        Create a temporary directory containing a published version.
+        """
+        self.__dir = tempfile.mkdtemp()
+        self.__filePath = os.path.join(self.__dir, 'file.txt')
+        open(self.__filePath, 'w').close()
+        os.makedirs(os.path.join(self.__dir, 'config'))
+        os.makedirs(os.path.join(self.__dir, 'publish', 'v001'))
+
+    def tearDown(self):
+        """
+        Remove the temporary directory.
+        """
+        shutil.rmtree(self.__dir)
+
+    def testCreateVersionReserve(self):
+        """
+        Test that the version is reserved when the task is performed.
+        """
+        versionPath = os.path.join(self.__dir, 'publish', 'v002')
+        createVersionTasks = []
+        for index in range(2):
+            crawler = FsPath.createFromPath(self.__filePath)
+            crawler.setVar('configPath', os.path.join(self.__dir, 'config'))
+            createVersionTask = Task.create('createVersion')
+            createVersionTask.add(crawler, versionPath)
+            createVersionTasks.append(createVersionTask)
+
+        # both tasks target the same version, the second one gets the following
+        # version since the first one reserves it
+        for createVersionTask in createVersionTasks:
+            createVersionTask.output()
+
+        self.assertEqual([x.version() for x in createVersionTasks], [2, 3])
+        self.assertEqual(createVersionTasks[1].versionPath(), os.path.join(self.__dir, 'publish', 'v003'))
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.__dir, 'publish'))),
+            ['v001', 'v002', 'v003']
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1 @@
+from .CreateVersionTest import CreateVersionTest
@@ -1,5 +1,6 @@
 from . import Fs
 from . import Image
 from . import ImageSequence
+from . import Version
 from . import Video
 from .TaskTest import TaskTest
@@ -0,0 +1,105 @@
+import unittest
+from ..BaseTestCase import BaseTestCase
+from centipede.TemplateProcedure import TemplateProcedure
+
+class TemplateProcedureTest(BaseTestCase):
+    """Test TemplateProcedure."""
+
+    def setUp(self):
+        """
+        Start the tests with an empty cache.
+        """
+        TemplateProcedure.clearCache()
+
+    def testPureProcedureCache(self):
+        """
+        Test that the results of pure procedures are cached.
+        """
+        calls = []
+
+        def pureProcedure(value):
+            calls.append(value)
+            return value
+
+        TemplateProcedure.register('testPure', pureProcedure, isPure=True)
+        self.assertTrue(TemplateProcedure.isPure('testPure'))
+        self.assertEqual(TemplateProcedure.cacheStats()['size'], 0)
+
+        self.assertEqual(TemplateProcedure.run('testPure', 'a'), 'a')
+        self.assertEqual(TemplateProcedure.run('testPure', 'a'), 'a')
+        self.assertEqual(TemplateProcedure.parseRun('testPure b'), 'b')
+        self.assertEqual(TemplateProcedure.parseRun('testPure b'), 'b')
+        self.assertEqual(calls, ['a', 'b'])
+
+        cacheStats = TemplateProcedure.cacheStats()
+        self.assertEqual(cacheStats['hits'], 2)
+        self.assertEqual(cacheStats['misses'], 2)
+        self.assertEqual(cacheStats['size'], 2)
+
+    def testImpureProcedure(self):
+        """
+        Test that the results of procedures that are not pure are not cached.
+        """
+        calls = []
+
+        def impureProcedure(value):
+            calls.append(value)
+            return len(calls)
+
+        TemplateProcedure.register('testImpure', impureProcedure)
+        self.assertFalse(TemplateProcedure.isPure('testImpure'))
+        self.assertEqual(TemplateProcedure.run('testImpure', 'a'), '1')
+        self.assertEqual(TemplateProcedure.parseRun('testImpure a'), '2')
+        self.assertEqual(TemplateProcedure.cacheStats()['size'], 0)
+
+    def testProcedureRegistrationCache(self):
+        """
+        Test that registering a procedure only discards the results cached for it.
+        """
+        TemplateProcedure.register('testPure', lambda x: x, isPure=True)
+        TemplateProcedure.register('testPureOther', lambda x: None, isPure=True)
+        TemplateProcedure.run('testPure', 'a')
+        TemplateProcedure.parseRun('testPure b')
+        TemplateProcedure.run('testPureOther', 'a')
+        TemplateProcedure.run('testPureOther', 'a')
+        self.assertEqual(TemplateProcedure.run('testPureOther', 'a'), 'None')
+        self.assertEqual(TemplateProcedure.cacheStats()['size'], 3)
+
+        TemplateProcedure.register('testPure', lambda x: x + x, isPure=True)
+        cacheStats = TemplateProcedure.cacheStats()
+        self.assertEqual(cacheStats['size'], 1)
+        self.assertEqual(cacheStats['hits'], 2)
+        self.assertEqual(cacheStats['misses'], 3)
+        self.assertEqual(TemplateProcedure.run('testPure', 'a'), 'aa')
+        self.assertEqual(TemplateProcedure.parseRun('testPure b'), 'bb')
+
+        TemplateProcedure.unregister('testPureOther')
+        self.assertEqual(TemplateProcedure.cacheStats()['size'], 2)
+
+    def testProcedureCacheSize(self):
+        """
+        Test that the least recently used results are discarded from the cache.
+        """
+        maxSize = TemplateProcedure.cacheStats()['maxSize']
+        TemplateProcedure.register('testPure', lambda x: x, isPure=True)
+        TemplateProcedure.setCacheSize(2)
+        try:
+            TemplateProcedure.run('testPure', 'a')
+            TemplateProcedure.run('testPure', 'b')
+            TemplateProcedure.run('testPure', 'a')
+            TemplateProcedure.run('testPure', 'c')
+            self.assertEqual(TemplateProcedure.cacheStats()['size'], 2)
+
+            # "b" was the least recently used result
+            TemplateProcedure.run('testPure', 'a')
+            TemplateProcedure.run('testPure', 'b')
+            cacheStats = TemplateProcedure.cacheStats()
+            self.assertEqual(cacheStats['hits'], 2)
+            self.assertEqual(cacheStats['misses'], 4)
+        finally:
+            TemplateProcedure.setCacheSize(maxSize)
+            TemplateProcedure.clearCache()
+
+
+if __name__ == "__main__":
+    unittest.main()
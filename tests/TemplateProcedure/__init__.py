@@ -5,3 +5,4 @@ from .PathTest import PathTest
 from .SystemTest import SystemTest
 from .TextTest import TextTest
 from .VersionTest import VersionTest
+from .TemplateProcedureTest import TemplateProcedureTest
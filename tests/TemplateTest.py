@@ -1,4 +1,8 @@
 import os
+import sys
+import time
+import shutil
+import tempfile
 import unittest
 from .BaseTestCase import BaseTestCase
 from centipede.Template import Template
@@ -34,6 +38,39 @@ class TemplateTest(BaseTestCase):
         result = Template(value).value()
         self.assertEqual(result, os.path.join(BaseTestCase.dataDirectory(), 'glob'))
 
+    def testTemplateExistenceCache(self):
+        """
+        Test that the existence of the required paths is cached during a scope.
+        """
+        tempDirectory = tempfile.mkdtemp()
+        try:
+            os.mkdir(os.path.join(tempDirectory, 'shot'))
+            template = Template('{}/!{{shot}}/file.exr'.format(tempDirectory))
+
+            Template.beginExistenceCache()
+            try:
+                self.assertEqual(template.value({'shot': 'shot'}), os.path.join(tempDirectory, 'shot', 'file.exr'))
+                os.rmdir(os.path.join(tempDirectory, 'shot'))
+
+                # nested scopes share the same cache
+                Template.beginExistenceCache()
+                self.assertEqual(template.value({'shot': 'shot'}), os.path.join(tempDirectory, 'shot', 'file.exr'))
+                Template.endExistenceCache()
+                self.assertEqual(template.value({'shot': 'shot'}), os.path.join(tempDirectory, 'shot', 'file.exr'))
+
+                Template.invalidateExistenceCache(os.path.join(tempDirectory, 'shot'))
+                self.assertRaises(RequiredPathNotFoundError, template.value, {'shot': 'shot'})
+            finally:
+                Template.endExistenceCache()
+
+            # outside of the scope the paths are always checked
+            os.mkdir(os.path.join(tempDirectory, 'shot'))
+            self.assertEqual(template.value({'shot': 'shot'}), os.path.join(tempDirectory, 'shot', 'file.exr'))
+            os.rmdir(os.path.join(tempDirectory, 'shot'))
+            self.assertRaises(RequiredPathNotFoundError, template.value, {'shot': 'shot'})
+        finally:
+            shutil.rmtree(tempDirectory)
+
     def testTemplateVariable(self):
         """
         Test that you can pass variables to the template properly.
@@ -43,6 +80,146 @@ class TemplateTest(BaseTestCase):
         variables['var'] = 'test'
         self.assertEqual(Template('{var}').value(variables), 'test')
 
+    def testTemplateCompiled(self):
+        """
+        Test that the special tokens are only processed when they are part of the template.
+        """
+        template = Template('/tmp/{name}/(pad {frame} 4)')
+        self.assertCountEqual(template.varNames(), ['name', 'frame'])
+        self.assertEqual(template.value({'name': 'a(b)/!c<parent>', 'frame': 1}), '/tmp/a(b)/!c<parent>/0001')
+
+        template.setInputString('{prefix}/!glob')
+        self.assertEqual(template.varNames(), ['prefix'])
+        self.assertEqual(
+            template.value({'prefix': BaseTestCase.dataDirectory()}),
+            os.path.join(BaseTestCase.dataDirectory(), 'glob')
+        )
+
+    def testTemplateCompiledCache(self):
+        """
+        Test that templates created for the same string share the compiled template.
+        """
+        inputString = '/tmp/{shot}/(pad {frame} 4)/{shot}.exr'
+        template = Template(inputString)
+        self.assertEqual(template.varNames(), ['shot', 'frame'])
+
+        # the returned variable names can be modified without affecting other templates
+        template.varNames().append('other')
+        otherTemplate = Template(inputString)
+        self.assertEqual(otherTemplate.varNames(), ['shot', 'frame'])
+        self.assertEqual(
+            otherTemplate.value({'shot': 'AB_001', 'frame': 12}),
+            template.value({'shot': 'AB_001', 'frame': 12})
+        )
+
+        otherTemplate.setInputString('/tmp/{seq}.exr')
+        self.assertEqual(otherTemplate.varNames(), ['seq'])
+        self.assertEqual(otherTemplate.value({'seq': 'AB'}), '/tmp/AB.exr')
+        self.assertEqual(template.value({'shot': 'AB_001', 'frame': 12}), '/tmp/AB_001/0012/AB_001.exr')
+
+    def testTemplateValuesFromCrawlers(self):
+        """
+        Test that the template can be resolved for multiple crawlers at once.
+        """
+        crawlers = []
+        for frame in range(1, 4):
+            crawlers.append(FsPath.createFromPath(self.__file.replace('1001', str(1000 + frame))))
+
+        template = Template('{}/!glob/(basename {{filePath}})/{{name}}.(pad {{frame}} 6).{{ext}}'.format(BaseTestCase.dataDirectory()))
+        values = template.valuesFromCrawlers(crawlers)
+        self.assertEqual(values, list(map(template.valueFromCrawler, crawlers)))
+        self.assertEqual(
+            values[-1],
+            os.path.join(
+                BaseTestCase.dataDirectory(),
+                'glob',
+                'RND-TST-SHT_lighting_beauty_sr.1003.exr',
+                'RND-TST-SHT_lighting_beauty_sr.001003.exr'
+            )
+        )
+        self.assertEqual(
+            template.valuesFromCrawlers(crawlers, {'frame': 5}),
+            list(map(lambda x: template.valueFromCrawler(x, {'frame': 5}), crawlers))
+        )
+        self.assertEqual(template.valuesFromCrawlers([]), [])
+
+    def testTemplateCompiledCacheHit(self):
+        """
+        Test that templates created for the same string are compiled only once.
+        """
+        inputString = '/jobs/{job}/{seq}/{shot}/(pad {version} 3)/{name}.(pad {frame} 4).{ext}'
+        variables = {
+            'job': 'RND',
+            'seq': 'TST',
+            'shot': 'SHT',
+            'version': 3,
+            'name': 'plate',
+            'ext': 'exr'
+        }
+
+        Template.clearCompiledCache()
+        self.assertEqual(Template.compiledCacheSize(), 0)
+
+        templates = [Template(inputString) for index in range(100)]
+        self.assertEqual(Template.compiledCacheSize(), 1)
+
+        for index, template in enumerate(templates):
+            variables['frame'] = index
+            self.assertEqual(
+                template.value(variables),
+                '/jobs/RND/TST/SHT/003/plate.{0:04d}.exr'.format(index)
+            )
+        self.assertEqual(Template.compiledCacheSize(), 1)
+
+        template = Template('{job}')
+        self.assertEqual(Template.compiledCacheSize(), 2)
+        template.setInputString(inputString)
+        self.assertEqual(Template.compiledCacheSize(), 2)
+        self.assertEqual(template.varNames(), templates[0].varNames())
+
+    def testTemplateBenchmark(self):
+        """
+        Report the time used by the template evaluation (it does not assert the time).
+
+        The evaluations using the compiled template (100k) are compared against
+        evaluations that compile the template each time (the behavior before the
+        compiled templates), which are measured on a smaller number of evaluations.
+        Reference (python 3.11): ~6.0s re-parsing the template per evaluation,
+        ~0.9s using the compiled template (per 100k evaluations).
+        """
+        inputString = '/jobs/{job}/{seq}/{shot}/(pad {version} 3)/{name}.(pad {frame} 4).{ext}'
+        variables = {
+            'job': 'RND',
+            'seq': 'TST',
+            'shot': 'SHT',
+            'version': 3,
+            'name': 'plate',
+            'ext': 'exr'
+        }
+
+        template = Template(inputString)
+        startTime = time.time()
+        for index in range(100000):
+            variables['frame'] = index % 100
+            result = template.value(variables)
+        compiledTime = time.time() - startTime
+        self.assertEqual(result, '/jobs/RND/TST/SHT/003/plate.0099.exr')
+
+        startTime = time.time()
+        for index in range(10000):
+            variables['frame'] = index % 100
+            Template.clearCompiledCache()
+            result = Template(inputString).value(variables)
+        parsedTime = (time.time() - startTime) * 10
+        self.assertEqual(result, '/jobs/RND/TST/SHT/003/plate.0099.exr')
+
+        sys.stderr.write(
+            '\ntemplate evaluation (per 100k): {0:.2f}s re-parsing, {1:.2f}s compiled '.format(
+                parsedTime,
+                compiledTime
+            )
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,148 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from .BaseTestCase import BaseTestCase
+from centipede.Crawler.Fs import FsPath
+from centipede.Task import Task
+from centipede.Template import Template
+from centipede.TaskHolder import TaskHolder
+from centipede.Tracer import Tracer, TraceHook, ChromeTraceRecorder
+
+class TracerTest(BaseTestCase):
+    """Test Tracer."""
+
+    def setUp(self):
+        """
+        Create a temporary directory with the source files.
+        """
+        self.__dir = tempfile.mkdtemp()
+        self.__crawlers = []
+        for index in range(3):
+            filePath = os.path.join(self.__dir, 'source', 'file_{0}.txt'.format(index))
+            if not os.path.exists(os.path.dirname(filePath)):
+                os.makedirs(os.path.dirname(filePath))
+            with open(filePath, 'w') as f:
+                f.write('data')
+            self.__crawlers.append(FsPath.createFromPath(filePath))
+
+    def tearDown(self):
+        """
+        Remove the temporary directory.
+        """
+        for hook in Tracer.get().hooks():
+            Tracer.get().removeHook(hook)
+        shutil.rmtree(self.__dir)
+
+    def testTracerHooks(self):
+        """
+        Test that the hooks are called around the traced scopes.
+        """
+        calls = []
+
+        class CustomHook(TraceHook):
+            def begin(self, event):
+                calls.append(('begin', event['cat'], event['name']))
+
+            def end(self, event):
+                calls.append(('end', event['cat'], event['name'], event['args']))
+
+        tracer = Tracer.get()
+        with tracer.scope('test', 'disabled') as traceScope:
+            traceScope.setArg('value', 1)
+        self.assertFalse(tracer.isEnabled())
+
+        hook = CustomHook()
+        tracer.addHook(hook)
+        self.assertTrue(tracer.isEnabled())
+        with tracer.scope('test', 'outer', value=1):
+            with tracer.scope('test', 'inner') as traceScope:
+                traceScope.setArg('value', 2)
+
+        with self.assertRaises(ValueError):
+            with tracer.scope('test', 'error'):
+                raise ValueError('error')
+
+        tracer.removeHook(hook)
+        self.assertFalse(tracer.isEnabled())
+
+        self.assertEqual(
+            calls,
+            [
+                ('begin', 'test', 'outer'),
+                ('begin', 'test', 'inner'),
+                ('end', 'test', 'inner', {'value': 2}),
+                ('end', 'test', 'outer', {'value': 1}),
+                ('begin', 'test', 'error'),
+                ('end', 'test', 'error', {'error': 'ValueError'})
+            ]
+        )
+
+    def testChromeTraceRecorder(self):
+        """
+        Test that the execution of a task holder is recorded as chrome trace.
+        """
+        taskHolder = TaskHolder(Task.create('copy'), Template(os.path.join(self.__dir, 'target', '{baseName}')))
+        taskHolder.addSubTaskHolder(
+            TaskHolder(Task.create('copy'), Template(os.path.join(self.__dir, 'subTarget', '{baseName}')))
+        )
+
+        recorder = ChromeTraceRecorder(os.path.join(self.__dir, 'trace', 'trace.json'))
+        Tracer.get().addHook(recorder)
+        taskHolder.run(self.__crawlers)
+        Tracer.get().removeHook(recorder)
+
+        events = recorder.events()
+        self.assertEqual(
+            set(x['cat'] for x in events),
+            set(['taskHolder', 'addCrawlers', 'query', 'template', 'taskWrapper', 'task'])
+        )
+
+        taskEvents = [x for x in events if x['cat'] == 'task']
+        self.assertEqual(len(taskEvents), 2)
+        for taskEvent in taskEvents:
+            self.assertEqual(taskEvent['name'], 'copy')
+            self.assertEqual(taskEvent['ph'], 'X')
+            self.assertEqual(taskEvent['args']['crawlers'], 3)
+            self.assertEqual(taskEvent['args']['outputCrawlers'], 3)
+            self.assertEqual(taskEvent['args']['bytesWritten'], 12)
+            self.assertGreaterEqual(taskEvent['dur'], 0)
+
+        recorder.write()
+        with open(recorder.filePath()) as f:
+            self.assertEqual(len(json.load(f)['traceEvents']), len(events))
+
+        summary = recorder.summary()
+        self.assertIn('taskWrapper', summary)
+        self.assertIn('bytes written', summary)
+
+    def testRecordFromEnvironment(self):
+        """
+        Test that a recorder is only created when the trace file is defined in the environment.
+        """
+        traceFileEnv = os.environ.pop('CENTIPEDE_TRACE_FILE', None)
+        try:
+            self.assertIsNone(Tracer.get().recordFromEnvironment())
+
+            os.environ['CENTIPEDE_TRACE_FILE'] = os.path.join(self.__dir, 'trace_{pid}.json')
+            recorder = Tracer.get().recordFromEnvironment()
+            self.assertEqual(recorder.filePath(), os.path.join(self.__dir, 'trace_{0}.json'.format(os.getpid())))
+            self.assertIn(recorder, Tracer.get().hooks())
+
+            with Tracer.get().scope('test', 'environment'):
+                pass
+
+            with open(os.devnull, 'w') as stream:
+                Tracer.get().finishRecording(recorder, stream)
+            self.assertNotIn(recorder, Tracer.get().hooks())
+            self.assertTrue(os.path.exists(recorder.filePath()))
+        finally:
+            if traceFileEnv is None:
+                os.environ.pop('CENTIPEDE_TRACE_FILE', None)
+            else:
+                os.environ['CENTIPEDE_TRACE_FILE'] = traceFileEnv
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import shutil
+import tempfile
+import unittest
+from multiprocessing.pool import ThreadPool
+from .BaseTestCase import BaseTestCase
+from centipede.VersionIndex import VersionIndex
+
+class VersionIndexTest(BaseTestCase):
+    """Test VersionIndex."""
+
+    def setUp(self):
+        """
+        Create a temporary versions directory.
+        """
+        self.__dir = tempfile.mkdtemp()
+        for versionName in ('v001', 'v002', 'other'):
+            os.mkdir(os.path.join(self.__dir, versionName))
+
+        # making sure the directory is old enough to be cached
+        os.utime(self.__dir, (1000000000, 1000000000))
+
+    def tearDown(self):
+        """
+        Remove the temporary versions directory.
+        """
+        shutil.rmtree(self.__dir)
+
+    def testVersionIndexLatest(self):
+        """
+        Test that the latest version is cached until the directory is modified.
+        """
+        versionIndex = VersionIndex.get()
+        self.assertEqual(versionIndex.latest(self.__dir), 2)
+        self.assertEqual(versionIndex.new(self.__dir), 3)
+
+        # adding a version without changing the modification time of the
+        # directory, the cached version is still used
+        os.mkdir(os.path.join(self.__dir, 'v005'))
+        os.utime(self.__dir, (1000000000, 1000000000))
+        self.assertEqual(versionIndex.latest(self.__dir), 2)
+
+        # modified directories are listed again
+        os.utime(self.__dir, (1000000100, 1000000100))
+        self.assertEqual(versionIndex.latest(self.__dir), 5)
+        self.assertEqual(versionIndex.latest(os.path.join(self.__dir, 'missing')), 0)
+
+    def testVersionIndexReserve(self):
+        """
+        Test that concurrent reservations get distinct versions.
+        """
+        versionIndex = VersionIndex.get()
+        pool = ThreadPool(4)
+        try:
+            versions = pool.map(lambda x: versionIndex.reserve(self.__dir), range(8))
+        finally:
+            pool.close()
+            pool.join()
+
+        self.assertEqual(sorted(versions), list(range(3, 11)))
+        self.assertTrue(os.path.isdir(os.path.join(self.__dir, 'v010')))
+        self.assertEqual(versionIndex.latest(self.__dir), 10)
+
+        # reserving from a version that has been taken in the meantime
+        self.assertEqual(versionIndex.reserve(self.__dir, 12), 12)
+        self.assertEqual(versionIndex.reserve(self.__dir, 12), 13)
+
+        versionsPath = os.path.join(self.__dir, 'other', 'versions')
+        self.assertEqual(versionIndex.reserve(versionsPath), 1)
+        self.assertEqual(VersionIndex.versionName(versionIndex.latest(versionsPath)), 'v001')
+
+
+if __name__ == "__main__":
+    unittest.main()
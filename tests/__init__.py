@@ -1,5 +1,10 @@
 from .BaseTestCase import BaseTestCase
 from .TemplateTest import TemplateTest
+from .VersionIndexTest import VersionIndexTest
+from .PathIndexTest import PathIndexTest
+from .CrawlerMatcherTest import CrawlerMatcherTest
+from .CrawlerIndexTest import CrawlerIndexTest
+from .TracerTest import TracerTest
 from . import Crawler
 from . import TemplateProcedure
 from . import Task